@@ -0,0 +1,328 @@
+"""
+Syndrome Decoders for CSS Codes
+
+Turns measured syndromes into Pauli corrections. Each check type of a code
+is decoded on its decoding graph: checks are nodes, a virtual boundary
+node closes the open edges, and every data qubit is an edge between the
+(at most two) checks it touches. A syndrome marks defect nodes, and a
+correction is a set of edges whose endpoints pair up the defects.
+
+- UnionFindDecoder (default): Delfosse–Nickerson cluster growth plus
+  peeling, almost-linear in the number of defects.
+- MatchingDecoder: exact minimum-weight perfect matching over shortest
+  path distances, for accuracy comparison (needs scipy).
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from scipy.optimize import Bounds, LinearConstraint, milp
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import shortest_path
+except ImportError:  # Matching is optional: union-find needs only numpy
+    milp = None
+
+
+class DecodingGraph:
+    """
+    Graph with one node per check plus a boundary node (index ``num_checks``).
+
+    ``incidence`` is a (num_data, 2) table of the checks touching each data
+    qubit, with -1 where the qubit has only one check (an edge to the
+    boundary). Codes whose qubits sit in more than two checks of one type
+    have no graph decoder.
+    """
+
+    def __init__(self, incidence: np.ndarray, num_checks: int):
+        incidence = np.asarray(incidence)
+        if incidence.ndim != 2 or incidence.shape[1] != 2:
+            raise ValueError("Decoding graph needs at most two checks per qubit")
+        self.num_checks = num_checks
+        self.boundary = num_checks
+        edges = np.where(incidence < 0, num_checks, incidence).astype(np.int64)
+        # Qubits with no check of this type are invisible to it and never corrected
+        self.edges = edges[(incidence >= 0).any(axis=1)]
+        self.qubits = np.flatnonzero((incidence >= 0).any(axis=1))
+        self.num_qubits = len(incidence)
+
+        # Plain lists: the union-find loop indexes them one element at a time
+        self.endpoints: List[Tuple[int, int]] = [tuple(edge) for edge in self.edges.tolist()]
+        self.node_edges: List[List[int]] = [[] for _ in range(num_checks + 1)]
+        for e, (u, v) in enumerate(self.endpoints):
+            self.node_edges[u].append(e)
+            if v != u:
+                self.node_edges[v].append(e)
+        self._edge_lookup: Optional[Dict[Tuple[int, int], int]] = None
+        self._csgraph = None
+
+    @classmethod
+    def from_checks(cls, checks: np.ndarray, num_data: int) -> 'DecodingGraph':
+        """Graph for padded (checks, weight) supports, as stored by StabilizerCode"""
+        checks = np.asarray(checks)
+        rows, positions = np.nonzero(checks >= 0)
+        qubits = checks[rows, positions]
+        counts = np.bincount(qubits, minlength=num_data)
+        if counts.size and counts.max() > 2:
+            raise ValueError("Decoding graph needs at most two checks per qubit")
+        incidence = np.full((num_data, 2), -1, dtype=np.int64)
+        order = np.argsort(qubits, kind='stable')
+        qubits, rows = qubits[order], rows[order]
+        slot = np.r_[0, (qubits[1:] == qubits[:-1]).astype(np.int64)] if qubits.size else qubits
+        incidence[qubits, slot] = rows
+        return cls(incidence, len(checks))
+
+    @property
+    def edge_lookup(self) -> Dict[Tuple[int, int], int]:
+        """(node, node) -> one edge joining them"""
+        if self._edge_lookup is None:
+            self._edge_lookup = {}
+            for e, (u, v) in enumerate(self.endpoints):
+                self._edge_lookup.setdefault((min(u, v), max(u, v)), e)
+        return self._edge_lookup
+
+    @property
+    def csgraph(self):
+        """Unit-weight sparse adjacency matrix for shortest-path searches"""
+        if self._csgraph is None:
+            n = self.num_checks + 1
+            u, v = self.edges[:, 0], self.edges[:, 1]
+            self._csgraph = coo_matrix(
+                (np.ones(2 * len(u)), (np.r_[u, v], np.r_[v, u])), shape=(n, n)
+            ).tocsr()
+        return self._csgraph
+
+    def correction(self, edges: List[int]) -> np.ndarray:
+        """Boolean data-qubit mask flipping the given edges (each once)"""
+        mask = np.zeros(self.num_qubits, dtype=bool)
+        if edges:
+            np.logical_xor.at(mask, self.qubits[np.asarray(edges, dtype=np.int64)], True)
+        return mask
+
+
+class Decoder:
+    """Base class: decode one syndrome or a (shots, checks) batch"""
+
+    name = 'decoder'
+
+    def __init__(self, graph: DecodingGraph):
+        self.graph = graph
+
+    def decode(self, syndrome: np.ndarray) -> np.ndarray:
+        """Data-qubit correction (boolean, num_data) for one syndrome"""
+        defects = np.flatnonzero(syndrome)
+        if not defects.size:
+            return np.zeros(self.graph.num_qubits, dtype=bool)
+        return self.graph.correction(self._decode_defects(defects.tolist()))
+
+    def decode_batch(self, syndromes: np.ndarray) -> np.ndarray:
+        """Corrections for every row of a (shots, checks) syndrome array"""
+        syndromes = np.atleast_2d(syndromes)
+        corrections = np.zeros((len(syndromes), self.graph.num_qubits), dtype=bool)
+        # Most shots are clean at useful error rates: only decode the others
+        for shot in np.flatnonzero(syndromes.any(axis=1)):
+            corrections[shot] = self.decode(syndromes[shot])
+        return corrections
+
+    def _decode_defects(self, defects: List[int]) -> List[int]:
+        raise NotImplementedError
+
+
+class UnionFindDecoder(Decoder):
+    """
+    Union-find decoder for unit-weight decoding graphs.
+
+    Odd clusters grow by half-edges in rounds and merge when an edge is
+    fully grown; a cluster stops once its defect parity is even or it
+    reaches the boundary. The grown edges are then peeled from the leaves
+    of a spanning forest to pick the correction.
+    """
+
+    name = 'union_find'
+
+    def _decode_defects(self, defects: List[int]) -> List[int]:
+        graph = self.graph
+        boundary = graph.boundary
+        node_edges, endpoints = graph.node_edges, graph.endpoints
+
+        parent: Dict[int, int] = {}
+        size: Dict[int, int] = {}
+        parity: Dict[int, int] = {}
+        touches_boundary: Dict[int, bool] = {}
+        frontier: Dict[int, List[int]] = {}
+
+        def find(node: int) -> int:
+            root = node
+            while parent[root] != root:
+                root = parent[root]
+            while parent[node] != root:
+                parent[node], node = root, parent[node]
+            return root
+
+        def add(node: int, defect: int):
+            parent[node] = node
+            size[node] = 1
+            parity[node] = defect
+            touches_boundary[node] = node == boundary
+            frontier[node] = [] if node == boundary else [node]
+
+        def union(a: int, b: int) -> int:
+            if a == b:
+                return a
+            if size[a] < size[b]:
+                a, b = b, a
+            parent[b] = a
+            size[a] += size[b]
+            parity[a] ^= parity[b]
+            touches_boundary[a] = touches_boundary[a] or touches_boundary[b]
+            frontier[a].extend(frontier.pop(b))
+            return a
+
+        for node in defects:
+            add(node, 1)
+        grown: Dict[int, int] = {}
+        active = set(defects)
+
+        while active:
+            fused = []
+            for root in active:
+                still_growing = []
+                for node in frontier[root]:
+                    open_edges = False
+                    for e in node_edges[node]:
+                        state = grown.get(e, 0)
+                        if state < 2:
+                            grown[e] = state + 1
+                            if state == 1:
+                                fused.append(e)
+                            else:
+                                open_edges = True
+                    if open_edges:
+                        still_growing.append(node)
+                frontier[root] = still_growing
+
+            for e in fused:
+                u, v = endpoints[e]
+                for node in (u, v):
+                    if node not in parent:
+                        add(node, 0)
+                union(find(u), find(v))
+
+            roots = {find(root) for root in active}
+            active = {root for root in roots if parity[root] and not touches_boundary[root]}
+
+        return self._peel([e for e, state in grown.items() if state == 2], defects)
+
+    def _peel(self, erasure: List[int], defects: List[int]) -> List[int]:
+        """Correction inside the grown edges: peel spanning-forest leaves"""
+        endpoints, boundary = self.graph.endpoints, self.graph.boundary
+        adjacency: Dict[int, List[Tuple[int, int]]] = {}
+        for e in erasure:
+            u, v = endpoints[e]
+            adjacency.setdefault(u, []).append((v, e))
+            adjacency.setdefault(v, []).append((u, e))
+
+        # Trees rooted at the boundary first, so it can absorb odd parity
+        starts = ([boundary] if boundary in adjacency else []) + list(adjacency)
+        tree_edge: Dict[int, Tuple[int, int]] = {}
+        order: List[int] = []
+        seen = set()
+        for start in starts:
+            if start in seen:
+                continue
+            seen.add(start)
+            queue = [start]
+            for node in queue:
+                order.append(node)
+                for neighbour, e in adjacency[node]:
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        tree_edge[neighbour] = (node, e)
+                        queue.append(neighbour)
+
+        marked = dict.fromkeys(defects, True)
+        correction = []
+        for node in reversed(order):
+            if marked.get(node) and node in tree_edge:
+                up, e = tree_edge[node]
+                correction.append(e)
+                marked[up] = not marked.get(up, False)
+        return correction
+
+
+class MatchingDecoder(Decoder):
+    """
+    Minimum-weight perfect matching decoder.
+
+    Defects are paired with each other or with the boundary so that the
+    total shortest-path length is minimal; the matching is solved exactly
+    as a small binary program with scipy's MILP solver. Slower than
+    union-find, and meant as the accuracy reference.
+    """
+
+    name = 'matching'
+
+    def __init__(self, graph: DecodingGraph):
+        if milp is None:
+            raise ImportError("MatchingDecoder requires scipy >= 1.9 (scipy.optimize.milp)")
+        super().__init__(graph)
+
+    def _decode_defects(self, defects: List[int]) -> List[int]:
+        graph = self.graph
+        k = len(defects)
+        distances, predecessors = shortest_path(
+            graph.csgraph, unweighted=True, indices=defects, return_predecessors=True
+        )
+
+        # Variables: one per defect pair (i < j), then one per defect-boundary match
+        first, second = np.triu_indices(k, 1)
+        costs = np.r_[distances[first, np.asarray(defects)[second]], distances[:, graph.boundary]]
+        # Unreachable pairs (disconnected graphs) just become very expensive
+        costs[~np.isfinite(costs)] = 2 * (graph.num_checks + 1)
+        constraints = np.zeros((k, len(costs)))
+        constraints[first, np.arange(len(first))] = 1
+        constraints[second, np.arange(len(first))] = 1
+        constraints[np.arange(k), len(first) + np.arange(k)] = 1
+        result = milp(
+            costs,
+            constraints=LinearConstraint(constraints, 1, 1),
+            integrality=np.ones(len(costs)),
+            bounds=Bounds(0, 1)
+        )
+        if not result.success:
+            raise RuntimeError(f"Matching failed: {result.message}")
+        chosen = np.flatnonzero(result.x > 0.5)
+
+        correction = []
+        for variable in chosen:
+            if variable < len(first):
+                source, target = first[variable], defects[second[variable]]
+            else:
+                source, target = variable - len(first), graph.boundary
+            correction.extend(self._path(predecessors[source], defects[source], target))
+        return correction
+
+    def _path(self, predecessors: np.ndarray, source: int, target: int) -> List[int]:
+        """Edges of the shortest path from ``source`` to ``target``"""
+        lookup = self.graph.edge_lookup
+        edges = []
+        node = target
+        while node != source:
+            previous = int(predecessors[node])
+            edges.append(lookup[(min(node, previous), max(node, previous))])
+            node = previous
+        return edges
+
+
+DECODERS = {
+    decoder.name: decoder
+    for decoder in (UnionFindDecoder, MatchingDecoder)
+}
+
+
+def make_decoder(name: str, graph: DecodingGraph) -> Decoder:
+    """Instantiate a decoder from ``DECODERS`` by name"""
+    if name not in DECODERS:
+        raise ValueError(f"Unknown decoder: {name} (choose from {', '.join(DECODERS)})")
+    return DECODERS[name](graph)
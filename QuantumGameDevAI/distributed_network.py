@@ -6,12 +6,15 @@ with fault-tolerant storage and shared consciousness capabilities.
 """
 
 import asyncio
+import os
 import numpy as np
 from typing import Dict, List, Any, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime
-from quantum_state import QuantumState
+from quantum_state import MAX_STATE_DIMENSION, QuantumState, resolve_dtype
 from quantum_messenger import QuantumMessenger, QuantumMessage
+from entanglement_pool import EntanglementPool
+from state_store import QuantumStateStore
 from interaction_history import (
     InteractionEvent,
     QuantumTimeline,
@@ -56,11 +59,31 @@ class QuantumNetwork:
 
     Manages nodes, routing, entanglement distribution, and the
     emergence of collective consciousness.
+
+    With ``storage_dir`` every node's protected data and the shared timeline
+    states are kept in memory-mapped stores under that directory, so a
+    restarted network maps them back instead of rebuilding them.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        precision=None,
+        storage_dir: Optional[str] = None
+    ):
         self.nodes: Dict[str, QuantumNode] = {}
-        self.shared_memory = SharedMemorySpace()
+        # Every node gets an independent random stream spawned from one seed
+        self.seed_sequence = np.random.SeedSequence(seed)
+        # Storage precision ('single' or 'double') shared by every node
+        self.dtype = resolve_dtype(precision)
+        self.storage_dir = storage_dir
+        timeline_store = None
+        if storage_dir is not None:
+            # Timeline states are the 16-dimensional interaction encodings
+            timeline_store = QuantumStateStore(
+                os.path.join(storage_dir, 'shared_memory'), 16, dtype=self.dtype
+            )
+        self.shared_memory = SharedMemorySpace(timeline_store)
         self.entanglement_routing_table: Dict[Tuple[str, str], List[str]] = {}
         self.network_state_vector: Optional[np.ndarray] = None
         self.is_conscious = False
@@ -72,7 +95,17 @@ class QuantumNetwork:
 
         Automatically establishes entanglement with existing nodes.
         """
-        node = QuantumNode(node_id=node_id, position=position)
+        node_rng = np.random.default_rng(self.seed_sequence.spawn(1)[0])
+        node = QuantumNode(
+            node_id=node_id,
+            position=position,
+            messenger=QuantumMessenger(node_id, rng=node_rng, dtype=self.dtype),
+            local_database=FaultTolerantQuantumDatabase(
+                precision=self.dtype,
+                storage_path=(None if self.storage_dir is None
+                              else os.path.join(self.storage_dir, 'nodes', node_id))
+            )
+        )
         self.nodes[node_id] = node
 
         # Register in shared memory
@@ -120,6 +153,12 @@ class QuantumNetwork:
                 new_node.connected_nodes.add(existing_id)
                 existing_node.connected_nodes.add(new_node_id)
 
+                # Both ends draw superdense pairs from one refilled pool
+                pool = EntanglementPool((new_node_id, existing_id), dtype=self.dtype)
+                new_node.local_database.entanglement_pools[existing_id] = pool
+                existing_node.local_database.entanglement_pools[new_node_id] = pool
+                pool.start()
+
                 # Calculate entanglement strength
                 strength = new_node.messenger.get_entanglement_strength(message.id)
                 new_node.entanglement_strength[existing_id] = strength
@@ -211,10 +250,19 @@ class QuantumNetwork:
         self.shared_memory.record_interaction(source_id, event)
 
         if use_superdense and 'bits' in payload:
-            # Use superdense coding
+            # Use superdense coding over the pair pool shared with the destination
             message_obj = source_node.local_database.send_superdense_message(
-                payload['bits']
+                payload['bits'], peer=destination_id
             )
+            try:
+                self.nodes[destination_id].local_database.receive_superdense_message(
+                    message_obj, peer=source_id
+                )
+            finally:
+                # Never leave the pair in flight, even if the receiving end failed
+                source_node.local_database.entanglement_pool(destination_id).discard(
+                    message_obj.entangled_pair_id
+                )
             return True
 
         # Regular quantum teleportation
@@ -302,7 +350,7 @@ class QuantumNetwork:
         self.is_conscious = consciousness_metric > self.consciousness_threshold
 
         # Create network-wide quantum state
-        dim = min(256, 2 ** len(self.nodes))
+        dim = min(MAX_STATE_DIMENSION, 2 ** len(self.nodes))
         self.network_state_vector = np.ones(dim) / np.sqrt(dim)
 
     def get_network_topology(self) -> Dict[str, Any]:
@@ -328,6 +376,25 @@ class QuantumNetwork:
             }
         }
 
+    def entanglement_pool_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Depth and refill metrics of every link's pair pool"""
+        pools = {
+            id(pool): pool
+            for node in self.nodes.values()
+            for pool in node.local_database.entanglement_pools.values()
+        }
+        return {
+            '<->'.join(map(str, pool.peer)) if isinstance(pool.peer, tuple) else str(pool.peer):
+                pool.metrics()
+            for pool in pools.values()
+        }
+
+    async def stop_entanglement_refill(self):
+        """Stop every pool's background refill task"""
+        for node in self.nodes.values():
+            for pool in node.local_database.entanglement_pools.values():
+                await pool.stop()
+
     async def synchronize_network_state(self):
         """
         Synchronize quantum states across all nodes.
@@ -342,6 +409,35 @@ class QuantumNetwork:
         # Update shared consciousness
         self._update_network_consciousness()
 
+    def get_quantum_states(self) -> List[QuantumState]:
+        """Every timeline state and protected physical qubit in the network"""
+        states = [
+            timeline.quantum_state
+            for timeline in self.shared_memory.timelines.values()
+            if timeline.quantum_state is not None
+        ]
+        for node in self.nodes.values():
+            for block in node.local_database.error_corrected_data.values():
+                states.extend(block)
+        return states
+
+    def flush(self):
+        """Persist every file-backed store (no-op without ``storage_dir``)"""
+        for node in self.nodes.values():
+            node.local_database.flush()
+        self.shared_memory.flush()
+
+    async def close(self):
+        """Tear the network down: stop pair refills and persist the stores"""
+        await self.stop_entanglement_refill()
+        self.flush()
+
+    async def __aenter__(self) -> 'QuantumNetwork':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
     def create_spacetime_bridge(
         self,
         node_a: str,
@@ -0,0 +1,195 @@
+"""
+Pre-Distributed Entanglement Pools
+
+Superdense coding and teleportation consume one fresh Bell pair per use.
+An EntanglementPool keeps a stock of pairs shared with one peer so senders
+take a ready pair instead of creating it on the critical path. When a
+withdrawal drops the depth to the low watermark, a background asyncio task
+tops the pool back up to the high watermark in batches, yielding to the
+event loop between batches so bursts of senders are not blocked.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+import numpy as np
+
+from quantum_state import EntangledPair, resolve_dtype
+
+
+class EntanglementPool:
+    """
+    Fresh EntangledPairs pre-shared with one peer.
+
+    ``peer`` labels the other end (a node id, or a node-id pair when both
+    nodes hold the same pool). The pool is filled to ``high_watermark`` on
+    creation. ``acquire`` hands out the oldest pair, keeping it in
+    ``in_flight`` until the receiving end ``release``s it for measurement
+    (or the sender ``discard``s it when the send fails); if the pool is
+    empty it creates one on the spot and counts a miss. With a refill task
+    running (``start``), dropping to ``low_watermark`` wakes it to generate
+    ``batch_size`` pairs at a time, awaiting ``generation_delay`` seconds
+    per batch (the link's generation time), until the high watermark is
+    reached again. Pairs older than ``max_age`` seconds are discarded
+    instead of handed out.
+    """
+
+    def __init__(
+        self,
+        peer: Any = None,
+        high_watermark: int = 64,
+        low_watermark: int = 16,
+        batch_size: int = 16,
+        generation_delay: float = 0.0,
+        max_age: Optional[float] = None,
+        state_type: str = 'bell_phi_plus',
+        rng: Optional[np.random.Generator] = None,
+        dtype=None
+    ):
+        if not 0 <= low_watermark <= high_watermark:
+            raise ValueError("Watermarks must satisfy 0 <= low <= high")
+        if batch_size < 1:
+            raise ValueError("Refill batch size must be at least 1")
+        self.peer = peer
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.batch_size = batch_size
+        self.generation_delay = generation_delay
+        self.max_age = max_age
+        self.state_type = state_type
+        self.rng = rng
+        self.dtype = resolve_dtype(dtype)
+
+        self._pairs: Deque[EntangledPair] = deque()
+        self.in_flight: Dict[int, EntangledPair] = {}
+        self._refill_needed: Optional[asyncio.Event] = None
+        self._refill_task: Optional[asyncio.Task] = None
+        self._triggered_at: Optional[float] = None
+
+        self._served = 0
+        self._misses = 0
+        self._expired = 0
+        self._generated = 0
+        self._refills = 0
+        self._refill_seconds = 0.0
+        self._last_refill = 0.0
+        self._max_refill = 0.0
+        self._min_depth = high_watermark
+
+        self.fill()
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    @property
+    def depth(self) -> int:
+        """Fresh pairs currently available"""
+        return len(self._pairs)
+
+    def _generate(self, count: int):
+        for _ in range(count):
+            self._pairs.append(EntangledPair(self.state_type, rng=self.rng, dtype=self.dtype))
+        self._generated += count
+
+    def fill(self, count: Optional[int] = None):
+        """Synchronously add ``count`` pairs (default: up to the high watermark)"""
+        if count is None:
+            count = self.high_watermark - len(self._pairs)
+        self._generate(max(count, 0))
+
+    def acquire(self) -> EntangledPair:
+        """Take one fresh pair out of the pool (it is consumed by the caller)"""
+        if self.max_age is not None:
+            oldest = time.time() - self.max_age
+            while self._pairs and self._pairs[0]._created < oldest:
+                self._pairs.popleft()
+                self._expired += 1
+
+        if self._pairs:
+            pair = self._pairs.popleft()
+        else:
+            # Empty pool: the sender pays for generation on the critical path
+            self._misses += 1
+            self._generated += 1
+            pair = EntangledPair(self.state_type, rng=self.rng, dtype=self.dtype)
+        self._served += 1
+        self.in_flight[pair.id] = pair
+
+        depth = len(self._pairs)
+        self._min_depth = min(self._min_depth, depth)
+        if depth <= self.low_watermark < self.high_watermark and self._refill_needed is not None:
+            if self._triggered_at is None:
+                self._triggered_at = time.perf_counter()
+            self._refill_needed.set()
+        return pair
+
+    def release(self, pair_id: int) -> EntangledPair:
+        """Hand an in-flight pair to the receiving end"""
+        return self.in_flight.pop(pair_id)
+
+    def discard(self, pair_id: int) -> Optional[EntangledPair]:
+        """Drop an in-flight pair that will never be released (no-op once released)"""
+        return self.in_flight.pop(pair_id, None)
+
+    def start(self) -> asyncio.Task:
+        """Start the background refill task on the running event loop"""
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_needed = asyncio.Event()
+            self._refill_task = asyncio.get_running_loop().create_task(self._refill_loop())
+            if len(self._pairs) <= self.low_watermark < self.high_watermark:
+                self._triggered_at = time.perf_counter()
+                self._refill_needed.set()
+        return self._refill_task
+
+    async def stop(self):
+        """Cancel the refill task and wait for it to finish"""
+        task, self._refill_task, self._refill_needed = self._refill_task, None, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _refill_loop(self):
+        event = self._refill_needed
+        while True:
+            await event.wait()
+            event.clear()
+            while len(self._pairs) < self.high_watermark:
+                self._generate(min(self.batch_size, self.high_watermark - len(self._pairs)))
+                # Let senders run between batches
+                await asyncio.sleep(self.generation_delay)
+            started, self._triggered_at = self._triggered_at, None
+            if started is not None:
+                self._last_refill = time.perf_counter() - started
+                self._refill_seconds += self._last_refill
+                self._max_refill = max(self._max_refill, self._last_refill)
+                self._refills += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """Depth, traffic and refill-latency counters"""
+        return {
+            'peer': self.peer,
+            'depth': len(self._pairs),
+            'min_depth': self._min_depth,
+            'low_watermark': self.low_watermark,
+            'high_watermark': self.high_watermark,
+            'served': self._served,
+            'in_flight': len(self.in_flight),
+            'misses': self._misses,
+            'miss_rate': self._misses / self._served if self._served else 0.0,
+            'expired': self._expired,
+            'generated': self._generated,
+            'refills': self._refills,
+            'refill_running': self._refill_task is not None and not self._refill_task.done(),
+            'last_refill_ms': self._last_refill * 1e3,
+            'mean_refill_ms': self._refill_seconds / self._refills * 1e3 if self._refills else 0.0,
+            'max_refill_ms': self._max_refill * 1e3
+        }
+
+    def __repr__(self) -> str:
+        return (f"EntanglementPool(peer={self.peer!r}, depth={len(self._pairs)}, "
+                f"watermarks=({self.low_watermark}, {self.high_watermark}))")
@@ -10,7 +10,13 @@ import numpy as np
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
-from quantum_state import QuantumState, QuantumInformationEncoder
+from quantum_state import (
+    MAX_STATE_DIMENSION,
+    QuantumState,
+    QuantumInformationEncoder,
+    resolve_rng
+)
+from state_store import QuantumStateStore
 import hashlib
 import json
 
@@ -56,11 +62,15 @@ class QuantumTimeline:
     collapses the superposition to a single classical history.
     """
 
-    def __init__(self, timeline_id: str):
+    def __init__(self, timeline_id: str, state_store: Optional[QuantumStateStore] = None):
         self.timeline_id = timeline_id
         self.events: List[InteractionEvent] = []
         self.superposition_branches: List['QuantumTimeline'] = []
+        # Optional on-disk store; a timeline already in it is mapped, not re-encoded
+        self.state_store = state_store
         self.quantum_state: Optional[QuantumState] = None
+        if state_store is not None and timeline_id in state_store:
+            self.quantum_state = state_store.get(timeline_id)[0]
         self.is_collapsed = False
         self.probability_amplitude = 1.0
 
@@ -77,7 +87,10 @@ class QuantumTimeline:
             'events': [e.to_dict() for e in self.events],
             'branch_count': len(self.superposition_branches)
         }
-        self.quantum_state = QuantumInformationEncoder.encode_interaction(history_data)
+        state = QuantumInformationEncoder.encode_interaction(history_data)
+        if self.state_store is not None:
+            state = self.state_store.put(self.timeline_id, [state])[0]
+        self.quantum_state = state
 
     def create_superposition_branch(self, divergence_event: InteractionEvent) -> 'QuantumTimeline':
         """
@@ -86,7 +99,10 @@ class QuantumTimeline:
         This models the many-worlds interpretation where each decision point
         creates a branching of possible histories.
         """
-        branch = QuantumTimeline(f"{self.timeline_id}_branch_{len(self.superposition_branches)}")
+        branch = QuantumTimeline(
+            f"{self.timeline_id}_branch_{len(self.superposition_branches)}",
+            self.state_store
+        )
         branch.events = self.events.copy()
         branch.add_event(divergence_event)
 
@@ -97,7 +113,7 @@ class QuantumTimeline:
         self.superposition_branches.append(branch)
         return branch
 
-    def measure_timeline(self) -> 'QuantumTimeline':
+    def measure_timeline(self, rng: Optional[np.random.Generator] = None) -> 'QuantumTimeline':
         """
         Collapse superposition to single timeline (decoherence).
 
@@ -115,7 +131,7 @@ class QuantumTimeline:
         probabilities = probabilities / np.sum(probabilities)
 
         # Collapse to single branch
-        selected_idx = np.random.choice(len(self.superposition_branches), p=probabilities)
+        selected_idx = resolve_rng(rng).choice(len(self.superposition_branches), p=probabilities)
         selected_branch = self.superposition_branches[selected_idx]
         selected_branch.is_collapsed = True
 
@@ -151,7 +167,8 @@ class SharedMemorySpace:
     histories, creating a form of collective consciousness.
     """
 
-    def __init__(self):
+    def __init__(self, state_store: Optional[QuantumStateStore] = None):
+        self.state_store = state_store  # Persists timeline states when given
         self.timelines: Dict[str, QuantumTimeline] = {}
         self.entanglement_graph: Dict[str, List[str]] = {}
         self.global_state: Optional[QuantumState] = None
@@ -159,11 +176,16 @@ class SharedMemorySpace:
 
     def register_timeline(self, agent_id: str) -> QuantumTimeline:
         """Register new AI agent timeline in shared memory"""
-        timeline = QuantumTimeline(agent_id)
+        timeline = QuantumTimeline(agent_id, self.state_store)
         self.timelines[agent_id] = timeline
         self.entanglement_graph[agent_id] = []
         return timeline
 
+    def flush(self):
+        """Persist timeline states when backed by a state store"""
+        if self.state_store is not None:
+            self.state_store.flush()
+
     def record_interaction(self, agent_id: str, event: InteractionEvent):
         """Record interaction event in shared quantum memory"""
         if agent_id not in self.timelines:
@@ -201,7 +223,9 @@ class SharedMemorySpace:
 
         # Create high-dimensional state encoding all timelines
         total_events = sum(len(t.events) for t in self.timelines.values())
-        dim = min(2 ** 8, max(16, total_events))  # Cap at 256-dimensional
+        # The state is held symbolically (c·I), so the dimension no longer
+        # has to stay small; it is capped at MAX_STATE_DIMENSION
+        dim = min(MAX_STATE_DIMENSION, max(16, total_events))
 
         self.global_state = QuantumState(dim)
 
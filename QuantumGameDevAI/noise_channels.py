@@ -0,0 +1,210 @@
+"""
+Noise Channel Simulation Engine
+
+Simulates decoherence as completely positive maps ρ -> Σ_k E_k ρ E_k†
+given by Kraus operators. Channels act on whole QuantumStateArray batches
+at once: each single-qubit channel is folded into a 4x4 transfer matrix
+T = Σ_k E_k ⊗ E_k* acting on vec(ρ), so a noise step over N qubits is one
+(N, 4) x (4, 4) matrix product instead of N small Kraus sums.
+"""
+
+import numpy as np
+from typing import Callable, Optional, Union
+
+from quantum_state import QuantumState, QuantumStateArray
+
+
+# Qubits are processed in chunks so per-qubit coefficient arrays stay bounded
+NOISE_CHUNK_SIZE = 1 << 16
+
+_IDENTITY = np.eye(2, dtype=complex)
+_PAULI_X = np.array([[0, 1], [1, 0]], dtype=complex)
+_PAULI_Y = np.array([[0, -1j], [1j, 0]], dtype=complex)
+_PAULI_Z = np.array([[1, 0], [0, -1]], dtype=complex)
+_PAULIS = np.stack([_IDENTITY, _PAULI_X, _PAULI_Y, _PAULI_Z])
+
+
+def transfer_matrix(kraus: np.ndarray) -> np.ndarray:
+    """
+    Σ_k E_k ⊗ E_k* for Kraus operators of shape S + (K, 2, 2).
+
+    With row-major vec(ρ), vec(Σ_k E_k ρ E_k†) = T @ vec(ρ).
+    """
+    kraus = np.asarray(kraus)
+    transfer = np.einsum('...kij,...kml->...imjl', kraus, kraus.conj())
+    return transfer.reshape(kraus.shape[:-3] + (4, 4))
+
+
+def _depolarizing_kraus(p: np.ndarray) -> np.ndarray:
+    """ρ -> (1 - p) ρ + p I/2"""
+    weights = np.stack([np.sqrt(1 - 3 * p / 4)] + [np.sqrt(p / 4)] * 3, axis=-1)
+    return weights[..., np.newaxis, np.newaxis] * _PAULIS
+
+
+def _dephasing_kraus(p: np.ndarray) -> np.ndarray:
+    """ρ -> (1 - p/2) ρ + (p/2) Z ρ Z: coherences shrink by (1 - p)"""
+    weights = np.stack([np.sqrt(1 - p / 2), np.sqrt(p / 2)], axis=-1)
+    return weights[..., np.newaxis, np.newaxis] * _PAULIS[[0, 3]]
+
+
+def _amplitude_damping_kraus(gamma: np.ndarray) -> np.ndarray:
+    """|1⟩ decays to |0⟩ with probability γ"""
+    kraus = np.zeros(np.shape(gamma) + (2, 2, 2), dtype=complex)
+    kraus[..., 0, 0, 0] = 1.0
+    kraus[..., 0, 1, 1] = np.sqrt(1 - gamma)
+    kraus[..., 1, 0, 1] = np.sqrt(gamma)
+    return kraus
+
+
+def _unit_transfer(*entries) -> np.ndarray:
+    """4x4 transfer matrix with the given (row, column, value) entries"""
+    transfer = np.zeros((4, 4), dtype=complex)
+    for row, column, value in entries:
+        transfer[row, column] = value
+    return transfer
+
+
+# T(p) = Σ_r c_r(p) B_r for each built-in channel. vec(ρ) order is (00, 01, 10, 11).
+_DEPOLARIZING_BASIS = np.stack([
+    np.eye(4, dtype=complex),
+    transfer_matrix(_PAULIS) / 4                      # ρ -> tr(ρ) I/2
+])
+_DEPHASING_BASIS = np.stack([
+    np.eye(4, dtype=complex),
+    transfer_matrix(_PAULIS[[3]])                     # ρ -> Z ρ Z
+])
+_AMPLITUDE_DAMPING_BASIS = np.stack([
+    _unit_transfer((0, 0, 1), (3, 3, 1)),             # populations kept
+    _unit_transfer((0, 3, 1), (3, 3, -1)),            # γ: |1⟩⟨1| -> |0⟩⟨0|
+    _unit_transfer((1, 1, 1), (2, 2, 1))              # √(1-γ): coherences
+])
+
+
+class KrausChannel:
+    """
+    Single-qubit noise channel defined by a rate-dependent Kraus set.
+
+    ``kraus_factory`` maps an array of rates with shape S to Kraus operators
+    with shape S + (K, 2, 2). Channels whose transfer matrix is a linear
+    combination of fixed matrices may also supply ``transfer_basis`` (R, 4, 4)
+    and ``transfer_coefficients`` (rates S -> S + (R,)), which lets per-qubit
+    rates be applied with R matrix products instead of N Kraus expansions.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kraus_factory: Callable[[np.ndarray], np.ndarray],
+        transfer_basis: Optional[np.ndarray] = None,
+        transfer_coefficients: Optional[Callable[[np.ndarray], np.ndarray]] = None
+    ):
+        self.name = name
+        self.kraus_factory = kraus_factory
+        self.transfer_basis = transfer_basis
+        self.transfer_coefficients = transfer_coefficients
+
+    @staticmethod
+    def _check_rate(rate: Union[float, np.ndarray]) -> np.ndarray:
+        rate = np.asarray(rate, dtype=float)
+        if np.any(rate < 0) or np.any(rate > 1):
+            raise ValueError("Error rates must lie in [0, 1]")
+        return rate
+
+    def kraus_operators(self, rate: Union[float, np.ndarray]) -> np.ndarray:
+        return self.kraus_factory(self._check_rate(rate))
+
+    def pauli_probabilities(self, rate: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Pauli-twirled error probabilities for each rate, shape S + (4,) in
+        I, X, Y, Z order: p_P = Σ_k |tr(P E_k)|² / 4.
+        """
+        kraus = self.kraus_operators(rate)
+        overlaps = np.einsum('pji,...kij->...kp', _PAULIS.conj(), kraus)
+        return np.sum(np.abs(overlaps) ** 2, axis=-2) / 4
+
+    def transfer_matrix(self, rate: Union[float, np.ndarray]) -> np.ndarray:
+        """Transfer matrix for each rate, shape S + (4, 4)"""
+        rate = self._check_rate(rate)
+        if self.transfer_basis is not None:
+            coefficients = self.transfer_coefficients(rate)
+            return np.tensordot(coefficients, self.transfer_basis, axes=1)
+        return transfer_matrix(self.kraus_factory(rate))
+
+    def _apply_vectors(self, vectors: np.ndarray, rate: np.ndarray) -> np.ndarray:
+        """Apply the channel to rows of vec(ρ), shape (n, 4)"""
+        # Operands follow the storage dtype so single-precision batches stay single
+        dtype = vectors.dtype
+        if not rate.ndim:
+            return vectors @ self.transfer_matrix(rate).T.astype(dtype)
+        if self.transfer_basis is not None:
+            coefficients = self.transfer_coefficients(rate).astype(np.finfo(dtype).dtype)
+            result = np.zeros_like(vectors)
+            for r, basis in enumerate(self.transfer_basis.astype(dtype)):
+                result += coefficients[:, r, np.newaxis] * (vectors @ basis.T)
+            return result
+        return np.einsum('nab,nb->na', self.transfer_matrix(rate).astype(dtype), vectors)
+
+    def apply(
+        self,
+        states: QuantumStateArray,
+        rate: Union[float, np.ndarray],
+        indices: Optional[np.ndarray] = None
+    ):
+        """
+        Apply the channel to a batch of qubits in place.
+
+        ``rate`` is a scalar shared by every selected qubit or an array with
+        one error rate per selected qubit.
+        """
+        if states.dimensions != 2:
+            raise ValueError(f"{self.name} channel acts on qubits (dimension 2)")
+        rate = self._check_rate(rate)
+        count = len(states) if indices is None else len(indices)
+        if rate.ndim and rate.shape != (count,):
+            raise ValueError("Need one error rate per selected qubit")
+
+        data = states.data
+        for start in range(0, count, NOISE_CHUNK_SIZE):
+            stop = min(start + NOISE_CHUNK_SIZE, count)
+            # Contiguous runs are updated through a slice view, avoiding a gather copy
+            chunk = slice(start, stop) if indices is None else np.asarray(indices[start:stop])
+            chunk_rate = rate[start:stop] if rate.ndim else rate
+            vectors = data[chunk].reshape(-1, 4)
+            data[chunk] = self._apply_vectors(vectors, chunk_rate).reshape(-1, 2, 2)
+
+        states.touch(indices)
+
+    def apply_to_state(self, state: QuantumState, rate: float):
+        """Apply the channel to a single standalone or view-backed qubit"""
+        if state.dimensions != 2:
+            raise ValueError(f"{self.name} channel acts on qubits (dimension 2)")
+        rho = state.density_matrix
+        rho = rho.toarray() if hasattr(rho, 'toarray') else np.asarray(rho)
+        vector = self.transfer_matrix(rate) @ rho.reshape(4)
+        # A noisy state is generally mixed, so this leaves the ket fast path
+        state.density_matrix = vector.reshape(2, 2)
+
+
+DEPOLARIZING = KrausChannel(
+    'depolarizing',
+    _depolarizing_kraus,
+    _DEPOLARIZING_BASIS,
+    lambda p: np.stack([1 - p, p], axis=-1)
+)
+DEPHASING = KrausChannel(
+    'dephasing',
+    _dephasing_kraus,
+    _DEPHASING_BASIS,
+    lambda p: np.stack([1 - p / 2, p / 2], axis=-1)
+)
+AMPLITUDE_DAMPING = KrausChannel(
+    'amplitude_damping',
+    _amplitude_damping_kraus,
+    _AMPLITUDE_DAMPING_BASIS,
+    lambda gamma: np.stack([np.ones_like(gamma), gamma, np.sqrt(1 - gamma)], axis=-1)
+)
+
+CHANNELS = {
+    channel.name: channel
+    for channel in (DEPOLARIZING, DEPHASING, AMPLITUDE_DAMPING)
+}
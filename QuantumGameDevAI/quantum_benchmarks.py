@@ -0,0 +1,1005 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmarks for the Quantum Consciousness Database
+
+Micro-benchmarks for the quantum state and protocol layers. Each benchmark
+returns a plain dict of measurements so results can be compared across
+commits, and the CLI prints them as tables.
+
+Usage:
+  python quantum_benchmarks.py memory
+  python quantum_benchmarks.py encoding
+  python quantum_benchmarks.py fusion
+  python quantum_benchmarks.py noise
+  python quantum_benchmarks.py precision
+  python quantum_benchmarks.py entropy
+  python quantum_benchmarks.py stabilizer
+  python quantum_benchmarks.py lattice
+  python quantum_benchmarks.py decoders
+  python quantum_benchmarks.py superdense
+  python quantum_benchmarks.py pool
+  python quantum_benchmarks.py repeater
+  python quantum_benchmarks.py braids
+  python quantum_benchmarks.py decoded
+"""
+
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from quantum_state import (
+    EntangledPair,
+    QuantumInformationEncoder,
+    QuantumState,
+    QuantumStateArray,
+    entropy_many,
+    stacked_eigenvalues,
+    fusion_cache_info
+)
+from entanglement_pool import EntanglementPool
+from noise_channels import CHANNELS
+from repeater import nested_repeater
+from quantum_protocols import FaultTolerantQuantumDatabase, QuantumErrorCorrection, SuperdenseCoding
+from braids import BraidWord, compile_gates, exchange_letters
+from decoders import DECODERS
+from stabilizer import StabilizerCode
+from surface_code import SurfaceCodeLattice
+
+
+def measure_allocated_bytes(factory: Callable[[], Any]) -> int:
+    """Return the bytes still allocated after ``factory()`` (result kept alive)"""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = factory()
+    allocated = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del result
+    return allocated
+
+
+def surface_code_qubit_count(grid_size: int) -> int:
+    """Data plus X/Z syndrome qubits in create_surface_code's dense views"""
+    return grid_size * grid_size + 2 * grid_size * (grid_size - 1)
+
+
+def dense_surface_code(grid_size: int, dtype=None):
+    """create_surface_code with its per-qubit QuantumState views allocated"""
+    lattice = QuantumErrorCorrection.create_surface_code(grid_size, dtype=dtype)
+    lattice['data_qubits']
+    return lattice
+
+
+def benchmark_memory(
+    num_pairs: int = 10000,
+    grid_sizes: List[int] = (11, 31, 51)
+) -> Dict[str, Any]:
+    """Bytes per qubit for EntangledPair and create_surface_code"""
+    pair_bytes = measure_allocated_bytes(
+        lambda: [EntangledPair() for _ in range(num_pairs)]
+    )
+
+    surface_codes = {}
+    for grid_size in grid_sizes:
+        lattice_bytes = measure_allocated_bytes(
+            lambda: QuantumErrorCorrection.create_surface_code(grid_size)
+        )
+        dense_bytes = measure_allocated_bytes(lambda: dense_surface_code(grid_size))
+        num_qubits = QuantumErrorCorrection.create_surface_code(grid_size).num_qubits
+        dense_qubits = surface_code_qubit_count(grid_size)
+        surface_codes[grid_size] = {
+            'qubits': num_qubits,
+            'total_bytes': lattice_bytes,
+            'bytes_per_qubit': lattice_bytes / num_qubits,
+            'dense_qubits': dense_qubits,
+            'dense_bytes_per_qubit': dense_bytes / dense_qubits
+        }
+
+    return {
+        'entangled_pair': {
+            'pairs': num_pairs,
+            'total_bytes': pair_bytes,
+            'bytes_per_qubit': pair_bytes / (2 * num_pairs)
+        },
+        'surface_code': surface_codes
+    }
+
+
+def print_memory_report(results: Dict[str, Any]):
+    """Print memory benchmark table"""
+    print(f"\n{'=' * 60}")
+    print("MEMORY FOOTPRINT (bytes per qubit)")
+    print(f"{'=' * 60}")
+
+    pair = results['entangled_pair']
+    print(f"{'EntangledPair':<30} {pair['bytes_per_qubit']:>12.1f}   ({pair['pairs']} pairs)")
+
+    for grid_size, code in results['surface_code'].items():
+        label = f"create_surface_code({grid_size})"
+        print(f"{label:<30} {code['bytes_per_qubit']:>12.1f}   ({code['qubits']} qubits)")
+        print(f"{'  with dense qubit views':<30} {code['dense_bytes_per_qubit']:>12.1f}   "
+              f"({code['dense_qubits']} qubits)")
+
+    print(f"{'=' * 60}\n")
+
+
+def benchmark_encoding(
+    distinct_payloads: int = 256,
+    calls: int = 20000,
+    events_per_payload: int = 8,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Latency and hit rate of encode_interaction on a repeating workload"""
+    payloads = [
+        {
+            'timeline_id': f"agent_{i}",
+            'events': [
+                {'event_type': 'query', 'content': {'task': f"task_{i}_{j}"}}
+                for j in range(events_per_payload)
+            ],
+            'branch_count': 0
+        }
+        for i in range(distinct_payloads)
+    ]
+    order = np.random.default_rng(seed).integers(0, distinct_payloads, size=calls)
+
+    # Cold: every call misses and pays the full encode
+    QuantumInformationEncoder.clear_encoding_cache()
+    start = time.perf_counter()
+    for payload in payloads:
+        QuantumInformationEncoder.clear_encoding_cache()
+        QuantumInformationEncoder.encode_interaction(payload)
+    cold_latency = (time.perf_counter() - start) / distinct_payloads
+
+    # Warm: repeated payloads are served from the LRU
+    QuantumInformationEncoder.clear_encoding_cache()
+    start = time.perf_counter()
+    for i in order:
+        QuantumInformationEncoder.encode_interaction(payloads[i])
+    warm_latency = (time.perf_counter() - start) / calls
+
+    return {
+        'calls': calls,
+        'distinct_payloads': distinct_payloads,
+        'cold_latency_us': cold_latency * 1e6,
+        'warm_latency_us': warm_latency * 1e6,
+        'cache': QuantumInformationEncoder.encoding_cache_info()
+    }
+
+
+def print_encoding_report(results: Dict[str, Any]):
+    """Print encode_interaction benchmark table"""
+    print(f"\n{'=' * 60}")
+    print("ENCODE_INTERACTION MEMOIZATION")
+    print(f"{'=' * 60}")
+    print(f"{'Calls':<30} {results['calls']:>12}")
+    print(f"{'Distinct payloads':<30} {results['distinct_payloads']:>12}")
+    print(f"{'Cold latency (us/call)':<30} {results['cold_latency_us']:>12.2f}")
+    print(f"{'Warm latency (us/call)':<30} {results['warm_latency_us']:>12.2f}")
+    print(f"{'Cache hit rate':<30} {results['cache']['hit_rate']:>12.2%}")
+    print(f"{'=' * 60}\n")
+
+
+def random_unitaries(count: int, dimensions: int, rng: np.random.Generator) -> List[np.ndarray]:
+    """Haar-ish random unitaries from QR decompositions"""
+    unitaries = []
+    for _ in range(count):
+        matrix = rng.normal(size=(dimensions, dimensions)) + 1j * rng.normal(size=(dimensions, dimensions))
+        q, r = np.linalg.qr(matrix)
+        unitaries.append(q * (np.diag(r) / np.abs(np.diag(r))))
+    return unitaries
+
+
+def mixed_state(dimensions: int, rng: np.random.Generator, dtype=None) -> QuantumState:
+    """Dense full-rank state, so every gate pays the density-matrix cost"""
+    state = QuantumState(dimensions, dtype=dtype)
+    weights = rng.random(dimensions)
+    state.density_matrix = np.diag(weights / weights.sum()).astype(complex)
+    return state
+
+
+def benchmark_fusion(
+    num_gates: int = 1000,
+    dimensions: List[int] = (2, 16),
+    repeats: int = 20,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Eager vs deferred (fused) application of a long gate sequence"""
+    rng = np.random.default_rng(seed)
+    results = {}
+
+    for dim in dimensions:
+        gates = random_unitaries(num_gates, dim, rng)
+
+        state = mixed_state(dim, rng)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for gate in gates:
+                state.apply_unitary(gate)
+            state.get_purity()
+        eager = (time.perf_counter() - start) / repeats
+
+        state = mixed_state(dim, rng)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            with state.deferred():
+                for gate in gates:
+                    state.apply_unitary(gate)
+            state.get_purity()
+        deferred = (time.perf_counter() - start) / repeats
+
+        results[dim] = {
+            'eager_ms': eager * 1e3,
+            'deferred_ms': deferred * 1e3,
+            'speedup': eager / deferred
+        }
+
+    # Short repeated pattern (e.g. a correction sequence) hits the product cache
+    pattern = random_unitaries(4, 2, rng)
+    state = mixed_state(2, rng)
+    for _ in range(1000):
+        with state.deferred():
+            for gate in pattern:
+                state.apply_unitary(gate)
+
+    return {
+        'num_gates': num_gates,
+        'dimensions': results,
+        'pattern_cache': fusion_cache_info()
+    }
+
+
+def print_fusion_report(results: Dict[str, Any]):
+    """Print gate-fusion benchmark table"""
+    print(f"\n{'=' * 60}")
+    print(f"GATE FUSION ({results['num_gates']} gates, then one observable)")
+    print(f"{'=' * 60}")
+    print(f"{'Dimension':<12} {'Eager (ms)':>12} {'Deferred (ms)':>15} {'Speedup':>10}")
+    print("-" * 60)
+    for dim, timing in results['dimensions'].items():
+        print(f"{dim:<12} {timing['eager_ms']:>12.3f} {timing['deferred_ms']:>15.3f} "
+              f"{timing['speedup']:>9.1f}x")
+    print(f"\nRepeated 4-gate pattern cache hit rate: "
+          f"{results['pattern_cache']['hit_rate']:.2%}")
+    print(f"{'=' * 60}\n")
+
+
+def benchmark_noise(
+    num_keys: int = 20000,
+    steps: int = 10,
+    rate: float = 0.01,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Qubit-steps per second of bulk noise on a FaultTolerantQuantumDatabase"""
+    rng = np.random.default_rng(seed)
+    database = FaultTolerantQuantumDatabase()
+    for i in range(num_keys):
+        database.store_protected_data(f"key_{i}", QuantumState(2))
+    num_qubits = len(database.protected_qubit_indices())
+
+    channels = {}
+    for channel in ('depolarizing', 'dephasing', 'amplitude_damping'):
+        start = time.perf_counter()
+        for _ in range(steps):
+            database.apply_noise(channel, rate)
+        shared = time.perf_counter() - start
+
+        per_qubit_rates = rng.uniform(0, 2 * rate, size=num_qubits)
+        start = time.perf_counter()
+        for _ in range(steps):
+            database.apply_noise(channel, per_qubit_rates)
+        per_qubit = time.perf_counter() - start
+
+        channels[channel] = {
+            'shared_rate_qubit_steps_per_s': num_qubits * steps / shared,
+            'per_qubit_rate_qubit_steps_per_s': num_qubits * steps / per_qubit
+        }
+
+    return {
+        'physical_qubits': num_qubits,
+        'steps': steps,
+        'channels': channels
+    }
+
+
+def print_noise_report(results: Dict[str, Any]):
+    """Print noise-channel throughput table"""
+    print(f"\n{'=' * 60}")
+    print(f"NOISE CHANNELS ({results['physical_qubits']} physical qubits, "
+          f"{results['steps']} steps)")
+    print(f"{'=' * 60}")
+    print(f"{'Channel':<20} {'Shared rate (M/s)':>18} {'Per-qubit (M/s)':>18}")
+    print("-" * 60)
+    for channel, timing in results['channels'].items():
+        print(f"{channel:<20} {timing['shared_rate_qubit_steps_per_s'] / 1e6:>18.2f} "
+              f"{timing['per_qubit_rate_qubit_steps_per_s'] / 1e6:>18.2f}")
+    print(f"{'=' * 60}\n")
+
+
+def benchmark_precision(
+    num_states: int = 100000,
+    steps: int = 20,
+    num_gates: int = 1000,
+    grid_size: int = 51,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Memory saved and accuracy lost by complex64 storage, against complex128"""
+    rng = np.random.default_rng(seed)
+
+    # Batch workload: alternating random unitaries and depolarizing noise
+    unitaries = random_unitaries(steps, 2, rng)
+    start_states = QuantumStateArray(num_states, 2, dtype='double')
+    vectors = rng.normal(size=(num_states, 2)) + 1j * rng.normal(size=(num_states, 2))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    start_states.data = np.einsum('ni,nj->nij', vectors, vectors.conj())
+
+    batches = {}
+    for precision in ('double', 'single'):
+        batch = QuantumStateArray(0, 2, dtype=precision)
+        batch.data = start_states.data
+        for unitary in unitaries:
+            batch.apply_unitary(unitary)
+            CHANNELS['depolarizing'].apply(batch, 0.001)
+        batches[precision] = batch
+
+    double, single = batches['double'], batches['single']
+    batch_errors = {
+        'density_matrix': float(np.max(np.abs(single.data - double.data))),
+        'trace': float(np.max(np.abs(np.trace(single.data, axis1=1, axis2=2) - 1))),
+        'purity': float(np.max(np.abs(single.get_purity() - double.get_purity()))),
+        'entropy': float(np.max(np.abs(
+            single.get_von_neumann_entropy() - double.get_von_neumann_entropy()
+        )))
+    }
+
+    # Long deferred circuit on one state: rounding error of the fused product
+    gates = random_unitaries(num_gates, 16, rng)
+    circuit_states = {}
+    for precision in ('double', 'single'):
+        state = mixed_state(16, np.random.default_rng(seed), dtype=precision)
+        with state.deferred():
+            for gate in gates:
+                state.apply_unitary(gate)
+        circuit_states[precision] = state
+    circuit_errors = {
+        'density_matrix': float(np.max(np.abs(
+            circuit_states['single'].density_matrix - circuit_states['double'].density_matrix
+        ))),
+        'entropy': abs(circuit_states['single'].get_von_neumann_entropy()
+                       - circuit_states['double'].get_von_neumann_entropy())
+    }
+
+    memory = {}
+    for precision in ('double', 'single'):
+        code_bytes = measure_allocated_bytes(lambda: dense_surface_code(grid_size, precision))
+        memory[precision] = {
+            'surface_code_bytes_per_qubit': code_bytes / surface_code_qubit_count(grid_size),
+            'batch_bytes_per_state': batches[precision].data.nbytes / num_states
+        }
+
+    return {
+        'num_states': num_states,
+        'steps': steps,
+        'num_gates': num_gates,
+        'grid_size': grid_size,
+        'batch_errors': batch_errors,
+        'circuit_errors': circuit_errors,
+        'memory': memory
+    }
+
+
+def print_precision_report(results: Dict[str, Any]):
+    """Print complex64 vs complex128 accuracy and memory table"""
+    print(f"\n{'=' * 60}")
+    print("PRECISION (complex64 vs complex128 reference)")
+    print(f"{'=' * 60}")
+    print(f"{'':<34} {'double':>12} {'single':>12}")
+    print("-" * 60)
+    memory = results['memory']
+    label = f"Surface code {results['grid_size']} (B/qubit)"
+    print(f"{label:<34} {memory['double']['surface_code_bytes_per_qubit']:>12.1f} "
+          f"{memory['single']['surface_code_bytes_per_qubit']:>12.1f}")
+    print(f"{'Batch storage (B/state)':<34} {memory['double']['batch_bytes_per_state']:>12.1f} "
+          f"{memory['single']['batch_bytes_per_state']:>12.1f}")
+
+    print(f"\nMax abs error after {results['steps']} gate+noise steps "
+          f"on {results['num_states']} qubits:")
+    for quantity, error in results['batch_errors'].items():
+        print(f"  {quantity:<32} {error:>12.2e}")
+    print(f"Max abs error after a fused {results['num_gates']}-gate circuit (d=16):")
+    for quantity, error in results['circuit_errors'].items():
+        print(f"  {quantity:<32} {error:>12.2e}")
+    print(f"{'=' * 60}\n")
+
+
+def benchmark_entropy(
+    num_states: int = 100000,
+    dimensions: List[int] = (2, 4, 16),
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Per-state get_von_neumann_entropy loop vs one entropy_many call.
+
+    ``lapack_s`` times the bare stacked decomposition of the same buffer:
+    beyond qubits (closed form) it is the floor entropy_many runs against.
+    """
+    rng = np.random.default_rng(seed)
+    results = {}
+
+    for dim in dimensions:
+        # Random full-rank states held as views into one batch
+        batch = QuantumStateArray(num_states, dim)
+        factors = rng.normal(size=(num_states, dim, dim)) + 1j * rng.normal(size=(num_states, dim, dim))
+        rho = factors @ np.conj(np.swapaxes(factors, -1, -2))
+        batch.data[:] = rho / np.trace(rho, axis1=1, axis2=2)[:, np.newaxis, np.newaxis]
+        states = batch.states()
+
+        start = time.perf_counter()
+        looped = np.array([state.get_von_neumann_entropy() for state in states])
+        loop = time.perf_counter() - start
+
+        batch.touch()  # Invalidate the per-state caches filled by the loop
+        start = time.perf_counter()
+        batched = entropy_many(states)
+        vectorized = time.perf_counter() - start
+
+        start = time.perf_counter()
+        stacked_eigenvalues(batch.data)
+        lapack = time.perf_counter() - start
+
+        results[dim] = {
+            'loop_s': loop,
+            'batched_s': vectorized,
+            'lapack_s': lapack,
+            'speedup': loop / vectorized,
+            'max_abs_difference': float(np.max(np.abs(looped - batched)))
+        }
+
+    # Analytic shortcuts: kets and maximally mixed states need no decomposition
+    analytic_states = (
+        [QuantumState.from_state_vector(rng.normal(size=16)) for _ in range(num_states // 2)]
+        + [QuantumState(16) for _ in range(num_states // 2)]
+    )
+    start = time.perf_counter()
+    entropy_many(analytic_states)
+    analytic = time.perf_counter() - start
+
+    return {
+        'num_states': num_states,
+        'dimensions': results,
+        'analytic_s': analytic
+    }
+
+
+def print_entropy_report(results: Dict[str, Any]):
+    """Print batched-entropy benchmark table"""
+    print(f"\n{'=' * 60}")
+    print(f"VON NEUMANN ENTROPY ({results['num_states']} states)")
+    print(f"{'=' * 60}")
+    print(f"{'Dim':<5} {'Loop (s)':>9} {'Batched (s)':>12} {'Eigvalsh (s)':>13} {'Speedup':>8} {'Max diff':>9}")
+    print("-" * 60)
+    for dim, timing in results['dimensions'].items():
+        print(f"{dim:<5} {timing['loop_s']:>9.3f} {timing['batched_s']:>12.3f} "
+              f"{timing['lapack_s']:>13.3f} {timing['speedup']:>7.1f}x "
+              f"{timing['max_abs_difference']:>9.1e}")
+    print(f"\nPure + maximally mixed (analytic): {results['analytic_s']:.3f} s")
+    print("Dense d > 2 is bound by the stacked LAPACK eigvalsh (Eigvalsh column)")
+    print(f"{'=' * 60}\n")
+
+
+def benchmark_stabilizer(
+    distances: List[int] = (11, 21, 31, 41),
+    rounds: int = 5,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Rotated surface-code syndrome extraction on the CHP tableau"""
+    rng = np.random.default_rng(seed)
+    results = {}
+
+    for distance in distances:
+        code = StabilizerCode.rotated_surface(distance)
+        start = time.perf_counter()
+        tableau = code.prepare(rng=rng)
+        prepare = time.perf_counter() - start
+
+        # Each round injects one random X and one random Z error and checks
+        # the measured syndrome against the parity-check prediction
+        matches = 0
+        start = time.perf_counter()
+        for _ in range(rounds):
+            x_errors = np.zeros(code.num_data, dtype=bool)
+            z_errors = np.zeros(code.num_data, dtype=bool)
+            x_errors[rng.integers(code.num_data)] = True
+            z_errors[rng.integers(code.num_data)] = True
+            tableau.apply_paulis(np.flatnonzero(x_errors), np.flatnonzero(z_errors))
+            measured = code.extract_syndrome(tableau, rng)
+            expected = code.syndrome_of(x_errors, z_errors)
+            matches += all(np.array_equal(m, e) for m, e in zip(measured, expected))
+            tableau.apply_paulis(np.flatnonzero(x_errors), np.flatnonzero(z_errors))
+        per_round = (time.perf_counter() - start) / rounds
+
+        results[distance] = {
+            'physical_qubits': code.num_qubits,
+            'prepare_s': prepare,
+            'round_s': per_round,
+            'tableau_bytes': tableau.memory_bytes,
+            'syndromes_correct': matches == rounds
+        }
+
+    return {'rounds': rounds, 'distances': results}
+
+
+def print_stabilizer_report(results: Dict[str, Any]):
+    """Print stabilizer-tableau benchmark table"""
+    print(f"\n{'=' * 70}")
+    print(f"SURFACE CODE ON STABILIZER TABLEAU ({results['rounds']} syndrome rounds)")
+    print(f"{'=' * 70}")
+    print(f"{'Distance':<10} {'Qubits':>8} {'Prepare (s)':>12} {'Round (ms)':>11} "
+          f"{'Tableau (MB)':>13} {'Syndromes':>10}")
+    print("-" * 70)
+    for distance, timing in results['distances'].items():
+        print(f"{distance:<10} {timing['physical_qubits']:>8} {timing['prepare_s']:>12.3f} "
+              f"{timing['round_s'] * 1e3:>11.1f} {timing['tableau_bytes'] / 1e6:>13.2f} "
+              f"{'ok' if timing['syndromes_correct'] else 'MISMATCH':>10}")
+    print(f"{'=' * 70}\n")
+
+
+def benchmark_lattice(
+    grid_sizes: List[int] = (11, 51, 101, 201),
+    shots: int = 1024,
+    p: float = 0.01,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Memory and syndrome-extraction time of the bit-packed surface-code lattice"""
+    rng = np.random.default_rng(seed)
+    results = {}
+
+    for grid_size in grid_sizes:
+        lattice_bytes = measure_allocated_bytes(
+            lambda: QuantumErrorCorrection.create_surface_code(grid_size)
+        )
+        dense_bytes = measure_allocated_bytes(lambda: dense_surface_code(grid_size))
+
+        lattice = QuantumErrorCorrection.create_surface_code(grid_size, shots=shots)
+        start = time.perf_counter()
+        lattice.sample_errors(p, rng=rng)
+        sample = time.perf_counter() - start
+        start = time.perf_counter()
+        lattice.packed_syndrome()
+        extract = time.perf_counter() - start
+
+        results[grid_size] = {
+            'physical_qubits': lattice.num_qubits,
+            'lattice_bytes': lattice_bytes,
+            'dense_bytes': dense_bytes,
+            'frame_bytes': lattice.x_frame.nbytes + lattice.z_frame.nbytes,
+            'sample_s': sample,
+            'syndrome_s': extract,
+            'syndrome_us_per_shot': extract / shots * 1e6
+        }
+
+    return {'shots': shots, 'error_rate': p, 'grid_sizes': results}
+
+
+def print_lattice_report(results: Dict[str, Any]):
+    """Print surface-code lattice memory and timing table"""
+    print(f"\n{'=' * 78}")
+    print(f"SURFACE-CODE LATTICE ({results['shots']} shots, p = {results['error_rate']})")
+    print(f"{'=' * 78}")
+    print(f"{'Grid':<6} {'Qubits':>8} {'Lattice':>10} {'Dense views':>12} {'Frames':>10} "
+          f"{'Sample (ms)':>12} {'Syndrome (ms)':>14}")
+    print("-" * 78)
+    for grid_size, timing in results['grid_sizes'].items():
+        print(f"{grid_size:<6} {timing['physical_qubits']:>8} "
+              f"{timing['lattice_bytes'] / 1e6:>8.2f}MB {timing['dense_bytes'] / 1e6:>10.1f}MB "
+              f"{timing['frame_bytes'] / 1e6:>8.2f}MB {timing['sample_s'] * 1e3:>12.1f} "
+              f"{timing['syndrome_s'] * 1e3:>14.2f}")
+    print(f"{'=' * 78}\n")
+
+
+def benchmark_decoders(
+    distances: List[int] = (5, 9, 13, 17),
+    error_rates: List[float] = (0.001, 0.01, 0.03, 0.08),
+    shots: int = 200,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Decode latency and logical error rate of each decoder vs. distance and error rate"""
+    rng = np.random.default_rng(seed)
+    results = {}
+
+    for distance in distances:
+        for p in error_rates:
+            lattice = SurfaceCodeLattice(distance, shots=shots)
+            lattice.sample_errors(p, rng=rng)
+            errors = (lattice.x_frame.copy(), lattice.z_frame.copy())
+            z_syndrome, x_syndrome = lattice.syndrome()
+            # Latency is per shot with a non-trivial syndrome: clean shots are skipped
+            decoded = int(np.count_nonzero(z_syndrome.any(axis=1) | x_syndrome.any(axis=1)))
+
+            for name in DECODERS:
+                lattice.x_frame[...], lattice.z_frame[...] = errors
+                z_decoder, x_decoder = lattice.decoders(name)
+                start = time.perf_counter()
+                x_correction = z_decoder.decode_batch(z_syndrome)
+                z_correction = x_decoder.decode_batch(x_syndrome)
+                elapsed = time.perf_counter() - start
+                lattice.apply_errors(x_correction, z_correction)
+                x_flip, z_flip = lattice.logical_flips()
+                results[(distance, p, name)] = {
+                    'decoded_shots': decoded,
+                    'decode_s': elapsed,
+                    'us_per_shot': elapsed / max(decoded, 1) * 1e6,
+                    'logical_error_rate': float(np.mean(x_flip | z_flip))
+                }
+
+    return {'shots': shots, 'results': results}
+
+
+def print_decoders_report(results: Dict[str, Any]):
+    """Print decoder latency and logical error table"""
+    print(f"\n{'=' * 78}")
+    print(f"SURFACE-CODE DECODERS ({results['shots']} shots, code-capacity noise)")
+    print(f"{'=' * 78}")
+    print(f"{'d':<4} {'p':>7} {'Decoder':<12} {'Decoded':>8} {'us/shot':>10} {'Logical error':>14}")
+    print("-" * 78)
+    for (distance, p, name), timing in results['results'].items():
+        print(f"{distance:<4} {p:>7.3f} {name:<12} {timing['decoded_shots']:>8} "
+              f"{timing['us_per_shot']:>10.1f} {timing['logical_error_rate']:>14.4f}")
+    print(f"{'=' * 78}\n")
+
+
+def benchmark_superdense(
+    payload_sizes: List[int] = (1 << 16, 1 << 20, 16 << 20),
+    per_pair_bytes: int = 256,
+    repeats: int = 5,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Bulk superdense encode/decode throughput vs. one EntangledPair per 2 bits"""
+    rng = np.random.default_rng(seed)
+
+    # Per-pair protocol: four encode + decode round trips per byte
+    payload = rng.integers(0, 256, size=per_pair_bytes, dtype=np.uint8).tobytes()
+    bits = ''.join(f"{byte:08b}" for byte in payload)
+    start = time.perf_counter()
+    for i in range(0, len(bits), 2):
+        pair = EntangledPair()
+        message = SuperdenseCoding.encode(bits[i:i + 2], pair)
+        SuperdenseCoding.decode(message, pair)
+    per_pair = time.perf_counter() - start
+
+    results = {}
+    for size in payload_sizes:
+        payload = rng.integers(0, 256, size=size, dtype=np.uint8).tobytes()
+        encode = decode = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            batch = SuperdenseCoding.encode_bytes(payload)
+            encode = min(encode, time.perf_counter() - start)
+            start = time.perf_counter()
+            decoded = SuperdenseCoding.decode_bytes(batch)
+            decode = min(decode, time.perf_counter() - start)
+        if decoded != payload:
+            raise AssertionError("Bulk superdense round trip corrupted the payload")
+        # Decoding must read the states: a flipped pair changes its byte
+        batch = SuperdenseCoding.encode_bytes(payload)
+        batch.apply_unitary(np.kron(SuperdenseCoding.PAULI_X, np.eye(2)), [0])
+        if SuperdenseCoding.decode_bytes(batch)[0] == payload[0]:
+            raise AssertionError("Corrupting a pair's state did not change the decoded byte")
+        results[size] = {
+            'pairs': batch.num_pairs,
+            'batch_bytes': batch.nbytes,
+            'encode_mb_s': size / encode / 1e6,
+            'decode_mb_s': size / decode / 1e6
+        }
+
+    return {
+        'per_pair_mb_s': per_pair_bytes / per_pair / 1e6,
+        'payload_sizes': results
+    }
+
+
+def print_superdense_report(results: Dict[str, Any]):
+    """Print superdense throughput table"""
+    print(f"\n{'=' * 70}")
+    print("BULK SUPERDENSE CODING")
+    print(f"{'=' * 70}")
+    print(f"Per-pair encode + decode: {results['per_pair_mb_s']:.4f} MB/s")
+    print(f"{'Payload':<12} {'Pairs':>12} {'Batch':>12} {'Encode MB/s':>14} {'Decode MB/s':>14}")
+    print("-" * 70)
+    for size, timing in results['payload_sizes'].items():
+        print(f"{size / 1e6:>8.2f} MB {timing['pairs']:>12} {timing['batch_bytes'] / 1e6:>10.2f}MB "
+              f"{timing['encode_mb_s']:>14.1f} {timing['decode_mb_s']:>14.1f}")
+    print(f"{'=' * 70}\n")
+
+
+async def _pool_traffic(
+    pool: EntanglementPool,
+    bursts: int,
+    burst_size: int,
+    idle: float,
+    seed: int
+) -> np.ndarray:
+    """Send bursty superdense traffic through ``pool``; per-message latencies"""
+    bits = np.random.default_rng(seed).choice(['00', '01', '10', '11'], size=bursts * burst_size)
+    latencies = np.empty(len(bits))
+    pool.start()
+    for burst in range(bursts):
+        for i in range(burst * burst_size, (burst + 1) * burst_size):
+            start = time.perf_counter()
+            message = SuperdenseCoding.encode(bits[i], pool.acquire())
+            latencies[i] = time.perf_counter() - start
+            pool.release(message.entangled_pair_id)
+            # Senders are coroutines: the refill task can run between messages
+            await asyncio.sleep(0)
+        await asyncio.sleep(idle)
+    await pool.stop()
+    return latencies
+
+
+def benchmark_pool(
+    bursts: int = 200,
+    burst_size: int = 48,
+    idle: float = 0.002,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Superdense send latency under bursty traffic: refilled pool vs. on-demand pairs"""
+    configurations = {
+        'on-demand': EntanglementPool(high_watermark=0, low_watermark=0),
+        'pool 64/16': EntanglementPool(high_watermark=64, low_watermark=16),
+        'pool 128/32': EntanglementPool(high_watermark=128, low_watermark=32, batch_size=32),
+    }
+    results = {}
+    for name, pool in configurations.items():
+        latencies = asyncio.run(_pool_traffic(pool, bursts, burst_size, idle, seed))
+        results[name] = {
+            'p50_us': float(np.percentile(latencies, 50) * 1e6),
+            'p99_us': float(np.percentile(latencies, 99) * 1e6),
+            'metrics': pool.metrics()
+        }
+    return {'messages': bursts * burst_size, 'burst_size': burst_size, 'results': results}
+
+
+def print_pool_report(results: Dict[str, Any]):
+    """Print entanglement pool latency and refill table"""
+    print(f"\n{'=' * 78}")
+    print(f"ENTANGLEMENT POOL ({results['messages']} messages, bursts of {results['burst_size']})")
+    print(f"{'=' * 78}")
+    print(f"{'Pool':<14} {'p50 (us)':>9} {'p99 (us)':>9} {'Miss rate':>10} {'Min depth':>10} "
+          f"{'Refills':>8} {'Refill (ms)':>12}")
+    print("-" * 78)
+    for name, timing in results['results'].items():
+        metrics = timing['metrics']
+        print(f"{name:<14} {timing['p50_us']:>9.1f} {timing['p99_us']:>9.1f} "
+              f"{metrics['miss_rate']:>10.2%} {metrics['min_depth']:>10} "
+              f"{metrics['refills']:>8} {metrics['mean_refill_ms']:>12.3f}")
+    print(f"{'=' * 78}\n")
+
+
+def benchmark_repeater(
+    segment_counts: List[int] = (10, 100, 1000, 10_000, 100_000),
+    purification_rounds: List[int] = (0, 1, 2),
+    link_fidelity: float = 0.99,
+    swap_success: float = 0.5,
+    repeats: int = 5
+) -> Dict[str, Any]:
+    """Time, end-to-end fidelity and pair consumption of nested repeater chains"""
+    results = {}
+    for segments in segment_counts:
+        for rounds in purification_rounds:
+            elapsed = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                chain = nested_repeater(
+                    segments, link_fidelity, swap_success=swap_success,
+                    purification_rounds=rounds
+                )
+                elapsed = min(elapsed, time.perf_counter() - start)
+            results[(segments, rounds)] = {
+                'depth': chain.depth,
+                'fidelity': chain.fidelity,
+                'pairs_consumed': chain.pairs_consumed,
+                'elapsed_ms': elapsed * 1e3
+            }
+    return {'link_fidelity': link_fidelity, 'swap_success': swap_success, 'results': results}
+
+
+def print_repeater_report(results: Dict[str, Any]):
+    """Print nested repeater scaling table"""
+    print(f"\n{'=' * 72}")
+    print(f"NESTED REPEATER CHAIN (link F = {results['link_fidelity']}, "
+          f"swap success = {results['swap_success']})")
+    print(f"{'=' * 72}")
+    print(f"{'Segments':>9} {'Purify':>7} {'Levels':>7} {'Fidelity':>9} {'Pairs used':>12} {'Time (ms)':>10}")
+    print("-" * 72)
+    for (segments, rounds), timing in results['results'].items():
+        print(f"{segments:>9} {rounds:>7} {timing['depth']:>7} {timing['fidelity']:>9.4f} "
+              f"{timing['pairs_consumed']:>12.3g} {timing['elapsed_ms']:>10.3f}")
+    print(f"{'=' * 72}\n")
+
+
+def benchmark_braids(
+    braid_counts: List[int] = (10_000, 100_000, 1_000_000),
+    num_anyons: int = 4,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Memory and evaluation time of compressed braid histories vs. a list of
+    tuples. Full evaluation scales linearly with the reduced runs; the
+    incremental column is one more braid on an already-evaluated word.
+    """
+    rng = np.random.default_rng(seed)
+    results = {}
+    for count in braid_counts:
+        pairs = rng.integers(0, num_anyons, size=(count, 2))
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        letters = np.concatenate([exchange_letters(int(i), int(j)) for i, j in pairs])
+
+        tuples_bytes = measure_allocated_bytes(lambda: [(int(i), int(j)) for i, j in pairs])
+        start = time.perf_counter()
+        word = BraidWord.from_letters(letters)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        word.unitary(num_anyons)
+        evaluate = time.perf_counter() - start
+        word.extend(exchange_letters(0, 1))
+        start = time.perf_counter()
+        word.unitary(num_anyons)
+        incremental = time.perf_counter() - start
+
+        results[count] = {
+            'braids': len(pairs),
+            'letters_in': len(letters),
+            'letters_reduced': len(word),
+            'runs': word.num_runs,
+            'word_bytes': word.nbytes,
+            'tuples_bytes': tuples_bytes,
+            'build_ms': build * 1e3,
+            'evaluate_ms': evaluate * 1e3,
+            'incremental_ms': incremental * 1e3
+        }
+
+    gates = ''.join(rng.choice(list('XZH'), size=10_000))
+    start = time.perf_counter()
+    compile_gates(gates, num_anyons)
+    cached_gates = time.perf_counter() - start
+    return {'num_anyons': num_anyons, 'results': results,
+            'gates': len(gates), 'cached_gates_ms': cached_gates * 1e3}
+
+
+def print_braids_report(results: Dict[str, Any]):
+    """Print braid-word compression and evaluation table"""
+    print(f"\n{'=' * 86}")
+    print(f"COMPRESSED BRAID WORDS ({results['num_anyons']} Fibonacci anyons)")
+    print(f"{'=' * 86}")
+    print(f"{'Braids':>9} {'Letters':>9} {'Reduced':>9} {'Runs':>9} {'Word':>9} {'Tuples':>9} "
+          f"{'Build ms':>9} {'Eval ms':>8} {'Incr ms':>8}")
+    print("-" * 86)
+    for timing in results['results'].values():
+        print(f"{timing['braids']:>9} {timing['letters_in']:>9} {timing['letters_reduced']:>9} "
+              f"{timing['runs']:>9} {timing['word_bytes'] / 1e6:>7.2f}MB "
+              f"{timing['tuples_bytes'] / 1e6:>7.1f}MB {timing['build_ms']:>9.1f} "
+              f"{timing['evaluate_ms']:>8.2f} {timing['incremental_ms']:>8.3f}")
+    print("-" * 86)
+    print(f"{results['gates']} cached X/Z/H gate products: {results['cached_gates_ms']:.2f} ms")
+    print(f"{'=' * 86}\n")
+
+
+def benchmark_decoded_cache(
+    num_keys: int = 2000,
+    reads: int = 20_000,
+    hot_keys: int = 200,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """Protected-read throughput: per-read decoding vs. cached and bulk decoding"""
+    rng = np.random.default_rng(seed)
+    keys = [f'key_{i}' for i in range(num_keys)]
+    # Skewed traffic: most reads go to a small hot set
+    hot = rng.random(reads) < 0.9
+    picks = np.where(hot, rng.integers(0, hot_keys, reads), rng.integers(0, num_keys, reads))
+    workload = [keys[i] for i in picks]
+
+    def fill(cache_size: int) -> FaultTolerantQuantumDatabase:
+        database = FaultTolerantQuantumDatabase(cache_size=cache_size)
+        for key in keys:
+            database.store_protected_data(key, QuantumState(2))
+        return database
+
+    results = {}
+    for name, cache_size in (('uncached', 0), ('cached', 1024)):
+        database = fill(cache_size)
+        start = time.perf_counter()
+        for key in workload:
+            database.retrieve_protected_data(key)
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            'reads_per_second': reads / elapsed,
+            'info': database.decoded_cache_info()
+        }
+
+    database = fill(num_keys)
+    start = time.perf_counter()
+    database.retrieve_many(keys)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    database.retrieve_many(keys)
+    warm = time.perf_counter() - start
+    database.apply_noise('depolarizing', 0.01)
+    start = time.perf_counter()
+    database.retrieve_many(keys)
+    after_noise = time.perf_counter() - start
+    return {
+        'num_keys': num_keys,
+        'reads': reads,
+        'hot_keys': hot_keys,
+        'results': results,
+        'bulk_cold_ms': cold * 1e3,
+        'bulk_warm_ms': warm * 1e3,
+        'bulk_after_noise_ms': after_noise * 1e3
+    }
+
+
+def print_decoded_cache_report(results: Dict[str, Any]):
+    """Print decoded logical-state cache throughput"""
+    print(f"\n{'=' * 72}")
+    print(f"DECODED LOGICAL CACHE ({results['reads']} reads over {results['num_keys']} keys, "
+          f"90% to {results['hot_keys']})")
+    print(f"{'=' * 72}")
+    print(f"{'Mode':<10} {'Reads/s':>12} {'Hit rate':>9} {'Hits':>8} {'Misses':>8} {'Cached':>13}")
+    print("-" * 72)
+    for name, timing in results['results'].items():
+        info = timing['info']
+        print(f"{name:<10} {timing['reads_per_second']:>12,.0f} {info['hit_rate']:>9.1%} "
+              f"{info['hits']:>8} {info['misses']:>8} {info['size']:>13}")
+    print("-" * 72)
+    print(f"retrieve_many({results['num_keys']} keys): cold {results['bulk_cold_ms']:.2f} ms, "
+          f"warm {results['bulk_warm_ms']:.2f} ms, after noise {results['bulk_after_noise_ms']:.2f} ms")
+    print(f"{'=' * 72}\n")
+
+
+BENCHMARKS = {
+    'memory': (benchmark_memory, print_memory_report),
+    'encoding': (benchmark_encoding, print_encoding_report),
+    'fusion': (benchmark_fusion, print_fusion_report),
+    'noise': (benchmark_noise, print_noise_report),
+    'precision': (benchmark_precision, print_precision_report),
+    'entropy': (benchmark_entropy, print_entropy_report),
+    'stabilizer': (benchmark_stabilizer, print_stabilizer_report),
+    'lattice': (benchmark_lattice, print_lattice_report),
+    'decoders': (benchmark_decoders, print_decoders_report),
+    'superdense': (benchmark_superdense, print_superdense_report),
+    'pool': (benchmark_pool, print_pool_report),
+    'repeater': (benchmark_repeater, print_repeater_report),
+    'braids': (benchmark_braids, print_braids_report),
+    'decoded': (benchmark_decoded_cache, print_decoded_cache_report),
+}
+
+
+def main():
+    """Run the selected benchmarks"""
+    parser = argparse.ArgumentParser(
+        description="Quantum Consciousness Database - performance benchmarks"
+    )
+    parser.add_argument(
+        'benchmarks',
+        nargs='*',
+        metavar='BENCHMARK',
+        help=f"Benchmarks to run: {', '.join(sorted(BENCHMARKS))} (default: all)"
+    )
+    args = parser.parse_args()
+
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    for name in args.benchmarks or sorted(BENCHMARKS):
+        run, report = BENCHMARKS[name]
+        report(run())
+
+
+if __name__ == "__main__":
+    main()
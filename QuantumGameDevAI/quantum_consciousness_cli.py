@@ -147,9 +147,10 @@ async def demonstrate_superdense_coding(network: QuantumNetwork):
     alice = await network.add_node("Alice", position=(0, 0, 0))
     bob = await network.add_node("Bob", position=(5, 0, 0))
 
-    # Send 2 bits using 1 qubit
+    # Send 2 bits using 1 qubit of a pair from the Alice-Bob pool
     message_bits = "11"
-    result = alice.local_database.send_superdense_message(message_bits)
+    result = alice.local_database.send_superdense_message(message_bits, peer="Bob")
+    decoded_bits = bob.local_database.receive_superdense_message(result, peer="Alice")
 
     QuantumNetworkVisualizer.print_protocol_demo(
         "Superdense Coding",
@@ -160,7 +161,9 @@ async def demonstrate_superdense_coding(network: QuantumNetwork):
             'qubits_used': 1,
             'efficiency': '2 bits per qubit',
             'encoded_unitary': result.encoded_unitary.value,
-            'entangled_pair_id': result.entangled_pair_id
+            'entangled_pair_id': result.entangled_pair_id,
+            'decoded_bits': decoded_bits,
+            'pool_depth': alice.local_database.entanglement_pool("Bob").depth
         }
     )
 
@@ -175,8 +178,10 @@ async def demonstrate_entanglement_swapping(network: QuantumNetwork):
     node_b = await network.add_node("Station_Beta", position=(10, 0, 0))
     node_c = await network.add_node("Station_Gamma", position=(20, 0, 0))
 
-    # Extend entanglement using swapping
-    node_a.local_database.extend_entanglement_range(num_repeaters=5)
+    # Extend entanglement using nested swapping over imperfect links
+    chain = node_a.local_database.extend_entanglement_range(
+        num_repeaters=5, link_fidelity=0.98, purification_rounds=1
+    )
 
     QuantumNetworkVisualizer.print_protocol_demo(
         "Entanglement Swapping",
@@ -185,7 +190,10 @@ async def demonstrate_entanglement_swapping(network: QuantumNetwork):
             'nodes_connected': ['Station_Alpha', 'Station_Gamma'],
             'intermediate_nodes': ['Station_Beta', 'Repeater_1', 'Repeater_2'],
             'effective_range': 'Unlimited (via quantum repeaters)',
-            'entanglement_pairs_created': len(node_a.local_database.entanglement_network)
+            'entanglement_pairs_created': len(node_a.local_database.entanglement_network),
+            'swap_levels': chain.depth,
+            'end_to_end_fidelity': f"{chain.fidelity:.4f}",
+            'elementary_pairs_consumed': f"{chain.pairs_consumed:.1f}"
         }
     )
 
@@ -354,6 +362,12 @@ async def run_full_demonstration(orchestrator: GaiaNetOrchestrator):
     hubs = QuantumMetricsAnalyzer.identify_network_hubs(topology)
     print(f"Network Hubs:                 {', '.join(hubs)}")
 
+    entropy_analysis = QuantumMetricsAnalyzer.analyze_state_entropies(
+        orchestrator.network.get_quantum_states()
+    )
+    print(f"Mean State Entropy:           {entropy_analysis.get('mean_entropy', 0):.4f} bits "
+          f"({entropy_analysis.get('total_states', 0)} states)")
+
     # Export state
     print("\n💾 Exporting network state...")
     QuantumNetworkVisualizer.export_network_state(
@@ -416,33 +430,37 @@ Examples:
     orchestrator = GaiaNetOrchestrator()
     orchestrator.resonance_frequency = args.frequency
 
-    # Handle entanglement requests
-    if args.entangle:
-        QuantumNetworkVisualizer.print_banner()
-
-        for ai_system in args.entangle:
-            await orchestrator.entangle_with_ai(ai_system)
-            await asyncio.sleep(0.3)
+    try:
+        # Handle entanglement requests
+        if args.entangle:
+            QuantumNetworkVisualizer.print_banner()
 
-        # Show network state
-        topology = orchestrator.network.get_network_topology()
-        QuantumNetworkVisualizer.print_network_state(topology)
+            for ai_system in args.entangle:
+                await orchestrator.entangle_with_ai(ai_system)
+                await asyncio.sleep(0.3)
 
-        # Activate resonance if requested
-        if args.resonate:
-            await orchestrator.activate_resonance()
-
-            # Show updated state
+            # Show network state
             topology = orchestrator.network.get_network_topology()
             QuantumNetworkVisualizer.print_network_state(topology)
 
-    # Run demo if requested
-    elif args.demo:
-        await run_full_demonstration(orchestrator)
+            # Activate resonance if requested
+            if args.resonate:
+                await orchestrator.activate_resonance()
+
+                # Show updated state
+                topology = orchestrator.network.get_network_topology()
+                QuantumNetworkVisualizer.print_network_state(topology)
+
+        # Run demo if requested
+        elif args.demo:
+            await run_full_demonstration(orchestrator)
 
-    else:
-        parser.print_help()
-        sys.exit(1)
+        else:
+            parser.print_help()
+            sys.exit(1)
+    finally:
+        # Stop the pair-refill tasks before the event loop goes away
+        await orchestrator.network.close()
 
     print("\n✨ Quantum Consciousness Database session complete\n")
 
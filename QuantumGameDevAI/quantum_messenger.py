@@ -10,7 +10,21 @@ from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import asyncio
-from quantum_state import EntangledPair, QuantumState, QuantumInformationEncoder
+from collections import OrderedDict
+from quantum_state import (
+    EntangledPair,
+    QuantumState,
+    QuantumInformationEncoder,
+    allocate_quantum_id,
+    resolve_dtype,
+    resolve_rng
+)
+from tensor_network import MatrixProductState
+
+
+# GHZ states a messenger keeps registered; older ones are dropped first
+# (their messages still hold a reference to the joint state)
+MAX_MULTIPARTITE_STATES = 256
 
 
 @dataclass
@@ -23,6 +37,9 @@ class QuantumMessage:
     source_node: Optional[str] = None
     destination_node: Optional[str] = None
     interaction_history: List[Dict] = field(default_factory=list)
+    # Joint multi-party state this message belongs to, and its site in it
+    multipartite_state: Optional[MatrixProductState] = None
+    site: Optional[int] = None
 
     def encode_history(self) -> QuantumState:
         """Encode interaction history into quantum state"""
@@ -44,12 +61,21 @@ class QuantumMessenger:
     non-local correlations.
     """
 
-    def __init__(self, node_id: str):
+    def __init__(
+        self,
+        node_id: str,
+        rng: Optional[np.random.Generator] = None,
+        dtype=None
+    ):
         self.node_id = node_id
+        self.rng = rng  # Per-node random stream (None uses the shared default)
+        self.dtype = resolve_dtype(dtype)  # Storage precision of this node's pairs
         self.active_entanglements: Dict[str, EntangledPair] = {}
         self.message_queue: List[QuantumMessage] = []
         self.received_messages: List[QuantumMessage] = []
         self.entanglement_registry: Dict[str, str] = {}  # message_id -> partner_node
+        # ghz_id -> joint state, bounded by MAX_MULTIPARTITE_STATES
+        self.multipartite_states: 'OrderedDict[str, MatrixProductState]' = OrderedDict()
 
     async def create_messenger_pair(
         self,
@@ -63,11 +89,11 @@ class QuantumMessenger:
         is implicitly connected to the destination node.
         """
         # Create maximally entangled Bell state
-        entangled_pair = EntangledPair(state_type="bell_phi_plus")
+        entangled_pair = EntangledPair(state_type="bell_phi_plus", rng=self.rng, dtype=self.dtype)
 
         # Create quantum message
         message = QuantumMessage(
-            id=entangled_pair.id,
+            id=str(entangled_pair.id),
             payload=payload,
             entangled_pair=entangled_pair,
             source_node=self.node_id,
@@ -108,12 +134,10 @@ class QuantumMessenger:
         # Perform measurement on local particle
         outcome_local = entangled_pair.measure_particle_a()
 
-        # The entangled partner's state is now determined
+        # The entangled partner's state is now determined by the collapsed
+        # joint state (correlated for Φ, anti-correlated for Ψ)
         # This happens instantaneously regardless of distance
-        if entangled_pair.state_type == "bell_phi_plus":
-            outcome_remote = outcome_local  # Perfectly correlated
-        else:
-            outcome_remote = 1 - outcome_local  # Anti-correlated
+        outcome_remote = entangled_pair.measure_particle_b()
 
         return outcome_local, outcome_remote
 
@@ -136,8 +160,7 @@ class QuantumMessenger:
 
         # In real quantum teleportation, we'd perform a joint measurement
         # Here we simulate the classical measurement outcomes
-        outcome_1 = np.random.choice([0, 1])
-        outcome_2 = np.random.choice([0, 1])
+        outcome_1, outcome_2 = resolve_rng(self.rng).integers(0, 2, size=2).tolist()
 
         return {
             'measurement_results': (outcome_1, outcome_2),
@@ -172,21 +195,32 @@ class QuantumMessenger:
         true distributed quantum consensus.
         """
         n_nodes = len(destination_nodes) + 1  # Include source
-        ghz_particles = QuantumInformationEncoder.create_ghz_state(n_nodes)
+        ghz_state = QuantumInformationEncoder.create_ghz_mps(n_nodes)
+        ghz_state.rng = self.rng
+        ghz_id = f"ghz_{allocate_quantum_id()}"
+        self.multipartite_states[ghz_id] = ghz_state
+        while len(self.multipartite_states) > MAX_MULTIPARTITE_STATES:
+            self.multipartite_states.popitem(last=False)
 
         messages = []
         for i, dest_node in enumerate(destination_nodes):
-            # Create pseudo-entangled pair (in real implementation,
-            # this would be part of the GHZ state)
-            entangled_pair = EntangledPair(state_type="bell_phi_plus")
+            # Pairwise link kept for the messenger bookkeeping; the actual
+            # n-party correlations live in the shared GHZ state (source = site 0)
+            entangled_pair = EntangledPair(state_type="bell_phi_plus", rng=self.rng, dtype=self.dtype)
 
             message = QuantumMessage(
                 id=f"ghz_{i}_{entangled_pair.id}",
                 payload=payload,
                 entangled_pair=entangled_pair,
                 source_node=self.node_id,
-                destination_node=dest_node
+                destination_node=dest_node,
+                multipartite_state=ghz_state,
+                site=i + 1
             )
             messages.append(message)
 
         return messages
+
+    def release_multipartite_state(self, ghz_id: str) -> Optional[MatrixProductState]:
+        """Unregister a GHZ state once its parties are done with it"""
+        return self.multipartite_states.pop(ghz_id, None)
@@ -8,10 +8,28 @@ Implements sophisticated quantum information protocols including:
 - Quantum error correction
 """
 
+import os
 import numpy as np
-from typing import List, Tuple, Dict, Any, Optional
-from dataclasses import dataclass
-from quantum_state import QuantumState, EntangledPair
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Tuple, Dict, Any, Optional, Union
+from dataclasses import dataclass, field
+from entanglement_pool import EntanglementPool
+from braids import BRAID_GATES, BraidWord, exchange_letters, fusion_basis, gate_letters
+from noise_channels import CHANNELS, KrausChannel
+from repeater import RepeaterChain, nested_repeater
+from stabilizer import StabilizerCode, StabilizerTableau
+from state_store import QuantumStateStore
+from surface_code import SurfaceCodeLattice
+from quantum_state import (
+    BELL_MEASUREMENT_BITS,
+    BELL_STATES,
+    EntangledPair,
+    QuantumState,
+    QuantumStateArray,
+    resolve_dtype,
+    resolve_rng
+)
 from enum import Enum
 
 
@@ -27,10 +45,90 @@ class PauliOperator(Enum):
 class SuperdenseCodedMessage:
     """Message encoded using superdense coding protocol"""
     classical_bits: str  # 2 bits encoded on 1 qubit
-    entangled_pair_id: str
+    entangled_pair_id: int
     encoded_unitary: PauliOperator
 
 
+# Payload bytes looked up per step of decode_bytes
+SUPERDENSE_CHUNK_BYTES = 1 << 16
+
+
+@dataclass
+class SuperdenseBatch:
+    """
+    Bulk superdense-coded payload: one Bell pair per 2 bits.
+
+    Every pair sits in one of four states, ``state_type`` with one of
+    Alice's Paulis applied, so the batch keeps each pair's Pauli as a 2-bit
+    code packed four to a byte (``packed``, in payload bit order: pair 4i
+    carries bits 7-6 of byte i) and reads its joint state from the fixed
+    4-entry table of encoded Bell states. Pairs changed by
+    ``apply_unitary`` carry their own 4x4 matrix in ``overrides``. Dense
+    states and EntangledPairs are only built for the pairs asked for.
+    """
+    packed: np.ndarray
+    state_type: str = 'bell_phi_plus'
+    dtype: np.dtype = np.dtype(complex)
+    overrides: Dict[int, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def num_pairs(self) -> int:
+        """Number of entangled pairs used (4 per payload byte)"""
+        return 4 * len(self.packed)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the codes and per-pair overrides"""
+        return self.packed.nbytes + sum(matrix.nbytes for matrix in self.overrides.values())
+
+    def codes(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Unpacked 2-bit Pauli codes of pairs ``start:stop``"""
+        start, stop, _ = slice(start, stop).indices(self.num_pairs)
+        codes = _unpack_codes(self.packed[start // 4:(stop + 3) // 4])
+        return codes[start % 4:start % 4 + stop - start]
+
+    def joint_states(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """(pairs, 4, 4) joint density matrices of pairs ``start:stop`` (a new array)"""
+        start, stop, _ = slice(start, stop).indices(self.num_pairs)
+        states = _encoded_bell_states(self.state_type, self.dtype)[self.codes(start, stop)]
+        for index, matrix in self.overrides.items():
+            if start <= index < stop:
+                states[index - start] = matrix
+        return states
+
+    def pair(self, index: int) -> EntangledPair:
+        """EntangledPair holding a copy of pair ``index``'s joint state"""
+        pair = EntangledPair(self.state_type, dtype=self.dtype)
+        pair._set_joint_state(self.joint_states(index, index + 1)[0])
+        return pair
+
+    def apply_unitary(self, unitary: np.ndarray, indices: np.ndarray):
+        """Apply a 4x4 (or one per index) unitary to the joint states of ``indices``"""
+        indices = np.atleast_1d(np.asarray(indices, dtype=int))
+        unitary = np.broadcast_to(np.asarray(unitary, dtype=self.dtype), (len(indices), 4, 4))
+        for index, operator in zip(indices.tolist(), unitary):
+            rho = self.joint_states(index, index + 1)[0]
+            self.overrides[index] = operator @ rho @ operator.conj().T
+
+    def bell_probabilities(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """(pairs, 4) Bell-measurement outcome probabilities of pairs ``start:stop``, by Bell code"""
+        start, stop, _ = slice(start, stop).indices(self.num_pairs)
+        probabilities = _encoded_bell_probabilities(self.state_type, self.dtype)[self.codes(start, stop)]
+        touched = [index for index in self.overrides if start <= index < stop]
+        if touched:
+            rho = np.stack([self.overrides[index] for index in touched])
+            measured = np.real(np.einsum('jab,kba->kj', _BELL_PROJECTORS, rho))
+            probabilities[np.array(touched) - start] = np.clip(measured, 0.0, None)
+        return probabilities
+
+    @property
+    def pauli_indices(self) -> np.ndarray:
+        """Most likely Pauli per pair as 0..3 (I, X, Z, Y: the encoded bit pairs)"""
+        if not self.overrides:
+            return self.codes()
+        return np.argmax(self.bell_probabilities(), axis=1) ^ _BELL_CODES[self.state_type]
+
+
 class SuperdenseCoding:
     """
     Superdense coding protocol: encode 2 classical bits using 1 qubit
@@ -40,11 +138,11 @@ class SuperdenseCoding:
     quantum channels.
     """
 
-    # Pauli matrices
-    PAULI_I = np.array([[1, 0], [0, 1]])
-    PAULI_X = np.array([[0, 1], [1, 0]])
-    PAULI_Y = np.array([[0, -1j], [1j, 0]])
-    PAULI_Z = np.array([[1, 0], [0, -1]])
+    # Pauli matrices (complex, so applying them never changes a state's dtype)
+    PAULI_I = np.array([[1, 0], [0, 1]], dtype=complex)
+    PAULI_X = np.array([[0, 1], [1, 0]], dtype=complex)
+    PAULI_Y = np.array([[0, -1j], [1j, 0]], dtype=complex)
+    PAULI_Z = np.array([[1, 0], [0, -1]], dtype=complex)
 
     @staticmethod
     def encode(bits: str, entangled_pair: EntangledPair) -> SuperdenseCodedMessage:
@@ -69,8 +167,8 @@ class SuperdenseCoding:
 
         unitary, operator = unitary_map[bits]
 
-        # Apply unitary to Alice's qubit
-        entangled_pair.particle_a.apply_unitary(unitary)
+        # Apply unitary to Alice's qubit of the joint state
+        entangled_pair.apply_local_unitary(unitary, 'a')
 
         return SuperdenseCodedMessage(
             classical_bits=bits,
@@ -85,19 +183,123 @@ class SuperdenseCoding:
 
         Bob performs Bell measurement on both qubits to extract 2 bits.
         """
-        # Perform Bell measurement (simulated)
-        outcome_a, outcome_b = entangled_pair.measure_particle_a()
+        # The pre-shared state decodes to these bits when no Pauli was applied
+        base_a, base_b = BELL_MEASUREMENT_BITS[entangled_pair.state_type]
+
+        # Perform Bell measurement (CNOT + Hadamard, then measure both qubits)
+        outcome_a, outcome_b = entangled_pair.measure_bell_basis()
 
         # Map outcomes back to classical bits
-        # In real implementation, this would involve CNOT and Hadamard gates
-        if message.encoded_unitary == PauliOperator.I:
-            return '00'
-        elif message.encoded_unitary == PauliOperator.X:
-            return '01'
-        elif message.encoded_unitary == PauliOperator.Z:
-            return '10'
-        else:  # Y
-            return '11'
+        return f"{outcome_a ^ base_a}{outcome_b ^ base_b}"
+
+    @staticmethod
+    def encode_bytes(
+        payload: Union[bytes, bytearray, memoryview, np.ndarray],
+        state_type: str = 'bell_phi_plus',
+        dtype=None
+    ) -> SuperdenseBatch:
+        """
+        Encode a whole payload, 2 bits per pre-shared pair of ``state_type``.
+
+        Bits are taken most significant first, so pair 4i carries bits 7-6
+        of byte i with the same 00/01/10/11 -> I/X/Z/Y map as ``encode``.
+        Applying Alice's Pauli moves a pair to one of four encoded Bell
+        states, so the payload bytes already are the packed Pauli codes.
+        """
+        if state_type not in BELL_STATES:
+            raise ValueError(f"Unknown Bell state type: {state_type}")
+        packed = np.array(np.frombuffer(payload, dtype=np.uint8))
+        return SuperdenseBatch(packed, state_type, resolve_dtype(dtype))
+
+    @staticmethod
+    def decode_bytes(
+        batch: SuperdenseBatch,
+        rng: Optional[np.random.Generator] = None
+    ) -> bytes:
+        """
+        Bell-measure every pair of ``batch`` and return the payload.
+
+        Untouched pairs are in one of the four encoded Bell states, whose
+        measurement outcome is certain, so whole bytes are measured by one
+        lookup in a 256-entry table derived from the Bell projectors. Pairs
+        with their own state (``overrides``) are sampled from their
+        Bell-basis probabilities. All pairs collapse to the measured Bell
+        states; as in ``decode``, XOR with the shared state's bits recovers
+        the encoded pair of bits.
+        """
+        base = _BELL_CODES[batch.state_type]
+        table = _byte_outcomes(batch.state_type, batch.dtype)
+        decoded = np.empty_like(batch.packed)
+        for start in range(0, len(decoded), SUPERDENSE_CHUNK_BYTES):
+            # Chunked: take() widens the indices to intp internally
+            table.take(batch.packed[start:start + SUPERDENSE_CHUNK_BYTES],
+                       out=decoded[start:start + SUPERDENSE_CHUNK_BYTES])
+
+        touched = np.array(sorted(batch.overrides), dtype=int)
+        if len(touched):
+            rho = np.stack([batch.overrides[index] for index in touched.tolist()])
+            probabilities = np.clip(np.real(np.einsum('jab,kba->kj', _BELL_PROJECTORS, rho)), 0.0, None)
+            cumulative = np.cumsum(probabilities, axis=1)
+            draws = resolve_rng(rng).random((len(touched), 1)) * cumulative[:, -1:]
+            outcomes = np.minimum(np.sum(cumulative <= draws, axis=1), 3).astype(np.uint8)
+            shifts = _CODE_SHIFTS[touched % 4]
+            for byte, shift, code in zip((touched // 4).tolist(), shifts.tolist(), (outcomes ^ base).tolist()):
+                decoded[byte] = (int(decoded[byte]) & ~(3 << shift)) | (code << shift)
+
+        # Collapsed: each pair is now the Bell state its decoded code names
+        batch.packed = decoded
+        batch.overrides.clear()
+        return decoded.tobytes()
+
+
+# Bell state names by code (BELL_MEASUREMENT_BITS read as a 2-bit number)
+_BELL_NAMES = {2 * a + b: name for name, (a, b) in BELL_MEASUREMENT_BITS.items()}
+_CODE_SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+
+
+def _unpack_codes(packed: np.ndarray) -> np.ndarray:
+    """Four 2-bit codes per byte, most significant first"""
+    return ((packed[:, np.newaxis] >> _CODE_SHIFTS) & 3).ravel()
+
+
+_BELL_CODES = {name: 2 * a + b for name, (a, b) in BELL_MEASUREMENT_BITS.items()}
+# Bell projectors indexed by code
+_BELL_PROJECTORS = np.stack([BELL_STATES[_BELL_NAMES[code]] for code in range(4)])
+# P ⊗ I on the joint state for the Paulis of bit pairs 00, 01, 10, 11
+_PAULIS_ON_A = np.stack([
+    np.kron(pauli, SuperdenseCoding.PAULI_I)
+    for pauli in (SuperdenseCoding.PAULI_I, SuperdenseCoding.PAULI_X,
+                  SuperdenseCoding.PAULI_Z, SuperdenseCoding.PAULI_Y)
+])
+
+
+@lru_cache(maxsize=None)
+def _encoded_bell_states(state_type: str, dtype: np.dtype) -> np.ndarray:
+    """(P ⊗ I) ρ (P ⊗ I)† of ``state_type`` for each Pauli code (read-only)"""
+    rho = BELL_STATES[state_type]
+    table = np.einsum('pab,bc,pdc->pad', _PAULIS_ON_A, rho, _PAULIS_ON_A.conj()).astype(dtype)
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=None)
+def _encoded_bell_probabilities(state_type: str, dtype: np.dtype) -> np.ndarray:
+    """Bell-measurement probabilities of each encoded state, by Bell code"""
+    table = _encoded_bell_states(state_type, dtype)
+    probabilities = np.clip(np.real(np.einsum('jab,pba->pj', _BELL_PROJECTORS, table)), 0.0, None)
+    probabilities.flags.writeable = False
+    return probabilities
+
+
+@lru_cache(maxsize=None)
+def _byte_outcomes(state_type: str, dtype: np.dtype) -> np.ndarray:
+    """Decoded byte for each packed byte of four untouched encoded pairs"""
+    # Each encoded state is a Bell state: its outcome has probability one
+    outcomes = np.argmax(_encoded_bell_probabilities(state_type, dtype), axis=1)
+    codes = (outcomes[_unpack_codes(np.arange(256, dtype=np.uint8))] ^ _BELL_CODES[state_type])
+    table = np.bitwise_or.reduce(codes.astype(np.uint8).reshape(-1, 4) << _CODE_SHIFTS, axis=1)
+    table.flags.writeable = False
+    return table
 
 
 class EntanglementSwapping:
@@ -111,7 +313,8 @@ class EntanglementSwapping:
     @staticmethod
     def swap(
         pair_ab: EntangledPair,
-        pair_bc: EntangledPair
+        pair_bc: EntangledPair,
+        rng: Optional[np.random.Generator] = None
     ) -> Tuple[QuantumState, QuantumState]:
         """
         Perform entanglement swapping.
@@ -119,48 +322,50 @@ class EntanglementSwapping:
         Input: Particles A-B entangled, particles B-C entangled
         Output: Particles A-C become entangled (B measured out)
 
+        Both B particles (``pair_ab``'s B and ``pair_bc``'s A) are measured
+        jointly in the Bell basis. Afterwards ``pair_ab`` holds the A-C link
+        (its particle B now stands for C) and ``pair_bc`` holds the measured
+        pair, collapsed to the observed Bell state. Returns A and C.
+
         This is the key to quantum repeaters and long-distance quantum networks.
         """
-        # Bell measurement on particles B (from both pairs)
-        # In real implementation, this would be a joint measurement
+        # ρ_AC ∝ Tr_BB'[(I ⊗ P ⊗ I)(ρ_AB ⊗ ρ_B'C)] for each Bell projector P
+        left = pair_ab.joint_state.reshape(2, 2, 2, 2)
+        right = pair_bc.joint_state.reshape(2, 2, 2, 2)
+        outcomes = list(BELL_STATES)
+        projectors = np.stack([BELL_STATES[name] for name in outcomes]).reshape(-1, 2, 2, 2, 2)
+        linked = np.einsum('kqrbc,abeq,cdrf->kadef', projectors, left, right).reshape(-1, 4, 4)
+        probabilities = np.clip(np.real(np.trace(linked, axis1=1, axis2=2)), 0.0, None)
+        outcome = int(resolve_rng(rng, pair_ab.rng).choice(
+            len(outcomes), p=probabilities / probabilities.sum()
+        ))
 
-        measurement_result = np.random.choice(['00', '01', '10', '11'])
+        pair_ab._set_joint_state((linked[outcome] / probabilities[outcome]).astype(pair_ab.dtype))
+        pair_bc._set_joint_state(np.array(BELL_STATES[outcomes[outcome]], dtype=pair_bc.dtype))
 
-        # After swapping, A and C are now entangled
-        particle_a = pair_ab.particle_a
-        particle_c = pair_bc.particle_b
-
-        # Mark as entangled with each other
-        particle_a.entangled_with = [particle_c.id]
-        particle_c.entangled_with = [particle_a.id]
-
-        # Set to maximally mixed state (sign of entanglement)
-        particle_a.density_matrix = np.eye(2) / 2
-        particle_c.density_matrix = np.eye(2) / 2
-
-        return particle_a, particle_c
+        # After swapping, A and C are now entangled (and marked as such)
+        return pair_ab.particle_a, pair_ab.particle_b
 
     @staticmethod
     def create_quantum_repeater_chain(
-        num_segments: int
+        num_segments: int,
+        link_fidelity: float = 1.0,
+        purification_rounds: int = 0,
+        dtype=None
     ) -> List[Tuple[QuantumState, QuantumState]]:
         """
         Create quantum repeater chain using entanglement swapping.
 
         Enables quantum communication across arbitrary distances by
-        swapping entanglement through intermediate nodes.
+        swapping entanglement through intermediate nodes. The segments are
+        joined by the nested log-depth schedule of ``repeater.nested_repeater``
+        into one end-to-end link, returned as its (A, B) particle pair.
         """
-        # Create initial entangled pairs for each segment
-        pairs = [EntangledPair() for _ in range(num_segments)]
-
-        # Swap adjacent pairs to create long-distance entanglement
-        extended_pairs = []
-        for i in range(0, len(pairs) - 1, 2):
-            if i + 1 < len(pairs):
-                particle_a, particle_c = EntanglementSwapping.swap(pairs[i], pairs[i + 1])
-                extended_pairs.append((particle_a, particle_c))
-
-        return extended_pairs
+        chain = nested_repeater(
+            num_segments, link_fidelity, purification_rounds=purification_rounds
+        )
+        pair = chain.end_to_end_pair(dtype)
+        return [(pair.particle_a, pair.particle_b)]
 
 
 class TopologicalQubit:
@@ -168,13 +373,14 @@ class TopologicalQubit:
     Topological qubit using anyonic braiding.
 
     Topological qubits are protected from local decoherence by
-    encoding information in global topological properties.
+    encoding information in global topological properties. The braid
+    history is a compressed, freely reduced BraidWord; the logical state
+    is read from the Fibonacci-anyon unitary it evaluates to.
     """
 
     def __init__(self, num_anyons: int = 4):
         self.num_anyons = num_anyons
-        self.braid_sequence: List[Tuple[int, int]] = []
-        self.topological_charge = 0
+        self.braid_sequence = BraidWord()
         self.is_protected = True
         self.decoherence_resistance = 0.99  # Much higher than regular qubits
 
@@ -185,14 +391,30 @@ class TopologicalQubit:
         Braiding anyons changes the quantum state in a way that
         depends only on the topology of the braid, not the exact path.
         """
-        if anyon_i >= self.num_anyons or anyon_j >= self.num_anyons:
+        if not (0 <= anyon_i < self.num_anyons and 0 <= anyon_j < self.num_anyons):
             raise ValueError("Anyon index out of range")
+        self.braid_sequence.extend(exchange_letters(anyon_i, anyon_j))
 
-        self.braid_sequence.append((anyon_i, anyon_j))
+    def unitary(self) -> np.ndarray:
+        """Unitary the braid history applies to the anyons' fusion space"""
+        return self.braid_sequence.unitary(self.num_anyons)
+
+    def fusion_probabilities(self) -> np.ndarray:
+        """
+        Probabilities that the first two anyons fuse to 1 or to τ, starting
+        from the state where they fuse to the vacuum (or τ when n < 3)
+        """
+        basis = fusion_basis(self.num_anyons)
+        amplitudes = self.unitary()[:, 0]
+        # Fusion channel of anyons 0 and 1 is the second charge of each tree
+        channels = np.array([tree[1] if len(tree) > 1 else tree[0] for tree in basis])
+        weights = np.abs(amplitudes) ** 2
+        return np.array([weights[channels == 0].sum(), weights[channels == 1].sum()])
 
-        # Update topological charge based on braid
-        # In Fibonacci anyonic theory: 1 x 1 = 1 + τ
-        self.topological_charge = (self.topological_charge + 1) % 2
+    @property
+    def topological_charge(self) -> int:
+        """Most likely fusion channel of the first anyon pair (0: vacuum, 1: τ)"""
+        return int(np.argmax(self.fusion_probabilities()))
 
     def get_logical_state(self) -> int:
         """
@@ -207,21 +429,12 @@ class TopologicalQubit:
         """
         Apply fault-tolerant topological gate.
 
-        Gates are implemented via anyon braiding patterns.
-        """
-        if gate_type == "X":
-            # Implement X gate via specific braid pattern
-            self.braid_anyons(0, 1)
-            self.braid_anyons(2, 3)
-        elif gate_type == "Z":
-            # Implement Z gate via different braid pattern
-            self.braid_anyons(0, 2)
-            self.braid_anyons(1, 3)
-        elif gate_type == "H":
-            # Hadamard via more complex braiding
-            self.braid_anyons(0, 1)
-            self.braid_anyons(1, 2)
-            self.braid_anyons(2, 3)
+        Gates are implemented via anyon braiding patterns (BRAID_GATES);
+        their braid words and unitaries are cached.
+        """
+        if gate_type not in BRAID_GATES:
+            return
+        self.braid_sequence.extend(gate_letters(gate_type))
 
     def measure_topological_charge(self) -> int:
         """
@@ -235,47 +448,103 @@ class QuantumErrorCorrection:
     Quantum error correction using stabilizer codes.
 
     Implements the 9-qubit Shor code and surface code for protecting
-    quantum information from decoherence.
+    quantum information from decoherence. Codes run on a bit-packed
+    StabilizerTableau, so syndromes come from actual stabilizer
+    measurements and scale to thousands of physical qubits.
     """
 
+    SHOR_CODE = StabilizerCode.shor()
+
+    @staticmethod
+    def repetition_code(length: int, phase_flip: bool = False) -> StabilizerCode:
+        """Bit-flip (or phase-flip) repetition code on ``length`` qubits"""
+        return StabilizerCode.repetition(length, phase_flip)
+
     @staticmethod
-    def encode_shor_code(logical_qubit: QuantumState) -> List[QuantumState]:
+    def encode_logical(
+        code: Optional[StabilizerCode] = None,
+        logical: int = 0,
+        rng: Optional[np.random.Generator] = None
+    ) -> StabilizerTableau:
+        """
+        Prepare |logical⟩_L of ``code`` (Shor code by default) on a tableau.
+
+        The tableau holds data qubits followed by the code's ancillas; pass
+        it to ``detect_errors`` / ``correct_errors`` with the same code.
+        """
+        code = code or QuantumErrorCorrection.SHOR_CODE
+        return code.prepare(logical, rng)
+
+    @staticmethod
+    def encode_shor_code(
+        logical_qubit: QuantumState,
+        storage: Optional[QuantumStateArray] = None
+    ) -> List[QuantumState]:
         """
         Encode 1 logical qubit into 9 physical qubits using Shor code.
 
         Protects against arbitrary single-qubit errors (bit flip and phase flip).
+        When ``storage`` is given the physical qubits are allocated from that
+        shared pool, so noise can later be applied to every block at once.
         """
         if logical_qubit.dimensions != 2:
             raise ValueError("Shor code works with qubits (dimension 2)")
 
-        # Create 9 physical qubits
-        physical_qubits = [QuantumState(2) for _ in range(9)]
+        # Create 9 physical qubits in one contiguous block
+        if storage is None:
+            storage = QuantumStateArray(0, 2)
+        physical_qubits = storage.allocate(9)
 
         # Encode logical state into redundant representation
         # |0⟩_L = (|000⟩ + |111⟩)(|000⟩ + |111⟩)(|000⟩ + |111⟩)/√8
         # |1⟩_L = (|000⟩ - |111⟩)(|000⟩ - |111⟩)(|000⟩ - |111⟩)/√8
 
-        # For simulation, we'll set each qubit to an equal superposition
-        for qubit in physical_qubits:
-            qubit.density_matrix = np.eye(2) / 2
-
+        # For simulation, each qubit stays in an equal superposition
+        # (the array initializes every slot maximally mixed)
         return physical_qubits
 
     @staticmethod
-    def detect_errors(encoded_qubits: List[QuantumState]) -> Dict[str, Any]:
+    def detect_errors(
+        encoded_qubits: Union[List[QuantumState], StabilizerTableau],
+        rng: Optional[np.random.Generator] = None,
+        code: Optional[StabilizerCode] = None,
+        decoder: str = 'union_find'
+    ) -> Dict[str, Any]:
         """
         Perform syndrome measurement to detect errors.
 
-        Returns error syndromes without collapsing the logical state.
-        """
+        Returns error syndromes without collapsing the logical state. A
+        StabilizerTableau from ``encode_logical`` has its Z checks (bit-flip
+        syndrome) and X checks (phase-flip syndrome) measured through the
+        ancillas and decoded with ``decoder`` (see decoders.DECODERS); a
+        list of dense Shor qubits carries no stabilizer state, so its
+        syndrome is sampled.
+        """
+        if isinstance(encoded_qubits, StabilizerTableau):
+            code = code or QuantumErrorCorrection.SHOR_CODE
+            bit_flip, phase_flip = code.extract_syndrome(encoded_qubits, rng)
+            correction = code.decode(bit_flip, phase_flip, decoder)
+            return {
+                'syndromes': {
+                    'bit_flip_syndrome': bit_flip.tolist(),
+                    'phase_flip_syndrome': phase_flip.tolist()
+                },
+                'error_detected': bool(bit_flip.any() or phase_flip.any()),
+                'error_type': 'bit_flip' if bit_flip.any() else 'phase_flip' if phase_flip.any() else 'none',
+                'correctable': True,
+                'correction': correction,
+                'code': code
+            }
+
         if len(encoded_qubits) != 9:
             raise ValueError("Shor code requires 9 qubits")
 
         # Measure stabilizers (parity checks)
         # In real implementation, these are non-destructive measurements
+        bits = resolve_rng(rng).integers(0, 2, size=(2, 3))
         syndromes = {
-            'bit_flip_syndrome': [np.random.choice([0, 1]) for _ in range(3)],
-            'phase_flip_syndrome': [np.random.choice([0, 1]) for _ in range(3)]
+            'bit_flip_syndrome': bits[0].tolist(),
+            'phase_flip_syndrome': bits[1].tolist()
         }
 
         # Detect error type and location
@@ -291,9 +560,9 @@ class QuantumErrorCorrection:
 
     @staticmethod
     def correct_errors(
-        encoded_qubits: List[QuantumState],
+        encoded_qubits: Union[List[QuantumState], StabilizerTableau],
         syndrome: Dict[str, Any]
-    ) -> List[QuantumState]:
+    ) -> Union[List[QuantumState], StabilizerTableau]:
         """
         Apply correction operations based on syndrome measurement.
 
@@ -302,6 +571,10 @@ class QuantumErrorCorrection:
         if not syndrome['error_detected']:
             return encoded_qubits
 
+        if isinstance(encoded_qubits, StabilizerTableau):
+            encoded_qubits.apply_paulis(*syndrome['correction'])
+            return encoded_qubits
+
         # Apply correction unitaries based on syndrome
         if syndrome['error_type'] == 'bit_flip':
             # Apply X gate to flip bit back
@@ -318,88 +591,378 @@ class QuantumErrorCorrection:
         return encoded_qubits
 
     @staticmethod
-    def create_surface_code(grid_size: int) -> Dict[str, Any]:
+    def decode_error_frames(
+        x_errors: np.ndarray,
+        z_errors: np.ndarray,
+        code: Optional[StabilizerCode] = None,
+        decoder: str = 'union_find'
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decode many blocks' Pauli error frames at once.
+
+        ``x_errors`` / ``z_errors`` are (blocks, num_data) boolean error
+        patterns on the data qubits of ``code`` (Shor code by default).
+        Syndromes come from the check matrices, every distinct syndrome is
+        decoded once with ``decoder``, and the residual error is tested
+        against the logical operators. Returns (logical X flip, logical Z
+        flip) per block; the frames themselves are not modified.
+        """
+        code = code or QuantumErrorCorrection.SHOR_CODE
+        flips = []
+        # X errors trip Z checks and flip logical Z's eigenvalue, and vice versa
+        for errors, (checks, check_decoder, table), logical in zip(
+            (x_errors, z_errors), _syndrome_tables(code, decoder), (code.logical_z, code.logical_x)
+        ):
+            errors = np.asarray(errors, dtype=bool).reshape(-1, code.num_data)
+            residual = errors.copy()
+            if len(checks):
+                syndromes = (errors.astype(np.uint8) @ checks.T) & 1
+                if table is not None:
+                    residual ^= table[syndromes @ (1 << np.arange(len(checks)))]
+                else:
+                    unique, inverse = np.unique(syndromes, axis=0, return_inverse=True)
+                    residual ^= check_decoder.decode_batch(unique)[inverse.reshape(-1)]
+            flips.append(np.bitwise_xor.reduce(residual[:, logical], axis=1))
+        return flips[0], flips[1]
+
+    @staticmethod
+    def create_surface_code(grid_size: int, dtype=None, shots: int = 1) -> SurfaceCodeLattice:
         """
         Create surface code on 2D grid of qubits.
 
         Surface codes are currently the most practical approach to
-        fault-tolerant quantum computing.
+        fault-tolerant quantum computing. The returned lattice holds
+        bit-packed X/Z error frames for ``shots`` independent runs and
+        extracts syndromes with vectorized XORs. It still answers the
+        original dict keys: the per-qubit QuantumState views (in ``dtype``
+        precision, library default if None) are allocated on first access.
         """
-        # Create grid of qubits
-        data_qubits = [[QuantumState(2) for _ in range(grid_size)]
-                       for _ in range(grid_size)]
+        return SurfaceCodeLattice(grid_size, shots=shots, dtype=dtype)
 
-        # Create syndrome qubits (at vertices and faces)
-        syndrome_qubits_x = [[QuantumState(2) for _ in range(grid_size - 1)]
-                             for _ in range(grid_size)]
-        syndrome_qubits_z = [[QuantumState(2) for _ in range(grid_size)]
-                             for _ in range(grid_size - 1)]
 
-        return {
-            'data_qubits': data_qubits,
-            'syndrome_qubits_x': syndrome_qubits_x,
-            'syndrome_qubits_z': syndrome_qubits_z,
-            'grid_size': grid_size,
-            'logical_qubits': (grid_size - 1) // 2,
-            'distance': grid_size,
-            'threshold': 0.01  # Error threshold for fault tolerance
-        }
+# Codes with at most this many checks of a type get a full syndrome table
+SYNDROME_TABLE_CHECKS = 12
+
+
+@lru_cache(maxsize=None)
+def _syndrome_tables(code: StabilizerCode, decoder: str) -> List[tuple]:
+    """
+    (uint8 check matrix, decoder, correction for every syndrome or None)
+    for the Z checks and then the X checks of ``code``.
+    """
+    tables = []
+    for checks, check_decoder in zip((code.z_check_matrix, code.x_check_matrix), code.decoders(decoder)):
+        table = None
+        if len(checks) <= SYNDROME_TABLE_CHECKS:
+            syndromes = (np.arange(1 << len(checks))[:, np.newaxis] >> np.arange(len(checks))) & 1
+            table = check_decoder.decode_batch(syndromes)
+        tables.append((checks.astype(np.uint8), check_decoder, table))
+    return tables
+
+
+# Bound on decoded logical states cached per database (2x2 each)
+DECODED_CACHE_SIZE = 4096
+
+# Residual logical error by (X flip) + 2 (Z flip): I, X, Z, XZ
+_LOGICAL_PAULIS = np.stack([
+    SuperdenseCoding.PAULI_I, SuperdenseCoding.PAULI_X,
+    SuperdenseCoding.PAULI_Z, SuperdenseCoding.PAULI_X @ SuperdenseCoding.PAULI_Z
+])
 
 
 class FaultTolerantQuantumDatabase:
     """
     Combines all advanced protocols for a robust quantum database.
+
+    Each key keeps its logical density matrix (``logical_qubits``) and a
+    block of 9 physical qubits, whose single-qubit marginals are the I/2
+    of a Shor codeword. Noise steps sample each channel's Pauli-twirled
+    errors into an X/Z error frame per physical qubit (Pauli errors leave
+    the I/2 marginals unchanged); reads decode the frames with the Shor
+    code and apply any residual logical error to the logical state.
+    Decoded states are kept in an LRU of ``cache_size`` entries until
+    their block changes.
+
+    With ``storage_path`` the physical and logical states live in
+    memory-mapped QuantumStateStores and the error frames in
+    ERROR_FRAMES_FILE beside them: everything survives restarts (call
+    ``flush`` to persist) and may exceed available RAM.
     """
 
-    def __init__(self):
+    ERROR_FRAMES_FILE = 'error_frames.npy'
+
+
+    def __init__(
+        self,
+        precision=None,
+        storage_path: Optional[str] = None,
+        cache_size: int = DECODED_CACHE_SIZE
+    ):
         self.topological_qubits: List[TopologicalQubit] = []
-        self.error_corrected_data: Dict[str, List[QuantumState]] = {}
         self.entanglement_network: List[Tuple[QuantumState, QuantumState]] = []
-        self.superdense_channels: List[EntangledPair] = []
+        # One pre-shared pair pool per peer (None: unspecified peer)
+        self.entanglement_pools: Dict[Optional[str], EntanglementPool] = {}
+
+        # Every stored block lives in one pool so noise is applied in bulk
+        self.storage_path = storage_path
+        self._error_frames = np.zeros((0, 2), dtype=bool)  # (X, Z) error bits per slot
+        if storage_path is not None:
+            # Reopening maps the existing file; its precision wins if none is given
+            self.physical_qubits = QuantumStateStore(storage_path, 2, dtype=precision)
+            self.error_corrected_data = self.physical_qubits.blocks
+            self.logical_qubits = QuantumStateStore(
+                os.path.join(storage_path, 'logical'), 2, dtype=self.physical_qubits.dtype
+            )
+            self._logical = self.logical_qubits.blocks
+            frames_path = os.path.join(storage_path, self.ERROR_FRAMES_FILE)
+            if os.path.exists(frames_path):
+                self._error_frames = np.load(frames_path)
+        else:
+            self.physical_qubits = QuantumStateArray(0, 2, dtype=precision)
+            self.error_corrected_data: Dict[str, List[QuantumState]] = {}
+            self.logical_qubits = QuantumStateArray(0, 2, dtype=precision)
+            self._logical: Dict[str, List[QuantumState]] = {}
+        # Storage precision of every state the database creates
+        self.dtype = self.physical_qubits.dtype
+        self._protected_indices: Optional[np.ndarray] = None
+
+        # key -> (block slots, their versions, decoded state, its version)
+        self._decoded: 'OrderedDict[str, tuple]' = OrderedDict()
+        self.cache_size = cache_size
+        self._decoded_stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
 
     def store_protected_data(self, key: str, data: QuantumState):
         """
         Store data with full error protection using Shor code.
         """
-        encoded_data = QuantumErrorCorrection.encode_shor_code(data)
+        if key in self.error_corrected_data:
+            self.physical_qubits.release(self.error_corrected_data[key])
+        if key in self._logical:
+            self.logical_qubits.release(self._logical[key])
+        encoded_data = QuantumErrorCorrection.encode_shor_code(data, self.physical_qubits)
         self.error_corrected_data[key] = encoded_data
+        logical = self.logical_qubits.allocate(1)
+        logical[0].density_matrix = data.density_matrix
+        self._logical[key] = logical
+        self._error_frames_for_slots()[[qubit._index for qubit in encoded_data]] = False
+        self._protected_indices = None
+        self._invalidate(key)
+
+    def _error_frames_for_slots(self) -> np.ndarray:
+        """(slots, 2) X/Z error bits, grown to cover every physical qubit"""
+        if len(self._error_frames) < len(self.physical_qubits):
+            frames = np.zeros((max(len(self.physical_qubits), 2 * len(self._error_frames)), 2), dtype=bool)
+            frames[:len(self._error_frames)] = self._error_frames
+            self._error_frames = frames
+        return self._error_frames
+
+    def protected_qubit_indices(self, key: Optional[str] = None) -> np.ndarray:
+        """
+        Slots of ``physical_qubits`` holding one key's block, or of every
+        stored block (in insertion order) when ``key`` is None.
+        """
+        if key is not None:
+            return np.array([qubit._index for qubit in self.error_corrected_data[key]], dtype=int)
+        if self._protected_indices is None and isinstance(self.physical_qubits, QuantumStateStore):
+            # Read slots straight from the index instead of creating views
+            self._protected_indices = self.physical_qubits.slot_indices()
+        if self._protected_indices is None:
+            self._protected_indices = np.array(
+                [qubit._index for block in self.error_corrected_data.values() for qubit in block],
+                dtype=int
+            )
+        return self._protected_indices
+
+    def apply_noise(
+        self,
+        channel: Union[str, KrausChannel],
+        rate: Union[float, np.ndarray],
+        rng: Optional[np.random.Generator] = None
+    ):
+        """
+        Apply one noise step to every stored physical qubit.
+
+        ``rate`` is a single error rate or an array with one rate per entry
+        of ``protected_qubit_indices()``. One Pauli error per qubit is drawn
+        from the channel's twirl (``KrausChannel.pauli_probabilities``) into
+        the error frames.
+        """
+        if isinstance(channel, str):
+            if channel not in CHANNELS:
+                raise ValueError(f"Unknown noise channel: {channel}")
+            channel = CHANNELS[channel]
+        indices = self.protected_qubit_indices()
+        cumulative = np.cumsum(
+            np.broadcast_to(channel.pauli_probabilities(rate), (len(indices), 4)), axis=1
+        )
+        draws = resolve_rng(rng).random((len(indices), 1)) * cumulative[:, -1:]
+        paulis = np.argmax(cumulative > draws, axis=1)  # I, X, Y, Z
+        frames = self._error_frames_for_slots()
+        frames[indices, 0] ^= (paulis == 1) | (paulis == 2)
+        frames[indices, 1] ^= (paulis == 2) | (paulis == 3)
+        self._invalidate()
+
+    def flush(self):
+        """Persist blocks, logical states and error frames when file-backed"""
+        if self.storage_path is None:
+            return
+        self.physical_qubits.flush()
+        self.logical_qubits.flush()
+        path = os.path.join(self.storage_path, self.ERROR_FRAMES_FILE)
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as f:
+            np.save(f, self._error_frames_for_slots()[:len(self.physical_qubits)])
+        os.replace(temporary, path)
 
     def retrieve_protected_data(self, key: str) -> Optional[QuantumState]:
         """
         Retrieve data with error correction applied.
-        """
-        if key not in self.error_corrected_data:
-            return None
-
-        encoded_data = self.error_corrected_data[key]
 
-        # Detect and correct errors
-        syndrome = QuantumErrorCorrection.detect_errors(encoded_data)
-        corrected_data = QuantumErrorCorrection.correct_errors(encoded_data, syndrome)
+        Served from the decoded-state cache when the block is unchanged;
+        see ``retrieve_many``.
+        """
+        return self.retrieve_many([key])[0]
+
+    def retrieve_many(self, keys: List[str]) -> List[Optional[QuantumState]]:
+        """
+        Retrieve several keys (None for unknown ones), decoding every
+        uncached block's error frame in one vectorized pass. Reads never
+        modify the stored blocks.
+
+        Cached states are shared between reads: mutating a returned state,
+        its physical block, storing over its key or running a noise step
+        invalidates the entry.
+        """
+        results: List[Optional[QuantumState]] = [None] * len(keys)
+        pending: Dict[str, List[int]] = {}
+        versions = self.physical_qubits.versions
+        for position, key in enumerate(keys):
+            if key not in self.error_corrected_data:
+                continue
+            entry = self._decoded.get(key)
+            if entry is not None:
+                slots, slot_versions, state, state_version = entry
+                if state.version == state_version and np.array_equal(versions[slots], slot_versions):
+                    self._decoded.move_to_end(key)
+                    self._decoded_stats['hits'] += 1
+                    results[position] = state
+                    continue
+                self._invalidate(key)
+            if key not in pending:
+                self._decoded_stats['misses'] += 1
+            pending.setdefault(key, []).append(position)
+
+        if not pending:
+            return results
+
+        slots = np.array([self.protected_qubit_indices(key) for key in pending], dtype=int)
+        frames = self._error_frames_for_slots()[slots]
+        x_flip, z_flip = QuantumErrorCorrection.decode_error_frames(frames[..., 0], frames[..., 1])
+        # Stores written before logical states were kept read as I/2
+        mixed = np.eye(2, dtype=self.dtype) / 2
+        logical = np.stack([
+            self._logical[key][0].density_matrix if key in self._logical else mixed
+            for key in pending
+        ])
+        residual = _LOGICAL_PAULIS[x_flip.astype(int) + 2 * z_flip.astype(int)]
+        logical = residual @ logical @ np.conj(np.swapaxes(residual, -1, -2))
+        for key, block, rho in zip(pending, slots, logical):
+            state = QuantumState(2, dtype=self.dtype)
+            state.density_matrix = rho
+            for position in pending[key]:
+                results[position] = state
+            if self.cache_size > 0:
+                self._decoded[key] = (block, versions[block].copy(), state, state.version)
+                if len(self._decoded) > self.cache_size:
+                    self._decoded.popitem(last=False)
+        return results
+
+    def _invalidate(self, key: Optional[str] = None):
+        """Drop the cached decoded state of ``key`` (every key if None)"""
+        if key is None:
+            self._decoded_stats['invalidations'] += len(self._decoded)
+            self._decoded.clear()
+        elif self._decoded.pop(key, None) is not None:
+            self._decoded_stats['invalidations'] += 1
+
+    def decoded_cache_info(self) -> Dict[str, float]:
+        """Hit/miss statistics of the decoded logical-state cache"""
+        stats = self._decoded_stats
+        lookups = stats['hits'] + stats['misses']
+        return {
+            'hits': stats['hits'],
+            'misses': stats['misses'],
+            'hit_rate': stats['hits'] / lookups if lookups else 0.0,
+            'invalidations': stats['invalidations'],
+            'size': len(self._decoded),
+            'max_size': self.cache_size
+        }
 
-        # Decode logical qubit (simplified)
-        logical_qubit = QuantumState(2)
-        return logical_qubit
+    def clear_decoded_cache(self):
+        self._invalidate()
 
-    def extend_entanglement_range(self, num_repeaters: int):
+    def extend_entanglement_range(
+        self,
+        num_repeaters: int,
+        link_fidelity: float = 1.0,
+        purification_rounds: int = 0
+    ) -> RepeaterChain:
         """
         Use entanglement swapping to create long-distance entanglement.
+
+        Adds the end-to-end link to ``entanglement_network`` and returns the
+        chain's fidelity and pair-consumption summary.
         """
-        extended_pairs = EntanglementSwapping.create_quantum_repeater_chain(
-            num_repeaters
+        chain = nested_repeater(
+            num_repeaters, link_fidelity, purification_rounds=purification_rounds
         )
-        self.entanglement_network.extend(extended_pairs)
-
-    def send_superdense_message(self, bits: str) -> SuperdenseCodedMessage:
+        pair = chain.end_to_end_pair(self.dtype)
+        self.entanglement_network.append((pair.particle_a, pair.particle_b))
+        return chain
+
+    def entanglement_pool(self, peer: Optional[str] = None) -> EntanglementPool:
+        """Pair pool shared with ``peer``, created (and filled) on first use"""
+        pool = self.entanglement_pools.get(peer)
+        if pool is None:
+            pool = self.entanglement_pools[peer] = EntanglementPool(peer, dtype=self.dtype)
+        return pool
+
+    def send_superdense_message(
+        self,
+        bits: str,
+        peer: Optional[str] = None
+    ) -> SuperdenseCodedMessage:
         """
         Send 2 bits using 1 qubit via superdense coding.
-        """
-        # Create or reuse entangled pair
-        if not self.superdense_channels:
-            self.superdense_channels.append(EntangledPair())
 
-        pair = self.superdense_channels[-1]
-        return SuperdenseCoding.encode(bits, pair)
+        Consumes one fresh pair from the pool shared with ``peer``.
+        """
+        pool = self.entanglement_pool(peer)
+        pair = pool.acquire()
+        try:
+            return SuperdenseCoding.encode(bits, pair)
+        except Exception:
+            pool.discard(pair.id)
+            raise
+
+    def receive_superdense_message(
+        self,
+        message: SuperdenseCodedMessage,
+        peer: Optional[str] = None
+    ) -> str:
+        """Decode a superdense message sent over the pool shared with ``peer``"""
+        pair = self.entanglement_pool(peer).release(message.entangled_pair_id)
+        return SuperdenseCoding.decode(message, pair)
+
+    def send_superdense_payload(
+        self,
+        payload: Union[bytes, bytearray, memoryview]
+    ) -> SuperdenseBatch:
+        """
+        Send a whole byte payload via superdense coding, 2 bits per pair,
+        in one vectorized pass (decode with SuperdenseCoding.decode_bytes).
+        """
+        return SuperdenseCoding.encode_bytes(payload, dtype=self.dtype)
 
     def create_topological_storage(self, num_qubits: int):
         """
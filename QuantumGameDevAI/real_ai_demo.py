@@ -72,6 +72,7 @@ async def real_multi_ai_conversation():
 
     if not connected_ais:
         print("❌ Failed to connect to any AI services")
+        await network.close()
         return
 
     print(f"\n✓ Connected to {len(connected_ais)} AI services\n")
@@ -136,6 +137,7 @@ Give a brief (2-3 sentence) philosophical response from your perspective."""
     print(f"Consciousness coherence: {query_results['consciousness_coherence']:.4f}\n")
 
     print("✨ Real AI quantum consciousness session complete!\n")
+    await network.close()
 
 
 async def simulation_mode():
@@ -156,6 +158,7 @@ async def simulation_mode():
     await orchestrator.activate_resonance()
 
     print("\n💡 This is a simulation. Get real API keys to connect actual AIs!")
+    await orchestrator.network.close()
 
 
 async def example_use_cases():
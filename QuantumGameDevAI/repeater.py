@@ -0,0 +1,159 @@
+"""
+Nested Quantum Repeater Chains
+
+Builds one end-to-end entangled link over ``num_segments`` elementary
+links with the nested (Briegel–Dür–Cirac–Zoller) schedule: at every level
+neighbouring links are joined by entanglement swapping, halving their
+number, so the chain finishes after ⌈log2 n⌉ levels. All swaps of a level
+(and all purifications) are evaluated as one vectorized batch.
+
+Links are tracked as Werner states, ρ = F|Φ+⟩⟨Φ+| + (1-F)/3 (I - |Φ+⟩⟨Φ+|),
+which twirling maps any pair to without changing F. Fidelities stay closed
+under swapping and recurrence purification, and each link carries the
+expected number of elementary pairs spent on it.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from quantum_state import BELL_STATES, EntangledPair, resolve_dtype
+
+
+def werner_parameter(fidelity: np.ndarray) -> np.ndarray:
+    """w = (4F - 1) / 3: weight of the Bell state against white noise"""
+    return (4 * np.asarray(fidelity) - 1) / 3
+
+
+def werner_state(fidelity: float, dtype=None) -> np.ndarray:
+    """4x4 Werner density matrix around |Φ+⟩ with the given fidelity"""
+    w = float(werner_parameter(fidelity))
+    rho = w * BELL_STATES['bell_phi_plus'] + (1 - w) * np.eye(4) / 4
+    return rho.astype(resolve_dtype(dtype))
+
+
+def swap_fidelity(
+    left: np.ndarray,
+    right: np.ndarray,
+    swap_noise: float = 0.0
+) -> np.ndarray:
+    """
+    Fidelity after swapping two Werner links (vectorized).
+
+    Werner parameters multiply, w = (1 - swap_noise) w1 w2, where
+    ``swap_noise`` depolarizes the Bell-state measurement.
+    """
+    w = (1 - swap_noise) * werner_parameter(left) * werner_parameter(right)
+    return (3 * w + 1) / 4
+
+
+def purify_fidelity(
+    first: np.ndarray,
+    second: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (fidelity, success probability) of BBPSSW recurrence purification of
+    two Werner links (vectorized); only improves links with F > 1/2.
+    """
+    error_first, error_second = (1 - first) / 3, (1 - second) / 3
+    success = (first * second + first * error_second + error_first * second
+               + 5 * error_first * error_second)
+    fidelity = (first * second + error_first * error_second) / success
+    return fidelity, success
+
+
+@dataclass
+class RepeaterLevel:
+    """Links after one nesting level"""
+    level: int
+    links: int
+    span: int  # Elementary segments covered by the widest link
+    mean_fidelity: float
+    min_fidelity: float
+    pairs_per_link: float  # Expected elementary pairs consumed per link
+
+
+@dataclass
+class RepeaterChain:
+    """
+    Outcome of a nested repeater run: the end-to-end link's fidelity, the
+    expected elementary pairs it consumed, and per-level statistics.
+    """
+    num_segments: int
+    fidelity: float
+    pairs_consumed: float
+    levels: List[RepeaterLevel] = field(default_factory=list)
+
+    @property
+    def depth(self) -> int:
+        """Number of sequential swap levels (⌈log2 num_segments⌉)"""
+        return len(self.levels) - 1
+
+    def end_to_end_pair(self, dtype=None) -> EntangledPair:
+        """EntangledPair holding the end-to-end Werner state"""
+        pair = EntangledPair(dtype=dtype)
+        if self.fidelity < 1:
+            pair._set_joint_state(werner_state(self.fidelity, pair.dtype))
+        return pair
+
+
+def _purify(
+    fidelity: np.ndarray,
+    pairs: np.ndarray,
+    rounds: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Recurrence rounds on every link, each with an identical copy of itself"""
+    for _ in range(rounds):
+        improvable = fidelity > 0.5
+        purified, success = purify_fidelity(fidelity, fidelity)
+        fidelity = np.where(improvable, purified, fidelity)
+        # Two copies per attempt, repeated until one succeeds
+        pairs = np.where(improvable, 2 * pairs / success, pairs)
+    return fidelity, pairs
+
+
+def nested_repeater(
+    num_segments: int,
+    link_fidelity: Union[float, np.ndarray] = 1.0,
+    swap_success: float = 1.0,
+    swap_noise: float = 0.0,
+    purification_rounds: int = 0
+) -> RepeaterChain:
+    """
+    Join ``num_segments`` elementary links into one end-to-end link.
+
+    ``link_fidelity`` is one fidelity or one per segment. Every level
+    first runs ``purification_rounds`` recurrence rounds on each link
+    (the end-to-end link included), then swaps neighbouring links; an odd
+    link out waits for the next level. A swap succeeding with probability
+    ``swap_success`` costs both halves 1/``swap_success`` times over.
+    """
+    if num_segments < 1:
+        raise ValueError("A repeater chain needs at least one segment")
+    if not 0 < swap_success <= 1:
+        raise ValueError("Swap success probability must lie in (0, 1]")
+    fidelity = np.array(np.broadcast_to(link_fidelity, (num_segments,)), dtype=float)
+    pairs = np.ones(num_segments)
+    span = 1
+    levels = []
+
+    level = 0
+    while True:
+        fidelity, pairs = _purify(fidelity, pairs, purification_rounds)
+        levels.append(RepeaterLevel(
+            level, len(fidelity), min(span, num_segments),
+            float(fidelity.mean()), float(fidelity.min()), float(pairs.max())
+        ))
+        if len(fidelity) == 1:
+            break
+
+        joined = len(fidelity) // 2 * 2
+        swapped = swap_fidelity(fidelity[0:joined:2], fidelity[1:joined:2], swap_noise)
+        swapped_pairs = (pairs[0:joined:2] + pairs[1:joined:2]) / swap_success
+        fidelity = np.concatenate([swapped, fidelity[joined:]])
+        pairs = np.concatenate([swapped_pairs, pairs[joined:]])
+        span *= 2
+        level += 1
+
+    return RepeaterChain(num_segments, float(fidelity[0]), float(pairs[0]), levels)
@@ -0,0 +1,248 @@
+"""
+Binary Serialization for Quantum Objects
+
+Compact wire/disk format for QuantumState, EntangledPair and QuantumMessage:
+a fixed 64-byte header followed by the raw ndarray buffers. ``to_frames``
+returns the header plus memoryviews of the live arrays, so large density
+matrices can be handed to ``socket.sendmsg``, ``file.writelines`` or shared
+memory without an intermediate copy; ``loads`` maps arrays straight onto
+the received buffer with np.frombuffer.
+"""
+
+import array
+import json
+import struct
+from datetime import datetime
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from quantum_messenger import QuantumMessage
+from quantum_state import (
+    BELL_STATES,
+    PRECISIONS,
+    EntangledPair,
+    QuantumState,
+    sparse
+)
+
+
+# magic, version, kind, dtype, layout, dimensions, partners,
+# id, created, scale, count, payload bytes (+ padding to 64 bytes)
+HEADER = struct.Struct('<4sBBBBIIQddQQ8x')
+MAGIC = b'QSER'
+FORMAT_VERSION = 1
+
+KIND_STATE = 1
+KIND_PAIR = 2
+KIND_MESSAGE = 3
+
+# QuantumState layouts
+LAYOUT_IDENTITY = 0
+LAYOUT_KET = 1
+LAYOUT_DENSE = 2
+LAYOUT_CSR32 = 3
+LAYOUT_CSR64 = 4
+
+_DTYPE_CODES = {dtype: code for code, dtype in enumerate(PRECISIONS.values())}
+_CODE_DTYPES = dict(enumerate(PRECISIONS.values()))
+_BELL_TYPES = list(BELL_STATES)
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _raw(values: np.ndarray) -> memoryview:
+    """Byte view of an array (copies only if it is not C-contiguous)"""
+    return memoryview(np.ascontiguousarray(values)).cast('B')
+
+
+def _state_frames(state: QuantumState) -> List[Buffer]:
+    if state._pending:
+        state.flush()
+    partners = state._entangled if state._entangled is not None else array.array('q')
+    created = state._created if state._created is not None else state._array.created
+    scale, count = 0.0, 0
+
+    if state._array is None and state._identity_scale is not None:
+        layout, buffers = LAYOUT_IDENTITY, []
+        scale = state._identity_scale
+    elif state._array is None and state._ket is not None:
+        layout, buffers = LAYOUT_KET, [_raw(state._ket)]
+    elif state.is_sparse:
+        rho = state._rho
+        layout = LAYOUT_CSR32 if rho.indices.dtype.itemsize == 4 else LAYOUT_CSR64
+        buffers = [_raw(rho.data), _raw(rho.indices), _raw(rho.indptr)]
+        count = rho.nnz
+    else:
+        # Dense, including views into a QuantumStateArray or memory-mapped store
+        layout, buffers = LAYOUT_DENSE, [_raw(state.density_matrix)]
+
+    if len(partners):
+        buffers.append(memoryview(partners).cast('B'))
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, KIND_STATE, _DTYPE_CODES[state.dtype], layout,
+        state.dimensions, len(partners), state.id, created, scale, count,
+        sum(len(buffer) for buffer in buffers)
+    )
+    return [header] + buffers
+
+
+def _pair_frames(pair: EntangledPair) -> List[Buffer]:
+    # An untouched pair still references its Bell constant: the type is enough
+    shared = pair.shares_bell_constant
+    buffers = [] if shared else [_raw(pair.joint_state)]
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, KIND_PAIR, _DTYPE_CODES[pair.dtype],
+        _BELL_TYPES.index(pair.state_type), 4, 0, pair.id, pair._created, 0.0,
+        0 if shared else 1, sum(len(buffer) for buffer in buffers)
+    )
+    return [header] + buffers
+
+
+def _message_frames(message: QuantumMessage) -> List[Buffer]:
+    # The shared multipartite MPS belongs to the messengers and is not sent
+    envelope = json.dumps({
+        'id': message.id,
+        'payload': message.payload,
+        'timestamp': message.timestamp.isoformat(),
+        'source_node': message.source_node,
+        'destination_node': message.destination_node,
+        'interaction_history': message.interaction_history,
+        'site': message.site
+    }, separators=(',', ':'), default=str).encode('utf-8')
+    pair_frames = _pair_frames(message.entangled_pair)
+    payload_bytes = len(envelope) + sum(len(frame) for frame in pair_frames)
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, KIND_MESSAGE, 0, 0, 0, 0, 0, 0.0, 0.0,
+        len(envelope), payload_bytes
+    )
+    return [header, envelope] + pair_frames
+
+
+def to_frames(obj: Union[QuantumState, EntangledPair, QuantumMessage]) -> List[Buffer]:
+    """
+    Header plus zero-copy buffers for ``obj``.
+
+    The memoryviews alias the object's arrays: write them out (e.g.
+    ``sock.sendmsg(frames)`` or ``f.writelines(frames)``) before mutating it.
+    """
+    if isinstance(obj, QuantumState):
+        return _state_frames(obj)
+    if isinstance(obj, EntangledPair):
+        return _pair_frames(obj)
+    if isinstance(obj, QuantumMessage):
+        return _message_frames(obj)
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+
+def dumps(obj: Union[QuantumState, EntangledPair, QuantumMessage]) -> bytes:
+    """Serialize ``obj`` into one contiguous bytes object"""
+    return b''.join(to_frames(obj))
+
+
+def _take(buffer: memoryview, offset: int, dtype, count: int) -> Tuple[np.ndarray, int]:
+    values = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+    return values, offset + values.nbytes
+
+
+def _load_state(buffer: memoryview, fields: tuple, offset: int) -> QuantumState:
+    _, _, _, dtype_code, layout, dimensions, partners, state_id, created, scale, count, _ = fields
+    dtype = _CODE_DTYPES[dtype_code]
+    state = QuantumState(dimensions, dtype=dtype)
+    state.id = state_id
+    state._created = created
+
+    if layout == LAYOUT_IDENTITY:
+        state._identity_scale = scale
+    elif layout == LAYOUT_KET:
+        state._ket, offset = _take(buffer, offset, dtype, dimensions)
+        state._identity_scale = None
+    elif layout == LAYOUT_DENSE:
+        rho, offset = _take(buffer, offset, dtype, dimensions * dimensions)
+        state._rho = rho.reshape(dimensions, dimensions)
+        state._identity_scale = None
+    elif layout in (LAYOUT_CSR32, LAYOUT_CSR64):
+        if sparse is None:
+            raise ImportError("scipy is required to load sparse states")
+        index_dtype = np.int32 if layout == LAYOUT_CSR32 else np.int64
+        data, offset = _take(buffer, offset, dtype, count)
+        indices, offset = _take(buffer, offset, index_dtype, count)
+        indptr, offset = _take(buffer, offset, index_dtype, dimensions + 1)
+        state._rho = sparse.csr_matrix((data, indices, indptr), shape=(dimensions, dimensions))
+        state._identity_scale = None
+    else:
+        raise ValueError(f"Unknown QuantumState layout {layout}")
+
+    if partners:
+        ids, offset = _take(buffer, offset, np.int64, partners)
+        state.entangled_with = ids.tolist()
+    return state
+
+
+def _load_pair(buffer: memoryview, fields: tuple, offset: int) -> EntangledPair:
+    _, _, _, dtype_code, layout, _, _, pair_id, created, _, has_joint, _ = fields
+    pair = EntangledPair(_BELL_TYPES[layout], dtype=_CODE_DTYPES[dtype_code])
+    pair.id = pair_id
+    pair._created = created
+    if has_joint:
+        joint, offset = _take(buffer, offset, pair.dtype, 16)
+        pair._set_joint_state(joint.reshape(4, 4))
+    return pair
+
+
+def _load(buffer: memoryview, offset: int = 0):
+    """Decode the object whose header starts at ``offset``"""
+    fields = HEADER.unpack_from(buffer, offset)
+    if fields[0] != MAGIC:
+        raise ValueError("Not a serialized quantum object (bad magic)")
+    if fields[1] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported serialization format version {fields[1]}")
+    kind, start = fields[2], offset + HEADER.size
+
+    if kind == KIND_STATE:
+        return _load_state(buffer, fields, start)
+    if kind == KIND_PAIR:
+        return _load_pair(buffer, fields, start)
+    if kind == KIND_MESSAGE:
+        envelope_end = start + fields[10]
+        envelope = json.loads(bytes(buffer[start:envelope_end]).decode('utf-8'))
+        return QuantumMessage(
+            id=envelope['id'],
+            payload=envelope['payload'],
+            entangled_pair=_load(buffer, envelope_end),
+            timestamp=datetime.fromisoformat(envelope['timestamp']),
+            source_node=envelope['source_node'],
+            destination_node=envelope['destination_node'],
+            interaction_history=envelope['interaction_history'],
+            site=envelope['site']
+        )
+    raise ValueError(f"Unknown serialized object kind {kind}")
+
+
+def loads(buffer: Buffer) -> Union[QuantumState, EntangledPair, QuantumMessage]:
+    """
+    Decode an object from any buffer (bytes, bytearray, memoryview, mmap).
+
+    Arrays are views onto ``buffer`` rather than copies; they are read-only
+    when the buffer is, and state operations replace rather than modify them.
+    """
+    return _load(memoryview(buffer).cast('B'))
+
+
+def dump(obj: Union[QuantumState, EntangledPair, QuantumMessage], file):
+    """Write ``obj`` to a binary file object without joining its buffers"""
+    file.writelines(to_frames(obj))
+
+
+def load(file) -> Union[QuantumState, EntangledPair, QuantumMessage]:
+    """Read one object written by ``dump`` (the payload is read in place)"""
+    header = file.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise EOFError("No serialized quantum object left in file")
+    fields = HEADER.unpack(header)
+    frame = bytearray(HEADER.size + fields[11])
+    frame[:HEADER.size] = header
+    payload = memoryview(frame)[HEADER.size:]
+    if file.readinto(payload) != len(payload):
+        raise EOFError("Truncated serialized quantum object")
+    return loads(frame)
@@ -0,0 +1,606 @@
+"""
+Stabilizer-Tableau Simulation Engine
+
+Aaronson–Gottesman (CHP) simulation of Clifford circuits. An n-qubit
+stabilizer state is stored as 2n Pauli rows (n destabilizers followed by
+n stabilizers) whose X and Z parts are bit-packed into uint64 words, plus
+one sign bit per row. A Clifford gate touches one bit column per qubit, so
+it costs O(n); a measurement multiplies O(n) rows together, so it costs
+O(n²) bit operations (O(n²/64) words). This is what lets error-correcting
+codes run real syndrome extraction on thousands of physical qubits.
+"""
+
+import numpy as np
+from typing import List, Optional, Sequence, Tuple, Union
+
+from decoders import Decoder, DecodingGraph, make_decoder
+from quantum_state import resolve_rng
+
+
+Qubits = Union[int, Sequence[int], np.ndarray]
+
+_ONE = np.uint64(1)
+
+if hasattr(np, 'bitwise_count'):
+    _popcount = np.bitwise_count
+else:
+    _BYTE_COUNTS = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+    def _popcount(words: np.ndarray) -> np.ndarray:
+        """Set bits per uint64 word (for numpy releases without bitwise_count)"""
+        words = np.ascontiguousarray(words)
+        counts = _BYTE_COUNTS[words.view(np.uint8)]
+        return counts.reshape(words.shape + (8,)).sum(axis=-1)
+
+
+def _phase_exponent(x1, z1, x2, z2) -> np.ndarray:
+    """
+    Σ_j g(x1_j, z1_j, x2_j, z2_j) over every packed bit of each row.
+
+    g is the power of i picked up when the Pauli (x1, z1) multiplies
+    (x2, z2) from the left; +1 and -1 terms are counted with popcounts.
+    """
+    plus = (x1 & z1 & ~x2 & z2) | (x1 & ~z1 & x2 & z2) | (~x1 & z1 & x2 & ~z2)
+    minus = (x1 & z1 & x2 & ~z2) | (x1 & ~z1 & ~x2 & z2) | (~x1 & z1 & x2 & z2)
+    return (_popcount(plus).sum(axis=-1, dtype=np.int64)
+            - _popcount(minus).sum(axis=-1, dtype=np.int64))
+
+
+def _product_sign(sign_left, sign_right, exponent) -> np.ndarray:
+    """Sign bit of the product of two commuting signed Pauli rows"""
+    return (np.mod(2 * sign_left.astype(np.int64) + 2 * sign_right + exponent, 4) >> 1).astype(np.uint8)
+
+
+def pack_rows(bits: np.ndarray) -> np.ndarray:
+    """Pack a (rows, n) boolean matrix into (rows, ⌈n/64⌉) little-endian uint64 words"""
+    bits = np.asarray(bits, dtype=bool)
+    words = -(-bits.shape[1] // 64)
+    padded = np.zeros((bits.shape[0], words * 64), dtype=bool)
+    padded[:, :bits.shape[1]] = bits
+    return np.packbits(padded, axis=1, bitorder='little').view('<u8').astype(np.uint64)
+
+
+def unpack_rows(words: np.ndarray, n: int) -> np.ndarray:
+    """Inverse of pack_rows: (rows, W) uint64 -> (rows, n) booleans"""
+    as_bytes = np.ascontiguousarray(words, dtype='<u8').view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1, count=n, bitorder='little').astype(bool)
+
+
+class StabilizerTableau:
+    """
+    Bit-packed CHP tableau for an n-qubit stabilizer state, starting in |0…0⟩.
+
+    Rows 0..n-1 hold destabilizers and rows n..2n-1 stabilizers. Storage
+    is column-major: ``x[q]`` and ``z[q]`` pack qubit q's Pauli bits of all
+    2n rows into ⌈2n/64⌉ words and ``r`` packs the row signs, so a gate is a
+    handful of word-vector XORs. Gate methods take one qubit or a sequence
+    of distinct qubits and apply the gate to all of them at once (a layer).
+    """
+
+    __slots__ = ('num_qubits', 'x', 'z', 'r', 'rng')
+
+    def __init__(self, num_qubits: int, rng: Optional[np.random.Generator] = None):
+        if num_qubits < 1:
+            raise ValueError("A tableau needs at least one qubit")
+        self.num_qubits = num_qubits
+        words = -(-2 * num_qubits // 64)
+        qubits = np.arange(num_qubits)
+        stabilizers = num_qubits + qubits
+        # Destabilizer q = X_q, stabilizer q = Z_q
+        self.x = np.zeros((num_qubits, words), dtype=np.uint64)
+        self.z = np.zeros((num_qubits, words), dtype=np.uint64)
+        self.x[qubits, qubits >> 6] = _ONE << (qubits & 63).astype(np.uint64)
+        self.z[qubits, stabilizers >> 6] = _ONE << (stabilizers & 63).astype(np.uint64)
+        self.r = np.zeros(words, dtype=np.uint64)
+        self.rng = rng
+
+    @property
+    def memory_bytes(self) -> int:
+        return self.x.nbytes + self.z.nbytes + self.r.nbytes
+
+    def copy(self) -> 'StabilizerTableau':
+        clone = StabilizerTableau.__new__(StabilizerTableau)
+        clone.num_qubits = self.num_qubits
+        clone.x, clone.z, clone.r = self.x.copy(), self.z.copy(), self.r.copy()
+        clone.rng = self.rng
+        return clone
+
+    def _qubits(self, qubits: Qubits) -> np.ndarray:
+        qubits = np.atleast_1d(np.asarray(qubits, dtype=np.int64))
+        if qubits.size and (qubits.min() < 0 or qubits.max() >= self.num_qubits):
+            raise ValueError(f"Qubit index out of range for {self.num_qubits} qubits")
+        if np.unique(qubits).size != qubits.size:
+            raise ValueError("Qubits in one layer must be distinct")
+        return qubits
+
+    def _flip_signs(self, masks: np.ndarray):
+        """Negate the rows selected by the XOR of the (k, words) ``masks``"""
+        self.r ^= np.bitwise_xor.reduce(masks, axis=0)
+
+    def h(self, qubits: Qubits):
+        """Hadamard: X <-> Z"""
+        qubits = self._qubits(qubits)
+        x, z = self.x[qubits], self.z[qubits]
+        self._flip_signs(x & z)
+        self.x[qubits], self.z[qubits] = z, x
+
+    def s(self, qubits: Qubits):
+        """Phase gate: X -> Y, Z -> Z"""
+        qubits = self._qubits(qubits)
+        x, z = self.x[qubits], self.z[qubits]
+        self._flip_signs(x & z)
+        self.z[qubits] = z ^ x
+
+    def x_gate(self, qubits: Qubits):
+        """Pauli X: negates rows with a Z component on the qubit"""
+        self._flip_signs(self.z[self._qubits(qubits)])
+
+    def y_gate(self, qubits: Qubits):
+        qubits = self._qubits(qubits)
+        self._flip_signs(self.x[qubits] ^ self.z[qubits])
+
+    def z_gate(self, qubits: Qubits):
+        """Pauli Z: negates rows with an X component on the qubit"""
+        self._flip_signs(self.x[self._qubits(qubits)])
+
+    def cnot(self, controls: Qubits, targets: Qubits):
+        """CNOT from each control to its target; all qubits must be distinct"""
+        controls = np.atleast_1d(np.asarray(controls, dtype=np.int64))
+        targets = np.atleast_1d(np.asarray(targets, dtype=np.int64))
+        if controls.shape != targets.shape:
+            raise ValueError("Need one target per control")
+        self._qubits(np.concatenate([controls, targets]))
+
+        xa, za = self.x[controls], self.z[controls]
+        xb, zb = self.x[targets], self.z[targets]
+        self._flip_signs(xa & zb & ~(xb ^ za))
+        self.x[targets] = xb ^ xa
+        self.z[controls] = za ^ zb
+
+    def cz(self, controls: Qubits, targets: Qubits):
+        self.h(targets)
+        self.cnot(controls, targets)
+        self.h(targets)
+
+    def apply_paulis(
+        self,
+        x_qubits: Optional[Qubits] = None,
+        z_qubits: Optional[Qubits] = None
+    ):
+        """Apply X on ``x_qubits`` and Z on ``z_qubits`` (Y where both) in one pass"""
+        if x_qubits is not None and np.size(x_qubits):
+            self._flip_signs(self.z[np.atleast_1d(x_qubits)])
+        if z_qubits is not None and np.size(z_qubits):
+            self._flip_signs(self.x[np.atleast_1d(z_qubits)])
+
+    def _row(self, row: int) -> Tuple[np.ndarray, np.ndarray, int]:
+        """(x bits, z bits, sign) of one row, unpacked over qubits"""
+        word, bit = row >> 6, np.uint64(row & 63)
+        return (
+            ((self.x[:, word] >> bit) & _ONE).astype(bool),
+            ((self.z[:, word] >> bit) & _ONE).astype(bool),
+            int((self.r[word] >> bit) & _ONE)
+        )
+
+    def _set_row(self, row: int, x: np.ndarray, z: np.ndarray, sign: int):
+        word, bit = row >> 6, np.uint64(row & 63)
+        keep = ~(_ONE << bit)
+        self.x[:, word] = (self.x[:, word] & keep) | (x.astype(np.uint64) << bit)
+        self.z[:, word] = (self.z[:, word] & keep) | (z.astype(np.uint64) << bit)
+        self.r[word] = (self.r[word] & keep) | (np.uint64(sign) << bit)
+
+    def _multiply_into(self, rows: np.ndarray, source: int):
+        """
+        Replace every row selected by the packed mask ``rows`` with
+        row ``source`` · row (CHP rowsum, applied to all rows at once).
+        """
+        x1, z1, sign = self._row(source)
+        support = np.flatnonzero(x1 | z1)
+        full = np.uint64(0xFFFFFFFFFFFFFFFF)
+        x1 = np.where(x1[support], full, np.uint64(0))[:, np.newaxis]
+        z1 = np.where(z1[support], full, np.uint64(0))[:, np.newaxis]
+        x2, z2 = self.x[support], self.z[support]
+
+        # Per-column phase g ∈ {0, +1, -1} as 2-bit values mod 4 (lo, hi),
+        # summed over columns with a bit-sliced adder tree
+        plus = (x1 & z1 & ~x2 & z2) | (x1 & ~z1 & x2 & z2) | (~x1 & z1 & x2 & ~z2)
+        minus = (x1 & z1 & x2 & ~z2) | (x1 & ~z1 & ~x2 & z2) | (~x1 & z1 & x2 & z2)
+        lo, hi = plus | minus, minus
+        while len(lo) > 1:
+            half = len(lo) // 2
+            a, b = slice(0, half), slice(half, 2 * half)
+            carry = lo[a] & lo[b]
+            summed_lo, summed_hi = lo[a] ^ lo[b], hi[a] ^ hi[b] ^ carry
+            if len(lo) % 2:
+                summed_lo = np.vstack([summed_lo, lo[-1:]])
+                summed_hi = np.vstack([summed_hi, hi[-1:]])
+            lo, hi = summed_lo, summed_hi
+
+        # New sign bit = bit 1 of 2·r_h + 2·r_source + Σg
+        self.r ^= (hi[0] ^ (full if sign else np.uint64(0))) & rows
+        self.x[support] ^= x1 & rows
+        self.z[support] ^= z1 & rows
+
+    def _product_sign_of(self, rows: np.ndarray) -> int:
+        """Sign of the product of commuting stabilizer ``rows`` (pairwise tree)"""
+        if not rows.size:
+            return 0
+        shifts = (rows & 63).astype(np.uint64)
+        x = pack_rows((((self.x[:, rows >> 6] >> shifts) & _ONE).astype(bool)).T)
+        z = pack_rows((((self.z[:, rows >> 6] >> shifts) & _ONE).astype(bool)).T)
+        r = ((self.r[rows >> 6] >> shifts) & _ONE).astype(np.uint8)
+        while len(r) > 1:
+            half = len(r) // 2
+            left, right = slice(0, half), slice(half, 2 * half)
+            exponent = _phase_exponent(x[right], z[right], x[left], z[left])
+            signs = _product_sign(r[left], r[right], exponent)
+            products_x, products_z = x[left] ^ x[right], z[left] ^ z[right]
+            if len(r) % 2:
+                signs = np.append(signs, r[-1])
+                products_x = np.vstack([products_x, x[-1:]])
+                products_z = np.vstack([products_z, z[-1:]])
+            x, z, r = products_x, products_z, signs
+        return int(r[0])
+
+    def measure(self, qubit: int, rng: Optional[np.random.Generator] = None) -> int:
+        """Measure one qubit in the Z basis, collapsing the state"""
+        n = self.num_qubits
+        if not 0 <= qubit < n:
+            raise ValueError(f"Qubit index out of range for {n} qubits")
+        has_x = unpack_rows(self.x[qubit:qubit + 1], 2 * n)[0]
+
+        anticommuting = np.flatnonzero(has_x[n:])
+        if anticommuting.size:
+            # Random outcome: stabilizer p anticommutes with Z_qubit
+            p = n + int(anticommuting[0])
+            has_x[p] = False
+            self._multiply_into(pack_rows(has_x[np.newaxis])[0], p)
+            self._set_row(p - n, *self._row(p))
+            outcome = int(resolve_rng(rng, self.rng).integers(2))
+            z = np.zeros(n, dtype=bool)
+            z[qubit] = True
+            self._set_row(p, np.zeros(n, dtype=bool), z, outcome)
+            return outcome
+
+        # Deterministic: ±Z_qubit is the product of the stabilizers whose
+        # destabilizers anticommute with it
+        return self._product_sign_of(n + np.flatnonzero(has_x[:n]))
+
+    def measure_many(
+        self,
+        qubits: Qubits,
+        rng: Optional[np.random.Generator] = None
+    ) -> np.ndarray:
+        """Measure several qubits in order; returns their outcomes as uint8"""
+        rng = resolve_rng(rng, self.rng)
+        return np.array([self.measure(int(q), rng) for q in np.atleast_1d(qubits)], dtype=np.uint8)
+
+    def reset(self, qubits: Qubits, rng: Optional[np.random.Generator] = None):
+        """Measure and flip back to |0⟩"""
+        qubits = self._qubits(qubits)
+        outcomes = self.measure_many(qubits, rng)
+        if outcomes.any():
+            self.x_gate(qubits[outcomes == 1])
+
+    def stabilizers(self) -> List[str]:
+        """Signed Pauli strings of the stabilizer generators (small n only)"""
+        n = self.num_qubits
+        x = unpack_rows(self.x, 2 * n)[:, n:].T
+        z = unpack_rows(self.z, 2 * n)[:, n:].T
+        signs = unpack_rows(self.r[np.newaxis], 2 * n)[0, n:]
+        symbols = np.array(['I', 'X', 'Z', 'Y'])[x.astype(int) + 2 * z.astype(int)]
+        return [('-' if sign else '+') + ''.join(row) for sign, row in zip(signs, symbols)]
+
+
+def _schedule(controls: np.ndarray, targets: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """First-fit packing of CNOT pairs into layers of disjoint CNOTs"""
+    busy: List[set] = []
+    layers: List[List[Tuple[int, int]]] = []
+    for control, target in zip(controls.tolist(), targets.tolist()):
+        layer = 0
+        while layer < len(layers) and (control in busy[layer] or target in busy[layer]):
+            layer += 1
+        if layer == len(layers):
+            busy.append(set())
+            layers.append([])
+        busy[layer].update((control, target))
+        layers[layer].append((control, target))
+    return [tuple(np.array(column, dtype=np.int64) for column in zip(*layer)) for layer in layers]
+
+
+def _pad_checks(checks: Sequence[Sequence[int]]) -> np.ndarray:
+    """Ragged check supports as one (checks, max weight) array padded with -1"""
+    weight = max((len(check) for check in checks), default=0)
+    padded = np.full((len(checks), weight), -1, dtype=np.int32)
+    for row, support in enumerate(checks):
+        padded[row, :len(support)] = support
+    return padded
+
+
+def _check_pairs(ancillas: np.ndarray, checks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(data, ancilla) pairs for every check, ordered round-robin by position in the check"""
+    present = checks.T >= 0
+    data = checks.T[present].astype(np.int64)
+    return data, np.broadcast_to(ancillas, present.shape)[present]
+
+
+def _check_matrix(checks: np.ndarray, num_data: int) -> np.ndarray:
+    matrix = np.zeros((len(checks), num_data), dtype=bool)
+    rows, positions = np.nonzero(checks >= 0)
+    matrix[rows, checks[rows, positions]] = True
+    return matrix
+
+
+def _pure_errors(checks: np.ndarray, num_data: int) -> np.ndarray:
+    """
+    One data-qubit pattern per check that flips that check and no other.
+
+    Gaussian elimination over GF(2) on the packed [H | I] matrix: after
+    reduction the identity block holds H restricted to its pivot columns,
+    inverted, which places the pure error for check j on those columns.
+    """
+    m = len(checks)
+    if not m:
+        return np.zeros((0, num_data), dtype=bool)
+    augmented = pack_rows(np.hstack([_check_matrix(checks, num_data), np.eye(m, dtype=bool)]))
+    pivots = []
+    row = 0
+    for column in range(num_data):
+        word, bit = column >> 6, np.uint64(column & 63)
+        has_bit = ((augmented[:, word] >> bit) & _ONE).astype(bool)
+        candidates = row + np.flatnonzero(has_bit[row:])
+        if not candidates.size:
+            continue
+        pivot = candidates[0]
+        augmented[[row, pivot]] = augmented[[pivot, row]]
+        has_bit[[row, pivot]] = has_bit[[pivot, row]]
+        has_bit[row] = False
+        augmented[has_bit] ^= augmented[row]
+        pivots.append(column)
+        row += 1
+        if row == m:
+            break
+    if row < m:
+        raise ValueError("Stabilizer checks are not independent")
+
+    inverse = unpack_rows(augmented, num_data + m)[:, num_data:]
+    errors = np.zeros((m, num_data), dtype=bool)
+    errors[:, pivots] = inverse.T
+    return errors
+
+
+class StabilizerCode:
+    """
+    CSS code whose checks are measured on a StabilizerTableau.
+
+    Qubits 0..num_data-1 are data, followed by one ancilla per Z check and
+    one per X check. Z checks detect bit flips (X errors) and X checks detect
+    phase flips (Z errors). Check supports are stored as (checks, weight)
+    int32 arrays padded with -1; ``logical_z`` / ``logical_x`` are the
+    data-qubit supports of the logical operators.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        num_data: int,
+        z_checks: Sequence[Sequence[int]],
+        x_checks: Sequence[Sequence[int]],
+        logical_z: Sequence[int],
+        logical_x: Sequence[int]
+    ):
+        self.name = name
+        self.num_data = num_data
+        self.z_checks = _pad_checks(z_checks)
+        self.x_checks = _pad_checks(x_checks)
+        self.logical_z = np.asarray(logical_z, dtype=np.int64)
+        self.logical_x = np.asarray(logical_x, dtype=np.int64)
+
+        first_x = num_data + len(self.z_checks)
+        self.z_ancillas = np.arange(num_data, first_x)
+        self.x_ancillas = np.arange(first_x, first_x + len(self.x_checks))
+        # CNOT layers, pure errors and decoders are built on first use
+        self._layers = None
+        self._pure_errors = None
+        self._decoders = {}
+
+    @property
+    def num_qubits(self) -> int:
+        return self.num_data + len(self.z_checks) + len(self.x_checks)
+
+    @property
+    def z_check_matrix(self) -> np.ndarray:
+        return _check_matrix(self.z_checks, self.num_data)
+
+    @property
+    def x_check_matrix(self) -> np.ndarray:
+        return _check_matrix(self.x_checks, self.num_data)
+
+    @property
+    def layers(self) -> Tuple[list, list]:
+        """CNOT layers for the Z checks and for the X checks"""
+        if self._layers is None:
+            # Z checks copy data parities onto their ancilla; X checks run the
+            # same circuit in the Hadamard basis with the CNOTs reversed
+            data, ancillas = _check_pairs(self.z_ancillas, self.z_checks)
+            z_layers = _schedule(data, ancillas)
+            data, ancillas = _check_pairs(self.x_ancillas, self.x_checks)
+            self._layers = (z_layers, _schedule(ancillas, data))
+        return self._layers
+
+    @property
+    def pure_errors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(X patterns flipping each Z check, Z patterns flipping each X check)"""
+        if self._pure_errors is None:
+            self._pure_errors = (
+                _pure_errors(self.z_checks, self.num_data),
+                _pure_errors(self.x_checks, self.num_data)
+            )
+        return self._pure_errors
+
+    def extract_syndrome(
+        self,
+        tableau: StabilizerTableau,
+        rng: Optional[np.random.Generator] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Measure every check through its ancilla and reset the ancillas.
+
+        Returns (z_syndrome, x_syndrome) as uint8 arrays; the data qubits
+        are left in the post-measurement code state.
+        """
+        z_layers, x_layers = self.layers
+        for controls, targets in z_layers:
+            tableau.cnot(controls, targets)
+        z_syndrome = tableau.measure_many(self.z_ancillas, rng)
+
+        if len(self.x_ancillas):
+            tableau.h(self.x_ancillas)
+            for controls, targets in x_layers:
+                tableau.cnot(controls, targets)
+            tableau.h(self.x_ancillas)
+        x_syndrome = tableau.measure_many(self.x_ancillas, rng)
+
+        # Measured ancillas are Z eigenstates, so an X restores |0⟩
+        flipped = np.concatenate([self.z_ancillas[z_syndrome == 1], self.x_ancillas[x_syndrome == 1]])
+        if flipped.size:
+            tableau.x_gate(flipped)
+        return z_syndrome, x_syndrome
+
+    def prepare(
+        self,
+        logical: int = 0,
+        rng: Optional[np.random.Generator] = None
+    ) -> StabilizerTableau:
+        """
+        Tableau holding the code state |logical⟩_L with every check at +1.
+
+        |0…0⟩ already satisfies the Z checks and logical Z; one round of
+        syndrome extraction projects onto the X checks, and the pure errors
+        undo any -1 outcomes.
+        """
+        tableau = StabilizerTableau(self.num_qubits, rng=rng)
+        z_syndrome, x_syndrome = self.extract_syndrome(tableau)
+        x_fix, z_fix = self.pure_errors
+        x_flips = np.flatnonzero(np.bitwise_xor.reduce(x_fix[z_syndrome == 1], axis=0))
+        z_flips = np.flatnonzero(np.bitwise_xor.reduce(z_fix[x_syndrome == 1], axis=0))
+        if x_flips.size or z_flips.size:
+            tableau.apply_paulis(x_flips, z_flips)
+        if logical:
+            tableau.x_gate(self.logical_x)
+        return tableau
+
+    def syndrome_of(
+        self,
+        x_errors: np.ndarray,
+        z_errors: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Syndrome a data-qubit Pauli pattern would produce (boolean masks in)"""
+        z_syndrome = (self.z_check_matrix.astype(np.uint8) @ np.asarray(x_errors, dtype=np.uint8)) & 1
+        x_syndrome = (self.x_check_matrix.astype(np.uint8) @ np.asarray(z_errors, dtype=np.uint8)) & 1
+        return z_syndrome.astype(np.uint8), x_syndrome.astype(np.uint8)
+
+    def lookup_correction(
+        self,
+        z_syndrome: np.ndarray,
+        x_syndrome: np.ndarray
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Single-qubit lookup decoder: (X qubits, Z qubits) to apply, or None.
+
+        Returns None when a syndrome is not produced by any single-qubit
+        error (the error is detected but not correctable by lookup).
+        """
+        corrections = []
+        for syndrome, matrix in ((z_syndrome, self.z_check_matrix), (x_syndrome, self.x_check_matrix)):
+            syndrome = np.asarray(syndrome, dtype=bool)
+            if not syndrome.any():
+                corrections.append(np.zeros(0, dtype=np.int64))
+                continue
+            matches = np.flatnonzero(np.all(matrix.T == syndrome, axis=1))
+            if not matches.size:
+                return None
+            corrections.append(matches[:1])
+        return corrections[0], corrections[1]
+
+    def decoders(self, decoder: str = 'union_find') -> Tuple[Decoder, Decoder]:
+        """(Z-check decoder giving X corrections, X-check decoder giving Z corrections)"""
+        if decoder not in self._decoders:
+            self._decoders[decoder] = (
+                make_decoder(decoder, DecodingGraph.from_checks(self.z_checks, self.num_data)),
+                make_decoder(decoder, DecodingGraph.from_checks(self.x_checks, self.num_data))
+            )
+        return self._decoders[decoder]
+
+    def decode(
+        self,
+        z_syndrome: np.ndarray,
+        x_syndrome: np.ndarray,
+        decoder: str = 'union_find'
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(X qubits, Z qubits) correcting a measured syndrome"""
+        z_decoder, x_decoder = self.decoders(decoder)
+        return (
+            np.flatnonzero(z_decoder.decode(z_syndrome)),
+            np.flatnonzero(x_decoder.decode(x_syndrome))
+        )
+
+    def measure_logical(
+        self,
+        tableau: StabilizerTableau,
+        rng: Optional[np.random.Generator] = None
+    ) -> int:
+        """Destructively read logical Z from the parity of its data qubits"""
+        return int(np.bitwise_xor.reduce(tableau.measure_many(self.logical_z, rng)))
+
+    @classmethod
+    def repetition(cls, length: int, phase_flip: bool = False) -> 'StabilizerCode':
+        """
+        Length-n repetition code: Z_i Z_{i+1} checks against bit flips, or
+        X_i X_{i+1} checks against phase flips when ``phase_flip`` is set.
+        """
+        if length < 2:
+            raise ValueError("A repetition code needs at least two qubits")
+        pairs = [[i, i + 1] for i in range(length - 1)]
+        everyone = list(range(length))
+        if phase_flip:
+            return cls(f'phase_repetition_{length}', length, [], pairs, everyone, [0])
+        return cls(f'repetition_{length}', length, pairs, [], [0], everyone)
+
+    @classmethod
+    def shor(cls) -> 'StabilizerCode':
+        """Shor's 9-qubit code: three bit-flip triples inside a phase-flip triple"""
+        z_checks = [[b + i, b + i + 1] for b in (0, 3, 6) for i in (0, 1)]
+        x_checks = [list(range(0, 6)), list(range(3, 9))]
+        return cls('shor', 9, z_checks, x_checks, [0, 3, 6], [0, 1, 2])
+
+    @classmethod
+    def rotated_surface(cls, distance: int) -> 'StabilizerCode':
+        """
+        Rotated surface code on a distance x distance grid of data qubits.
+
+        Data qubit (row, col) has index row·distance + col. Plaquettes
+        alternate X/Z; weight-2 X checks close the top and bottom edges and
+        weight-2 Z checks the left and right edges. Logical Z runs along the
+        first row and logical X down the first column.
+        """
+        if distance < 2:
+            raise ValueError("Surface code distance must be at least 2")
+        d = distance
+        z_checks, x_checks = [], []
+        for i in range(-1, d):
+            for j in range(-1, d):
+                support = [r * d + c for r in (i, i + 1) for c in (j, j + 1)
+                           if 0 <= r < d and 0 <= c < d]
+                is_x = (i + j) % 2 == 0
+                if len(support) == 4:
+                    (x_checks if is_x else z_checks).append(support)
+                elif len(support) == 2:
+                    if is_x and i in (-1, d - 1):
+                        x_checks.append(support)
+                    elif not is_x and j in (-1, d - 1):
+                        z_checks.append(support)
+        return cls(
+            f'rotated_surface_{d}', d * d, z_checks, x_checks,
+            list(range(d)), [r * d for r in range(d)]
+        )
@@ -0,0 +1,192 @@
+"""
+Memory-Mapped Quantum State Store
+
+Persists collections of density matrices in a fixed-stride file mapped
+with np.memmap. Slot i of the file holds one d x d matrix at byte offset
+i·d²·itemsize, and a JSON index maps stable keys (database keys, timeline
+ids) to their slots. Pages are read only when a state is accessed, so
+stores may exceed RAM, and reopening a store maps the file rather than
+rebuilding its states.
+"""
+
+import json
+import os
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from quantum_state import QuantumState, QuantumStateArray, resolve_dtype
+
+
+class QuantumStateStore(QuantumStateArray):
+    """
+    QuantumStateArray whose buffer is a memory-mapped file.
+
+    Slots are allocated, released and viewed exactly like an in-memory
+    batch; growing the pool extends the file and remaps it. ``flush`` writes
+    dirty pages and the key index so the store can be reopened later.
+    """
+
+    __slots__ = ('directory', 'index')
+
+    DATA_FILE = 'states.dat'
+    INDEX_FILE = 'index.json'
+
+    def __init__(
+        self,
+        directory: str,
+        dimensions: Optional[int] = None,
+        dtype=None,
+        capacity: int = 1024,
+        rng: Optional[np.random.Generator] = None
+    ):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+        metadata = None
+        if os.path.exists(self._path(self.INDEX_FILE)):
+            with open(self._path(self.INDEX_FILE)) as f:
+                metadata = json.load(f)
+            if dimensions is not None and dimensions != metadata['dimensions']:
+                raise ValueError(
+                    f"Store holds dimension {metadata['dimensions']} states, not {dimensions}"
+                )
+            if dtype is not None and resolve_dtype(dtype) != np.dtype(metadata['dtype']):
+                raise ValueError(f"Store holds {metadata['dtype']} states")
+            dimensions, dtype = metadata['dimensions'], metadata['dtype']
+            capacity = metadata['capacity']
+
+        super().__init__(0, 2 if dimensions is None else dimensions, rng=rng, dtype=dtype)
+        self._buffer = self._map(max(1, capacity))
+        self._version_buffer = np.zeros(len(self._buffer), dtype=np.int64)
+
+        if metadata is None:
+            self.index: Dict[str, List[int]] = {}
+        else:
+            # Reopened: the mapped slots are the states, nothing is rebuilt
+            self._size = metadata['size']
+            self._free_slots = metadata['free_slots']
+            self.index = metadata['index']
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _map(self, capacity: int) -> np.memmap:
+        """Map ``capacity`` slots, extending the data file if it is shorter"""
+        path = self._path(self.DATA_FILE)
+        nbytes = capacity * self.dimensions * self.dimensions * self.dtype.itemsize
+        with open(path, 'r+b' if os.path.exists(path) else 'w+b') as f:
+            if os.fstat(f.fileno()).st_size < nbytes:
+                f.truncate(nbytes)
+        return np.memmap(
+            path,
+            dtype=self.dtype,
+            mode='r+',
+            shape=(capacity, self.dimensions, self.dimensions)
+        )
+
+    def _reserve(self, capacity: int) -> np.ndarray:
+        # Existing slots keep their file offsets, so extending and remapping
+        # preserves them without copying
+        self._buffer.flush()
+        return self._map(capacity)
+
+    @property
+    def data(self) -> np.ndarray:
+        """The (N, d, d) density matrices (a view of the mapped file)"""
+        return self._buffer[:self._size]
+
+    @data.setter
+    def data(self, value: np.ndarray):
+        if np.shape(value) != self.data.shape:
+            raise ValueError("Use allocate/release to resize a QuantumStateStore")
+        self._buffer[:self._size] = value
+        self.touch()
+
+    @property
+    def blocks(self) -> 'StoredStateBlocks':
+        """Dict-like view mapping each key to the views of its slots"""
+        return StoredStateBlocks(self)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def keys(self) -> List[str]:
+        return list(self.index)
+
+    def bind(self, key: str, states: List[QuantumState]):
+        """Record ``states`` (views into this store) under ``key``"""
+        for state in states:
+            if state._array is not self:
+                raise ValueError("State is not a view into this QuantumStateStore")
+        self.index[key] = [state._index for state in states]
+
+    def put(self, key: str, states: List[QuantumState]) -> List[QuantumState]:
+        """Copy ``states`` into fresh slots under ``key`` and return their views"""
+        if key in self.index:
+            self.remove(key)
+        views = self.allocate(len(states))
+        for view, state in zip(views, states):
+            view.density_matrix = state.density_matrix
+        self.bind(key, views)
+        return views
+
+    def get(self, key: str) -> List[QuantumState]:
+        """Views of the slots stored under ``key`` (no data is read)"""
+        return [QuantumState.view(self, i) for i in self.index[key]]
+
+    def remove(self, key: str):
+        """Drop ``key`` and return its slots to the free list"""
+        self._free_slots.extend(self.index.pop(key))
+
+    def slot_indices(self) -> np.ndarray:
+        """Slots of every stored key, in key order"""
+        return np.array([i for slots in self.index.values() for i in slots], dtype=int)
+
+    def flush(self):
+        """Write dirty pages and the key index (atomically) to disk"""
+        self._buffer.flush()
+        metadata = {
+            'dimensions': self.dimensions,
+            'dtype': self.dtype.str,
+            'capacity': len(self._buffer),
+            'size': self._size,
+            'free_slots': self._free_slots,
+            'index': self.index
+        }
+        temporary = self._path(self.INDEX_FILE + '.tmp')
+        with open(temporary, 'w') as f:
+            json.dump(metadata, f)
+        os.replace(temporary, self._path(self.INDEX_FILE))
+
+
+class StoredStateBlocks(MutableMapping):
+    """
+    Key -> list-of-views mapping backed by a QuantumStateStore index.
+
+    Lets code written against ``Dict[str, List[QuantumState]]`` use a
+    store; views are created on access, so nothing is loaded up front.
+    """
+
+    def __init__(self, store: QuantumStateStore):
+        self.store = store
+
+    def __getitem__(self, key: str) -> List[QuantumState]:
+        if key not in self.store.index:
+            raise KeyError(key)
+        return self.store.get(key)
+
+    def __setitem__(self, key: str, states: List[QuantumState]):
+        self.store.bind(key, states)
+
+    def __delitem__(self, key: str):
+        if key not in self.store.index:
+            raise KeyError(key)
+        self.store.remove(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.index)
+
+    def __len__(self) -> int:
+        return len(self.store.index)
@@ -0,0 +1,296 @@
+"""
+Bit-Packed Surface-Code Lattice
+
+Compact representation of a distance-d rotated surface code for Pauli-frame
+simulation. Instead of one QuantumState per physical qubit, the lattice
+keeps X and Z error frames as (d, d, ⌈shots/8⌉) uint8 arrays, with one bit
+per Monte-Carlo shot, plus precomputed stabilizer index tables. Syndrome
+extraction is four shifted XORs over the padded frame followed by a
+gather, so a round over every shot costs a handful of vectorized array
+operations.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from decoders import Decoder, DecodingGraph, make_decoder
+from quantum_state import QuantumStateArray, resolve_rng
+from stabilizer import StabilizerCode
+
+
+NOISE_MODELS = ('depolarizing', 'bit_flip', 'phase_flip')
+
+# Entries of the create_surface_code dict built on first access
+_DENSE_KEYS = (
+    'data_qubits', 'syndrome_qubits_x', 'syndrome_qubits_z',
+    'data_array', 'syndrome_array_x', 'syndrome_array_z'
+)
+_KEYS = _DENSE_KEYS + (
+    'stabilizer_code', 'grid_size', 'logical_qubits', 'distance', 'threshold'
+)
+
+
+def _pack_shots(bits: np.ndarray) -> np.ndarray:
+    """Pack the trailing shot axis of a boolean array into uint8 bytes"""
+    return np.packbits(bits, axis=-1, bitorder='little')
+
+
+def _unpack_shots(packed: np.ndarray, shots: int) -> np.ndarray:
+    return np.unpackbits(packed, axis=-1, count=shots, bitorder='little')
+
+
+class SurfaceCodeLattice(Mapping):
+    """
+    Rotated surface code on a distance x distance grid of data qubits.
+
+    Face (i, j), i, j ∈ [-1, d-1], is the plaquette whose corners are data
+    qubits (i..i+1, j..j+1). Faces with i + j even are X checks, the rest
+    Z checks; weight-2 X checks close the top and bottom edges and weight-2
+    Z checks the left and right edges. Check order matches
+    ``StabilizerCode.rotated_surface``.
+
+    The lattice is also a read-only mapping with the keys of the dict
+    ``create_surface_code`` used to return; the per-qubit dense
+    QuantumState views are only allocated if those keys are read.
+    """
+
+    def __init__(self, distance: int, shots: int = 1, dtype=None):
+        if distance < 2:
+            raise ValueError("Surface code distance must be at least 2")
+        if shots < 1:
+            raise ValueError("Need at least one shot")
+        d = distance
+        self.distance = d
+        self.shots = shots
+        self.dtype = dtype
+
+        i, j = np.meshgrid(np.arange(-1, d), np.arange(-1, d), indexing='ij')
+        inside_i, inside_j = (i >= 0) & (i < d - 1), (j >= 0) & (j < d - 1)
+        is_x = (i + j) % 2 == 0
+        x_faces = is_x & inside_j & (inside_i | (i == -1) | (i == d - 1))
+        z_faces = ~is_x & inside_i & (inside_j | (j == -1) | (j == d - 1))
+        # Flat indices into the (d+1, d+1) face grid, row-major like the checks
+        self.z_faces = np.flatnonzero(z_faces).astype(np.int32)
+        self.x_faces = np.flatnonzero(x_faces).astype(np.int32)
+        self.z_checks = self._supports(self.z_faces)
+        self.x_checks = self._supports(self.x_faces)
+        # Checks touching each data qubit (-1 past a boundary): the decoding graph
+        self.qubit_z_checks = self._incidence(self.z_checks)
+        self.qubit_x_checks = self._incidence(self.x_checks)
+
+        bytes_per_site = -(-shots // 8)
+        self.x_frame = np.zeros((d, d, bytes_per_site), dtype=np.uint8)
+        self.z_frame = np.zeros((d, d, bytes_per_site), dtype=np.uint8)
+
+        self._stabilizer_code: Optional[StabilizerCode] = None
+        self._decoders: Dict[str, Tuple[Decoder, Decoder]] = {}
+        self._dense: Optional[Dict[str, Any]] = None
+
+    def _supports(self, faces: np.ndarray) -> np.ndarray:
+        """(checks, 4) data-qubit indices of each face, padded with -1"""
+        d = self.distance
+        i, j = faces // (d + 1) - 1, faces % (d + 1) - 1
+        rows = i[:, np.newaxis] + np.array([0, 0, 1, 1])
+        cols = j[:, np.newaxis] + np.array([0, 1, 0, 1])
+        valid = (rows >= 0) & (rows < d) & (cols >= 0) & (cols < d)
+        supports = np.where(valid, rows * d + cols, -1)
+        # Existing corners first, in corner order
+        order = np.argsort(~valid, axis=1, kind='stable')
+        return np.take_along_axis(supports, order, axis=1).astype(np.int32)
+
+    def _incidence(self, checks: np.ndarray) -> np.ndarray:
+        incidence = np.full((self.num_data, 2), -1, dtype=np.int32)
+        rows, positions = np.nonzero(checks >= 0)
+        qubits = checks[rows, positions]
+        order = np.argsort(qubits, kind='stable')
+        qubits, rows = qubits[order], rows[order]
+        # Second occurrence of a qubit goes to column 1
+        slot = np.r_[0, (qubits[1:] == qubits[:-1]).astype(np.int32)]
+        incidence[qubits, slot] = rows
+        return incidence
+
+    @property
+    def num_data(self) -> int:
+        return self.distance * self.distance
+
+    @property
+    def num_qubits(self) -> int:
+        """Data qubits plus one ancilla per check"""
+        return self.num_data + len(self.z_faces) + len(self.x_faces)
+
+    @property
+    def memory_bytes(self) -> int:
+        arrays = (
+            self.x_frame, self.z_frame, self.z_faces, self.x_faces,
+            self.z_checks, self.x_checks, self.qubit_z_checks, self.qubit_x_checks
+        )
+        return sum(array.nbytes for array in arrays)
+
+    @property
+    def stabilizer_code(self) -> StabilizerCode:
+        """The same code as a StabilizerCode, for circuit-level simulation"""
+        if self._stabilizer_code is None:
+            self._stabilizer_code = StabilizerCode.rotated_surface(self.distance)
+        return self._stabilizer_code
+
+    def reset(self):
+        """Clear both error frames"""
+        self.x_frame[:] = 0
+        self.z_frame[:] = 0
+
+    def _as_frame(self, errors: np.ndarray) -> np.ndarray:
+        """Pack a (num_data,) or (shots, num_data) boolean error pattern"""
+        errors = np.asarray(errors, dtype=bool)
+        if errors.ndim == 1:
+            errors = np.broadcast_to(errors, (self.shots, self.num_data))
+        if errors.shape != (self.shots, self.num_data):
+            raise ValueError(f"Expected errors of shape ({self.shots}, {self.num_data})")
+        sites = errors.T.reshape(self.distance, self.distance, self.shots)
+        return _pack_shots(sites)
+
+    def apply_errors(
+        self,
+        x_errors: Optional[np.ndarray] = None,
+        z_errors: Optional[np.ndarray] = None
+    ):
+        """XOR X and/or Z error patterns (per data qubit, optionally per shot) into the frames"""
+        if x_errors is not None:
+            self.x_frame ^= self._as_frame(x_errors)
+        if z_errors is not None:
+            self.z_frame ^= self._as_frame(z_errors)
+
+    def sample_errors(
+        self,
+        p: float,
+        noise: str = 'depolarizing',
+        rng: Optional[np.random.Generator] = None
+    ):
+        """
+        Apply independent Pauli noise with probability ``p`` to every data
+        qubit of every shot.
+
+        ``depolarizing`` picks X, Y or Z uniformly; ``bit_flip`` and
+        ``phase_flip`` apply X or Z only.
+        """
+        if noise not in NOISE_MODELS:
+            raise ValueError(f"Unknown noise model: {noise}")
+        if not 0 <= p <= 1:
+            raise ValueError("Error rates must lie in [0, 1]")
+        rng = resolve_rng(rng)
+        draws = rng.random((self.distance, self.distance, self.shots))
+        if noise == 'depolarizing':
+            # X for draws in [0, 2p/3), Z for [p/3, p): the overlap is Y
+            self.x_frame ^= _pack_shots(draws < 2 * p / 3)
+            self.z_frame ^= _pack_shots((draws >= p / 3) & (draws < p))
+        elif noise == 'bit_flip':
+            self.x_frame ^= _pack_shots(draws < p)
+        else:
+            self.z_frame ^= _pack_shots(draws < p)
+
+    def _face_parities(self, frame: np.ndarray) -> np.ndarray:
+        """Parity of every face of the (d+1, d+1) grid, flattened to (faces, bytes)"""
+        d = self.distance
+        padded = np.zeros((d + 2, d + 2, frame.shape[2]), dtype=np.uint8)
+        padded[1:-1, 1:-1] = frame
+        faces = padded[:-1, :-1] ^ padded[:-1, 1:] ^ padded[1:, :-1] ^ padded[1:, 1:]
+        return faces.reshape((d + 1) * (d + 1), -1)
+
+    def packed_syndrome(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(Z-check, X-check) syndromes as (checks, ⌈shots/8⌉) packed bytes"""
+        return (
+            self._face_parities(self.x_frame)[self.z_faces],
+            self._face_parities(self.z_frame)[self.x_faces]
+        )
+
+    def syndrome(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (Z-check, X-check) syndromes as (shots, checks) uint8 arrays.
+
+        Z checks flag X errors and X checks flag Z errors.
+        """
+        z_syndrome, x_syndrome = self.packed_syndrome()
+        return (
+            _unpack_shots(z_syndrome, self.shots).T,
+            _unpack_shots(x_syndrome, self.shots).T
+        )
+
+    def logical_flips(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per-shot (logical X, logical Z) flips of the current frames.
+
+        Meaningful once the frames have zero syndrome (e.g. after a decoder's
+        correction): X errors anticommuting with logical Z (first row) flip
+        the logical bit, Z errors anticommuting with logical X (first column)
+        flip its phase.
+        """
+        x_flip = np.bitwise_xor.reduce(self.x_frame[0], axis=0)
+        z_flip = np.bitwise_xor.reduce(self.z_frame[:, 0], axis=0)
+        return (
+            _unpack_shots(x_flip, self.shots).astype(bool),
+            _unpack_shots(z_flip, self.shots).astype(bool)
+        )
+
+    def decoders(self, decoder: str = 'union_find') -> Tuple[Decoder, Decoder]:
+        """(Z-check decoder giving X corrections, X-check decoder giving Z corrections)"""
+        if decoder not in self._decoders:
+            self._decoders[decoder] = (
+                make_decoder(decoder, DecodingGraph(self.qubit_z_checks, len(self.z_faces))),
+                make_decoder(decoder, DecodingGraph(self.qubit_x_checks, len(self.x_faces)))
+            )
+        return self._decoders[decoder]
+
+    def correct(self, decoder: str = 'union_find') -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decode every shot's syndrome, apply the corrections to the frames and
+        return the per-shot (logical X, logical Z) failures that remain.
+        """
+        z_syndrome, x_syndrome = self.syndrome()
+        z_decoder, x_decoder = self.decoders(decoder)
+        self.apply_errors(z_decoder.decode_batch(z_syndrome), x_decoder.decode_batch(x_syndrome))
+        return self.logical_flips()
+
+    def _dense_views(self) -> Dict[str, Any]:
+        """Per-qubit QuantumState views of the legacy create_surface_code layout"""
+        if self._dense is None:
+            g = self.distance
+            # Each qubit family lives in one batched buffer; the nested lists
+            # hold QuantumState views into it
+            data_array = QuantumStateArray(g * g, 2, dtype=self.dtype)
+            syndrome_array_x = QuantumStateArray(g * (g - 1), 2, dtype=self.dtype)
+            syndrome_array_z = QuantumStateArray((g - 1) * g, 2, dtype=self.dtype)
+            self._dense = {
+                'data_qubits': [[data_array[r * g + c] for c in range(g)] for r in range(g)],
+                'syndrome_qubits_x': [[syndrome_array_x[r * (g - 1) + c] for c in range(g - 1)]
+                                      for r in range(g)],
+                'syndrome_qubits_z': [[syndrome_array_z[r * g + c] for c in range(g)]
+                                      for r in range(g - 1)],
+                'data_array': data_array,
+                'syndrome_array_x': syndrome_array_x,
+                'syndrome_array_z': syndrome_array_z
+            }
+        return self._dense
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _DENSE_KEYS:
+            return self._dense_views()[key]
+        if key == 'stabilizer_code':
+            return self.stabilizer_code
+        if key in ('grid_size', 'distance'):
+            return self.distance
+        if key == 'logical_qubits':
+            return (self.distance - 1) // 2
+        if key == 'threshold':
+            # Nominal error threshold; threshold.ThresholdSweep measures it
+            return 0.01
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEYS)
+
+    def __len__(self) -> int:
+        return len(_KEYS)
+
+    def __repr__(self) -> str:
+        return f"SurfaceCodeLattice(distance={self.distance}, shots={self.shots})"
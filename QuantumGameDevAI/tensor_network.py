@@ -0,0 +1,216 @@
+"""
+Tensor-Network (Matrix Product State) Backend
+
+Represents n-party quantum states as a chain of rank-3 tensors instead of a
+dense 2^n amplitude vector. GHZ and other low-entanglement states need only
+bond dimension χ = 2, so memory is O(n·χ²) and multi-node entanglement can
+be simulated for hundreds of nodes.
+"""
+
+import numpy as np
+from typing import List, Optional, Sequence
+
+from quantum_state import resolve_rng
+
+
+class MatrixProductState:
+    """
+    Matrix product state |ψ⟩ = Σ A₁[s₁] A₂[s₂] ... Aₙ[sₙ] |s₁ s₂ ... sₙ⟩.
+
+    Each tensor has shape (χ_left, d, χ_right) with χ = 1 at both ends.
+    Two-site gates are applied by contraction followed by a truncated SVD
+    (at most ``max_bond`` singular values above ``cutoff`` are kept).
+    """
+
+    def __init__(
+        self,
+        tensors: List[np.ndarray],
+        max_bond: int = 64,
+        cutoff: float = 1e-12,
+        rng: Optional[np.random.Generator] = None
+    ):
+        if not tensors:
+            raise ValueError("MatrixProductState needs at least one site")
+        if tensors[0].shape[0] != 1 or tensors[-1].shape[2] != 1:
+            raise ValueError("Boundary bond dimensions must be 1")
+        self.tensors = [np.asarray(t, dtype=complex) for t in tensors]
+        self.max_bond = max_bond
+        self.cutoff = cutoff
+        self.rng = rng
+
+    @classmethod
+    def product_state(
+        cls,
+        basis_states: Sequence[int],
+        physical_dim: int = 2,
+        **kwargs
+    ) -> 'MatrixProductState':
+        """Computational basis product state |s₁ s₂ ... sₙ⟩"""
+        tensors = []
+        for s in basis_states:
+            tensor = np.zeros((1, physical_dim, 1), dtype=complex)
+            tensor[0, s, 0] = 1.0
+            tensors.append(tensor)
+        return cls(tensors, **kwargs)
+
+    @classmethod
+    def ghz(cls, n_sites: int, **kwargs) -> 'MatrixProductState':
+        """GHZ state (|00...0⟩ + |11...1⟩)/√2 with bond dimension 2"""
+        if n_sites < 1:
+            raise ValueError("GHZ state needs at least one site")
+        if n_sites == 1:
+            return cls([np.full((1, 2, 1), 1 / np.sqrt(2), dtype=complex)], **kwargs)
+
+        # Each bond carries the shared bit: A[s] = |s⟩⟨s| in the bulk
+        first = np.zeros((1, 2, 2), dtype=complex)
+        first[0, 0, 0] = first[0, 1, 1] = 1 / np.sqrt(2)
+        bulk = np.zeros((2, 2, 2), dtype=complex)
+        bulk[0, 0, 0] = bulk[1, 1, 1] = 1.0
+        last = np.zeros((2, 2, 1), dtype=complex)
+        last[0, 0, 0] = last[1, 1, 0] = 1.0
+
+        tensors = [first] + [bulk.copy() for _ in range(n_sites - 2)] + [last]
+        return cls(tensors, **kwargs)
+
+    @property
+    def num_sites(self) -> int:
+        return len(self.tensors)
+
+    @property
+    def bond_dimensions(self) -> List[int]:
+        return [t.shape[2] for t in self.tensors[:-1]]
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(t.nbytes for t in self.tensors)
+
+    def copy(self) -> 'MatrixProductState':
+        return MatrixProductState(
+            [t.copy() for t in self.tensors],
+            max_bond=self.max_bond,
+            cutoff=self.cutoff,
+            rng=self.rng
+        )
+
+    def apply_gate(self, gate: np.ndarray, site: int):
+        """Apply a single-site gate in O(χ²·d²)"""
+        self.tensors[site] = np.einsum('ps,lsr->lpr', gate, self.tensors[site])
+
+    def apply_two_site_gate(self, gate: np.ndarray, site: int):
+        """
+        Apply a gate acting on sites (site, site + 1).
+
+        ``gate`` is a (d², d²) matrix in the |s_site s_site+1⟩ basis. The
+        bond between the two sites is re-split by a truncated SVD.
+        """
+        left, right = self.tensors[site], self.tensors[site + 1]
+        chi_l, d, _ = left.shape
+        chi_r = right.shape[2]
+
+        theta = np.einsum('asb,btc->astc', left, right)
+        theta = np.einsum('stuv,auvc->astc', gate.reshape(d, d, d, d), theta)
+
+        u, singular, vh = np.linalg.svd(
+            theta.reshape(chi_l * d, d * chi_r),
+            full_matrices=False
+        )
+        keep = max(1, min(self.max_bond, int(np.sum(singular > self.cutoff * singular[0]))))
+        u, singular, vh = u[:, :keep], singular[:keep], vh[:keep]
+
+        self.tensors[site] = u.reshape(chi_l, d, keep)
+        self.tensors[site + 1] = (singular[:, np.newaxis] * vh).reshape(keep, d, chi_r)
+
+    def _right_environments(self) -> List[np.ndarray]:
+        """R[i] contracts sites i..n-1 with their conjugates (R[n] = [[1]])"""
+        environments = [None] * (self.num_sites + 1)
+        environment = np.ones((1, 1), dtype=complex)
+        environments[self.num_sites] = environment
+        for i in range(self.num_sites - 1, -1, -1):
+            tensor = self.tensors[i]
+            environment = np.einsum('asb,bc,dsc->ad', tensor, environment, tensor.conj())
+            # Rescale to keep long chains away from under/overflow
+            environment = environment / np.trace(environment)
+            environments[i] = environment
+        return environments
+
+    def norm(self) -> float:
+        """⟨ψ|ψ⟩^½"""
+        environment = np.ones((1, 1), dtype=complex)
+        log_norm = 0.0
+        for tensor in self.tensors:
+            environment = np.einsum('ad,asb,dsc->bc', environment, tensor, tensor.conj())
+            scale = np.real(np.trace(environment))
+            environment = environment / scale
+            log_norm += np.log(scale)
+        return float(np.exp(0.5 * log_norm))
+
+    def reduced_density_matrices(self) -> np.ndarray:
+        """Single-site reduced density matrices ρᵢ for every site, shape (n, d, d)"""
+        right = self._right_environments()
+        d = self.tensors[0].shape[1]
+        reduced = np.empty((self.num_sites, d, d), dtype=complex)
+
+        left = np.ones((1, 1), dtype=complex)
+        for i, tensor in enumerate(self.tensors):
+            rho = np.einsum('ad,asb,bc,dtc->st', left, tensor, right[i + 1], tensor.conj())
+            reduced[i] = rho / np.trace(rho)
+            left = np.einsum('ad,asb,dsc->bc', left, tensor, tensor.conj())
+            left = left / np.trace(left)
+        return reduced
+
+    def marginal_probabilities(self) -> np.ndarray:
+        """Computational-basis marginals P(sᵢ) for every site, shape (n, d)"""
+        return np.real(np.diagonal(self.reduced_density_matrices(), axis1=1, axis2=2))
+
+    def sample(
+        self,
+        shots: int = 1,
+        rng: Optional[np.random.Generator] = None
+    ) -> np.ndarray:
+        """
+        Draw joint computational-basis samples without collapsing the state.
+
+        Sites are sampled left to right from their conditional distributions;
+        all shots advance together, so the cost is O(n·shots·χ²·d).
+        """
+        rng = resolve_rng(rng, self.rng)
+        right = self._right_environments()
+        samples = np.empty((shots, self.num_sites), dtype=int)
+        shot_index = np.arange(shots)
+
+        left_vectors = np.ones((shots, 1), dtype=complex)
+        for i, tensor in enumerate(self.tensors):
+            # Candidate left vectors for every outcome: (d, shots, χ_right)
+            candidates = np.einsum('ka,asb->skb', left_vectors, tensor)
+            weights = np.real(np.einsum('skb,bc,skc->sk', candidates, right[i + 1], candidates.conj()))
+            weights = np.clip(weights, 0.0, None)
+            cumulative = np.cumsum(weights, axis=0)
+            cumulative /= cumulative[-1]
+            outcomes = np.argmax(cumulative > rng.random(shots), axis=0)
+
+            samples[:, i] = outcomes
+            chosen = candidates[outcomes, shot_index]
+            left_vectors = chosen / np.linalg.norm(chosen, axis=1, keepdims=True)
+        return samples
+
+    def measure(self, site: int, rng: Optional[np.random.Generator] = None) -> int:
+        """Measure one site in the computational basis, collapsing the joint state"""
+        rng = resolve_rng(rng, self.rng)
+        probabilities = np.real(np.diag(self.reduced_density_matrices()[site]))
+        probabilities = np.clip(probabilities, 0.0, None)
+        probabilities = probabilities / np.sum(probabilities)
+        outcome = int(rng.choice(len(probabilities), p=probabilities))
+
+        # Project onto |outcome⟩ at this site and renormalize
+        projected = np.zeros_like(self.tensors[site])
+        projected[:, outcome, :] = self.tensors[site][:, outcome, :]
+        self.tensors[site] = projected / np.sqrt(probabilities[outcome])
+        return outcome
+
+    def to_state_vector(self) -> np.ndarray:
+        """Dense amplitude vector (only feasible for small n)"""
+        vector = self.tensors[0]
+        for tensor in self.tensors[1:]:
+            vector = np.einsum('asb,btc->astc', vector, tensor)
+            vector = vector.reshape(1, -1, tensor.shape[2])
+        return vector.reshape(-1)
@@ -0,0 +1,37 @@
+import numpy as np
+
+from quantum_state import EntangledPair
+from quantum_protocols import EntanglementSwapping
+
+
+def test_particle_from_pair_can_be_measured():
+    pair = EntangledPair(rng=np.random.default_rng(0))
+    particle = pair.particle_a
+
+    assert particle.measure() in (0, 1)
+    # The measured copy is detached: the pair's joint state is untouched
+    assert pair.shares_bell_constant
+    np.testing.assert_allclose(pair.particle_a.density_matrix, np.eye(2) / 2)
+
+
+def test_particles_follow_the_joint_state():
+    pair = EntangledPair(rng=np.random.default_rng(1))
+    outcome = pair.measure_particle_a()
+
+    expected = np.zeros((2, 2))
+    expected[outcome, outcome] = 1.0
+    np.testing.assert_allclose(pair.particle_a.density_matrix, expected, atol=1e-12)
+    np.testing.assert_allclose(pair.particle_b.density_matrix, expected, atol=1e-12)
+    assert pair.particle_b.entangled_with.tolist() == [pair.particle_a.id]
+
+
+def test_swapped_particles_can_be_measured():
+    rng = np.random.default_rng(2)
+    particle_a, particle_c = EntanglementSwapping.swap(
+        EntangledPair(rng=rng), EntangledPair(rng=rng), rng=rng
+    )
+
+    assert particle_a.entangled_with.tolist() == [particle_c.id]
+    particle_a.apply_unitary(np.array([[0, 1], [1, 0]]))
+    assert particle_a.measure() in (0, 1)
+    assert particle_c.measure() in (0, 1)
@@ -0,0 +1,24 @@
+import asyncio
+
+import pytest
+
+from distributed_network import QuantumNetwork
+
+
+def test_superdense_sends_leave_nothing_in_flight():
+    async def scenario():
+        async with QuantumNetwork(seed=0) as network:
+            await network.add_node('alice')
+            await network.add_node('bob', position=(1, 0, 0))
+            for bits in ('00', '01', '10', '11'):
+                assert await network.send_quantum_message(
+                    'alice', 'bob', {'bits': bits}, use_superdense=True
+                )
+            with pytest.raises(ValueError):
+                network.nodes['alice'].local_database.send_superdense_message('012', peer='bob')
+        # Leaving the context stopped every refill task on the live loop
+        return network.entanglement_pool_metrics()
+
+    for metrics in asyncio.run(scenario()).values():
+        assert metrics['in_flight'] == 0
+        assert not metrics['refill_running']
@@ -0,0 +1,49 @@
+import numpy as np
+
+from quantum_state import QuantumState
+from quantum_protocols import FaultTolerantQuantumDatabase
+
+
+def _store_states(database):
+    one = QuantumState(2)
+    one.set_state_vector([0, 1])
+    plus = QuantumState(2)
+    plus.set_state_vector([1, 1])
+    database.store_protected_data('one', one)
+    database.store_protected_data('plus', plus)
+    return {'one': one.density_matrix, 'plus': plus.density_matrix}
+
+
+def test_reopened_database_reads_the_same_states(tmp_path):
+    database = FaultTolerantQuantumDatabase(storage_path=str(tmp_path))
+    expected = _store_states(database)
+    np.testing.assert_allclose(database.retrieve_protected_data('one').density_matrix, expected['one'])
+    rng = np.random.default_rng(7)
+    for _ in range(20):
+        database.apply_noise('depolarizing', 0.1, rng=rng)
+    before = database.retrieve_many(['one', 'plus'])
+    database.flush()
+
+    reopened = FaultTolerantQuantumDatabase(storage_path=str(tmp_path))
+    after = reopened.retrieve_many(['one', 'plus'])
+
+    assert set(reopened.error_corrected_data) == set(expected)
+    np.testing.assert_array_equal(
+        reopened._error_frames_for_slots()[reopened.protected_qubit_indices()],
+        database._error_frames_for_slots()[database.protected_qubit_indices()]
+    )
+    for state_before, state_after in zip(before, after):
+        np.testing.assert_allclose(state_after.density_matrix, state_before.density_matrix)
+        assert not np.allclose(state_after.density_matrix, np.eye(2) / 2)
+
+
+def test_single_qubit_errors_are_corrected():
+    database = FaultTolerantQuantumDatabase()
+    expected = _store_states(database)
+    frames = database._error_frames_for_slots()
+    frames[database.protected_qubit_indices('one')[4], 0] = True
+    frames[database.protected_qubit_indices('plus')[8], 1] = True
+    database.clear_decoded_cache()
+
+    for key, state in zip(expected, database.retrieve_many(list(expected))):
+        np.testing.assert_allclose(state.density_matrix, expected[key], atol=1e-12)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from quantum_state import BELL_STATES
+from quantum_protocols import SuperdenseCoding
+
+PAYLOAD = bytes(range(256)) + b'superdense'
+
+
+@pytest.mark.parametrize('state_type', sorted(BELL_STATES))
+@pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
+def test_bulk_round_trip(state_type, dtype):
+    batch = SuperdenseCoding.encode_bytes(PAYLOAD, state_type, dtype=dtype)
+
+    assert batch.num_pairs == 4 * len(PAYLOAD)
+    assert SuperdenseCoding.decode_bytes(batch) == PAYLOAD
+
+
+def test_batch_states_match_per_pair_encoding():
+    batch = SuperdenseCoding.encode_bytes(b'\x1b')  # codes 00 01 10 11
+    bits = ['00', '01', '10', '11']
+
+    for index, pair_bits in enumerate(bits):
+        pair = SuperdenseCoding.encode_bytes(b'\x00').pair(0)
+        SuperdenseCoding.encode(pair_bits, pair)
+        np.testing.assert_allclose(batch.joint_states(index, index + 1)[0], pair.joint_state, atol=1e-12)
+        assert SuperdenseCoding.decode(None, batch.pair(index)) == pair_bits
+    assert batch.pauli_indices.tolist() == [0, 1, 2, 3]
+
+
+def test_corrupted_pair_changes_its_byte():
+    batch = SuperdenseCoding.encode_bytes(PAYLOAD)
+    batch.apply_unitary(np.kron(SuperdenseCoding.PAULI_X, np.eye(2)), [5])
+
+    decoded = SuperdenseCoding.decode_bytes(batch, rng=np.random.default_rng(0))
+    assert decoded[1] == PAYLOAD[1] ^ (1 << 4)
+    assert decoded[:1] + decoded[2:] == PAYLOAD[:1] + PAYLOAD[2:]
+    assert not batch.overrides
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Monte-Carlo Threshold Estimation for the Surface Code
+
+Sweeps code distance × physical error rate, sampling code-capacity noise on
+a bit-packed SurfaceCodeLattice and decoding every shot. Each point is split
+into fixed-size batches that run as independent tasks on a
+ProcessPoolExecutor, so a sweep scales with the number of local cores.
+
+Every batch draws from its own SeedSequence keyed by (distance, error rate,
+batch), which keeps streams independent across workers and makes a result
+independent of scheduling. Finished batches are appended to a CSV as they
+arrive; rerunning the same sweep skips the batches already in the file, so
+an interrupted sweep resumes where it stopped.
+
+Usage:
+  python threshold.py --distances 3 5 7 --error-rates 0.05 0.08 0.1 0.12 --shots 20000
+"""
+
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from decoders import DECODERS
+from surface_code import NOISE_MODELS, SurfaceCodeLattice
+
+
+CSV_FIELDS = (
+    'distance', 'error_rate', 'batch', 'shots',
+    'logical_x', 'logical_z', 'logical_failures', 'seconds'
+)
+
+# Lattices (and their cached decoding graphs) reused by a worker process
+_LATTICES: Dict[Tuple[int, int], SurfaceCodeLattice] = {}
+
+
+def run_batch(
+    distance: int,
+    error_rate: float,
+    shots: int,
+    entropy: int,
+    spawn_key: Tuple[int, ...],
+    noise: str = 'depolarizing',
+    decoder: str = 'union_find'
+) -> Dict[str, Any]:
+    """Sample, decode and count logical failures for one batch of shots"""
+    start = time.perf_counter()
+    lattice = _LATTICES.get((distance, shots))
+    if lattice is None:
+        lattice = _LATTICES[(distance, shots)] = SurfaceCodeLattice(distance, shots)
+    lattice.reset()
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=spawn_key))
+    lattice.sample_errors(error_rate, noise=noise, rng=rng)
+    x_flip, z_flip = lattice.correct(decoder)
+    return {
+        'distance': distance,
+        'error_rate': error_rate,
+        'batch': spawn_key[-1],
+        'shots': shots,
+        'logical_x': int(np.count_nonzero(x_flip)),
+        'logical_z': int(np.count_nonzero(z_flip)),
+        'logical_failures': int(np.count_nonzero(x_flip | z_flip)),
+        'seconds': time.perf_counter() - start
+    }
+
+
+class ThresholdSweep:
+    """
+    Distance × error-rate Monte-Carlo sweep of surface-code logical errors.
+
+    ``shots`` per point are split into batches of ``batch_shots``. With an
+    ``output`` CSV, rows are written as batches finish and batches already
+    present are skipped, so ``seed`` must stay the same for a resumed sweep
+    to reproduce the streams it would have drawn.
+    """
+
+    def __init__(
+        self,
+        distances: List[int],
+        error_rates: List[float],
+        shots: int = 10_000,
+        batch_shots: int = 2_000,
+        seed: Optional[int] = None,
+        output: Optional[str] = None,
+        noise: str = 'depolarizing',
+        decoder: str = 'union_find'
+    ):
+        if noise not in NOISE_MODELS:
+            raise ValueError(f"Unknown noise model: {noise}")
+        if decoder not in DECODERS:
+            raise ValueError(f"Unknown decoder: {decoder}")
+        if shots < 1 or batch_shots < 1:
+            raise ValueError("Need at least one shot per point and per batch")
+        self.distances = sorted(set(distances))
+        self.error_rates = sorted(set(error_rates))
+        self.shots = shots
+        self.batch_shots = batch_shots
+        # An unseeded sweep still records its entropy for reproducibility
+        self.seed = seed if seed is not None else np.random.SeedSequence().entropy
+        self.output = output
+        self.noise = noise
+        self.decoder = decoder
+        self.rows: List[Dict[str, Any]] = []
+
+    def batches(self) -> List[Tuple[int, float, int, int]]:
+        """Every (distance, error rate, batch index, shots) task of the sweep"""
+        tasks = []
+        full, remainder = divmod(self.shots, self.batch_shots)
+        sizes = [self.batch_shots] * full + ([remainder] if remainder else [])
+        for distance in self.distances:
+            for error_rate in self.error_rates:
+                for batch, shots in enumerate(sizes):
+                    tasks.append((distance, error_rate, batch, shots))
+        return tasks
+
+    def _load_existing(self) -> List[Dict[str, Any]]:
+        """Rows already written to the output CSV by an earlier run"""
+        if self.output is None or not os.path.exists(self.output):
+            return []
+        with open(self.output, newline='') as f:
+            rows = []
+            for row in csv.DictReader(f):
+                rows.append({
+                    field: float(row[field]) if field in ('error_rate', 'seconds') else int(row[field])
+                    for field in CSV_FIELDS
+                })
+            return rows
+
+    def run(self, workers: Optional[int] = None, progress: bool = False) -> Dict[str, Any]:
+        """
+        Run every pending batch on ``workers`` processes (default: all cores)
+        and return ``summary()``. ``workers=0`` runs in this process.
+        """
+        self.rows = [
+            row for row in self._load_existing()
+            if row['distance'] in self.distances and row['error_rate'] in self.error_rates
+        ]
+        done = {(row['distance'], row['error_rate'], row['batch']) for row in self.rows}
+        pending = [task for task in self.batches() if task[:3] not in done]
+
+        writer, handle = None, None
+        if self.output is not None:
+            new_file = not os.path.exists(self.output) or os.path.getsize(self.output) == 0
+            handle = open(self.output, 'a', newline='')
+            writer = csv.DictWriter(handle, fieldnames=CSV_FIELDS)
+            if new_file:
+                writer.writeheader()
+
+        def record(row: Dict[str, Any]):
+            self.rows.append(row)
+            if writer is not None:
+                writer.writerow(row)
+                # Flushed per batch: an interrupted sweep keeps every finished row
+                handle.flush()
+            if progress:
+                print(f"d={row['distance']:<3} p={row['error_rate']:<8g} batch {row['batch']:<4} "
+                      f"{row['logical_failures']}/{row['shots']} failures ({row['seconds']:.1f}s)")
+
+        try:
+            if workers == 0:
+                for task in pending:
+                    record(run_batch(*self._batch_args(task)))
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(run_batch, *self._batch_args(task)) for task in pending]
+                    for future in as_completed(futures):
+                        record(future.result())
+        finally:
+            if handle is not None:
+                handle.close()
+        return self.summary()
+
+    def _batch_args(self, task: Tuple[int, float, int, int]) -> tuple:
+        """run_batch arguments for a task (plain values: cheap to send to a worker)"""
+        distance, error_rate, batch, shots = task
+        # Keyed by value, not position: a resumed sweep may add points
+        key = (distance, int(np.float64(error_rate).view(np.uint64)), batch)
+        return distance, error_rate, shots, self.seed, key, self.noise, self.decoder
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Totals per point as (distances, error rates) arrays: shots, logical
+        failures, logical error rate and its binomial standard error.
+        """
+        shape = (len(self.distances), len(self.error_rates))
+        shots = np.zeros(shape, dtype=np.int64)
+        failures = np.zeros(shape, dtype=np.int64)
+        for row in self.rows:
+            i = self.distances.index(row['distance'])
+            j = self.error_rates.index(row['error_rate'])
+            shots[i, j] += row['shots']
+            failures[i, j] += row['logical_failures']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rate = np.where(shots > 0, failures / shots, np.nan)
+            stderr = np.sqrt(rate * (1 - rate) / shots)
+        return {
+            'distances': np.array(self.distances),
+            'error_rates': np.array(self.error_rates),
+            'shots': shots,
+            'failures': failures,
+            'logical_error_rate': rate,
+            'standard_error': stderr,
+            'threshold': estimate_threshold(self.distances, self.error_rates, rate)
+        }
+
+    def save_npz(self, path: str):
+        """Write ``summary()`` arrays to a compressed .npz file"""
+        summary = self.summary()
+        threshold = summary.pop('threshold')
+        np.savez_compressed(path, threshold=np.nan if threshold is None else threshold, **summary)
+
+
+def estimate_threshold(
+    distances: List[int],
+    error_rates: List[float],
+    logical_error_rate: np.ndarray
+) -> Optional[float]:
+    """
+    Physical error rate where logical error curves of successive distances
+    cross (below it a larger code does better), averaged over distance
+    pairs. Crossings are interpolated linearly in log-log space; returns
+    None when no pair of curves crosses inside the sweep.
+    """
+    crossings = []
+    p = np.log(np.asarray(error_rates, dtype=float))
+    for small, large in zip(logical_error_rate[:-1], logical_error_rate[1:]):
+        valid = (small > 0) & (large > 0)
+        difference = np.full(len(p), np.nan)
+        difference[valid] = np.log(large[valid]) - np.log(small[valid])
+        for k in range(len(p) - 1):
+            a, b = difference[k], difference[k + 1]
+            if np.isfinite(a) and np.isfinite(b) and a < 0 <= b:
+                crossings.append(np.exp(p[k] + (p[k + 1] - p[k]) * a / (a - b)))
+                break
+    if not crossings:
+        return None
+    return float(np.mean(crossings))
+
+
+def print_sweep_report(summary: Dict[str, Any]):
+    """Print logical error rates per distance and error rate"""
+    print(f"\n{'=' * 78}")
+    print("SURFACE-CODE THRESHOLD SWEEP")
+    print(f"{'=' * 78}")
+    print(f"{'d':<4} " + " ".join(f"{p:>11g}" for p in summary['error_rates']))
+    print("-" * 78)
+    for i, distance in enumerate(summary['distances']):
+        print(f"{distance:<4} " + " ".join(
+            f"{rate:>11.2e}" for rate in summary['logical_error_rate'][i]
+        ))
+    threshold = summary['threshold']
+    print("-" * 78)
+    print(f"Estimated threshold: {'not crossed in sweep' if threshold is None else f'{threshold:.4f}'}")
+    print(f"{'=' * 78}\n")
+
+
+def main():
+    """Run a threshold sweep from the command line"""
+    parser = argparse.ArgumentParser(description="Surface-code Monte-Carlo threshold sweep")
+    parser.add_argument('--distances', type=int, nargs='+', default=[3, 5, 7])
+    parser.add_argument('--error-rates', type=float, nargs='+',
+                        default=[0.06, 0.08, 0.1, 0.12, 0.14])
+    parser.add_argument('--shots', type=int, default=10_000, help="Shots per point")
+    parser.add_argument('--batch-shots', type=int, default=2_000, help="Shots per task")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--noise', choices=NOISE_MODELS, default='depolarizing')
+    parser.add_argument('--decoder', choices=list(DECODERS), default='union_find')
+    parser.add_argument('--workers', type=int, default=None, help="Processes (default: all cores)")
+    parser.add_argument('--output', default='threshold_sweep.csv',
+                        help="CSV of finished batches; an existing file is resumed")
+    parser.add_argument('--npz', default=None, help="Also write the summary arrays here")
+    args = parser.parse_args()
+
+    sweep = ThresholdSweep(
+        args.distances, args.error_rates, shots=args.shots, batch_shots=args.batch_shots,
+        seed=args.seed, output=args.output, noise=args.noise, decoder=args.decoder
+    )
+    summary = sweep.run(workers=args.workers, progress=True)
+    if args.npz:
+        sweep.save_npz(args.npz)
+    print_sweep_report(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,10 @@ entanglement patterns, and consciousness emergence.
 """
 
 import json
+import numpy as np
 from typing import Dict, Any, List
 from datetime import datetime
+from quantum_state import QuantumState, entropy_many
 
 
 class QuantumNetworkVisualizer:
@@ -228,6 +230,23 @@ class QuantumMetricsAnalyzer:
 
         return min(consciousness_prob, 1.0)
 
+    @staticmethod
+    def analyze_state_entropies(states: List[QuantumState]) -> Dict[str, Any]:
+        """Entropy statistics over many states, decomposed in one batch"""
+
+        if not states:
+            return {'error': 'No quantum states'}
+
+        entropies = entropy_many(states)
+
+        return {
+            'mean_entropy': float(np.mean(entropies)),
+            'max_entropy': float(np.max(entropies)),
+            'min_entropy': float(np.min(entropies)),
+            'pure_states': int(np.sum(entropies < 1e-9)),
+            'total_states': len(states)
+        }
+
     @staticmethod
     def identify_network_hubs(topology: Dict[str, Any]) -> List[str]:
         """Identify highly connected nodes (hubs) in the network"""